@@ -1,13 +1,20 @@
+import argparse
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
 # 프로젝트 루트를 path에 추가
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from config.db_config import DB_CONFIG, OUTPUT_DIR
+from generator.csv_writer import table_paths, is_binary_path, path_compression, open_output_file
+from generator.copy_sink import copy_sql
+from generator.manifest import load_manifest, expected_rows, check_file_sizes
 
 # SQL 파일 경로
 SQL_DIR = os.path.join(PROJECT_ROOT, 'sql')
@@ -34,8 +41,36 @@ CSV_TABLE_MAPPING = [
     ("blocked_service_sub.csv", "blocked_service_sub"),
     ("present_data.csv", "present_data"),
     ("notification.csv", "notification"),
+    ("data_usage.csv", "data_usage"),
 ]
 
+# 병렬 적재 시 큰 CSV를 나누는 기본 청크 크기 (MB)
+DEFAULT_CHUNK_SIZE_MB = 64
+
+# 테이블별 선행 적재 테이블 (02_create_tables.sql의 FK 기준)
+# 병렬 적재 시 선행 테이블이 모두 커밋된 뒤에 COPY를 시작한다.
+TABLE_DEPENDENCIES = {
+    "member": [],
+    "social_account": ["member"],
+    "subscription": ["member"],
+    "subscription_key": [],
+    "family": [],
+    "family_sub": ["subscription", "family"],
+    "family_apply": ["subscription"],
+    "family_apply_target": ["family_apply", "subscription"],
+    "notification_allow": ["subscription"],
+    "block_policy": [],
+    "policy_sub": ["subscription", "block_policy"],
+    "blocked_service_sub": ["subscription"],
+    "present_data": ["subscription"],
+    "notification": ["subscription"],
+    "data_usage": ["subscription"],
+}
+
+# append 적재 스테이징 테이블 접두어 (UNLOGGED, 본 테이블과 같은 컬럼)
+# 청크/테이블 단위 커밋은 스테이징에만 하고, 모든 테이블이 성공하면 한 트랜잭션으로 본 테이블에 반영한다
+STAGING_PREFIX = "_append_"
+
 TABLE_PK_MAP = {
     "plan": "plan_id",
     "app_blocked_service": "app_blocked_service_id",
@@ -51,6 +86,7 @@ TABLE_PK_MAP = {
     "blocked_service_sub": "blocked_service_sub_id",
     "present_data": "present_data_id",
     "notification": "notification_id",
+    "data_usage": "data_usage_id",
     "family_apply": "family_apply_id",
     "family_apply_target": "family_apply_target_id",
     "family_remove_schedule": "family_remove_schedule_id",
@@ -64,15 +100,19 @@ def load_sql(filename):
         return f.read()
 
 
+def get_connection_params():
+    return {
+        'host': DB_CONFIG['host'],
+        'port': DB_CONFIG['port'],
+        'database': DB_CONFIG['database'],
+        'user': DB_CONFIG['user'],
+        'password': DB_CONFIG['password'],
+    }
+
+
 def get_connection():
     """DB 연결 생성"""
-    return psycopg2.connect(
-        host=DB_CONFIG['host'],
-        port=DB_CONFIG['port'],
-        database=DB_CONFIG['database'],
-        user=DB_CONFIG['user'],
-        password=DB_CONFIG['password']
-    )
+    return psycopg2.connect(**get_connection_params())
 
 
 def init_tables(conn):
@@ -89,52 +129,314 @@ def init_tables(conn):
     print("테이블 초기화 완료!\n")
 
 
-def load_csv(conn, csv_file, table_name):
-    """CSV 파일을 테이블에 COPY"""
-    csv_path = os.path.join(OUTPUT_DIR, csv_file)
+def staging_table(table_name):
+    return f"{STAGING_PREFIX}{table_name}"
+
+
+def create_staging_tables(conn):
+    """append 적재용 스테이징 테이블 생성 (이전 실패로 남은 스테이징은 새로 만든다)"""
+    with conn.cursor() as cur:
+        for _, table_name in CSV_TABLE_MAPPING:
+            cur.execute(f'DROP TABLE IF EXISTS "{staging_table(table_name)}"')
+            cur.execute(f'CREATE UNLOGGED TABLE "{staging_table(table_name)}" (LIKE "{table_name}")')
+    conn.commit()
+
+
+def publish_staging_tables(conn):
+    """
+    스테이징 적재분을 FK 순서(CSV_TABLE_MAPPING)대로 본 테이블에 INSERT, 한 트랜잭션으로 커밋
+    - 실패하면 전체 롤백: 본 테이블에는 이번 적재분이 한 행도 남지 않는다
+    """
+    print("스테이징 적재분 반영 중...")
+    try:
+        with conn.cursor() as cur:
+            for _, table_name in CSV_TABLE_MAPPING:
+                cur.execute(f'INSERT INTO "{table_name}" SELECT * FROM "{staging_table(table_name)}"')
+                print(f"  - {table_name}: {cur.rowcount:,} rows")
+                cur.execute(f'DROP TABLE "{staging_table(table_name)}"')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    print("스테이징 적재분 반영 완료!\n")
+
+
+def drop_staging_tables(conn):
+    """적재 실패 시 스테이징 테이블 정리 (본 테이블은 건드리지 않음)"""
+    conn.rollback()
+    with conn.cursor() as cur:
+        for _, table_name in CSV_TABLE_MAPPING:
+            cur.execute(f'DROP TABLE IF EXISTS "{staging_table(table_name)}"')
+    conn.commit()
+
+
+def check_row_count(label, copied, expected):
+    """COPY가 보고한 행 수(cursor.rowcount)를 manifest 기록과 대조 (manifest 없으면 생략)"""
+    if expected is not None and copied != expected:
+        raise RuntimeError(f"적재 건수 불일치: {label} (COPY {copied:,} / manifest {expected:,})")
+
 
-    if not os.path.exists(csv_path):
+def load_csv(conn, csv_file, table_name, manifest=None):
+    """
+    CSV 파일(샤드 part 파일, binary COPY .bin 파일, .gz / .zst 압축 파일 포함)을 테이블에 COPY
+    - 압축 파일은 스트리밍 해제해 바로 COPY (임시 파일 없음)
+    - 적재 행 수는 COUNT(*) 대신 COPY 결과(cursor.rowcount)로 집계
+    - manifest가 있으면 파일별로 생성기 기록 행 수와 대조
+    - 파일이 없으면 None (적재 생략)
+    """
+    paths = table_paths(os.path.splitext(csv_file)[0])
+
+    if not paths:
         print(f"  [SKIP] {csv_file} 파일이 없습니다.")
-        return 0
+        return None
+
+    check_file_sizes(manifest, paths)
 
+    count = 0
     with conn.cursor() as cur:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            copy_sql = f'COPY "{table_name}" FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
-            cur.copy_expert(copy_sql, f)
+        for path in paths:
+            with open_output_file(path) as f:
+                cur.copy_expert(copy_sql(table_name, is_binary_path(path)), f)
 
-        # 삽입된 행 수 확인
-        cur.execute(f'SELECT COUNT(*) FROM "{table_name}"')
-        count = cur.fetchone()[0]
+            check_row_count(os.path.basename(path), cur.rowcount, expected_rows(manifest, [path]))
+            count += cur.rowcount
 
     return count
 
 
-def load_all_csv(conn):
-    """모든 CSV 파일 로드"""
+class FileSlice:
+    """copy_expert용 file-like: 파일의 [start, end) 바이트 구간만 읽는다"""
+
+    def __init__(self, f, start, end):
+        f.seek(start)
+        self._f = f
+        self._remaining = end - start
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b""
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def plan_copy_chunks(paths, chunk_bytes):
+    """
+    파일들을 chunk_bytes 내외의 (path, start, end) 구간으로 분할
+    - 경계는 줄바꿈 기준으로 맞춘다 (생성기 CSV는 필드 안에 줄바꿈이 없음)
+    - 샤드 part 파일은 각각 최소 1개 청크가 된다
+    - binary COPY 파일은 헤더/트레일러가 있어, 압축 파일은 바이트 구간으로 나눌 수 없어 파일 하나를 청크 하나로 둔다
+    """
+    chunks = []
+    for path in paths:
+        size = os.path.getsize(path)
+        if is_binary_path(path) or path_compression(path) != "none":
+            chunks.append((path, 0, size))
+            continue
+        start = 0
+        with open(path, 'rb') as f:
+            while start < size:
+                end = start + chunk_bytes
+                if end >= size:
+                    end = size
+                else:
+                    f.seek(end)
+                    f.readline()
+                    end = f.tell()
+                chunks.append((path, start, end))
+                start = end
+    return chunks
+
+
+def copy_chunk(conn, table_name, chunk):
+    """청크 하나 COPY, 적재 행 수 반환"""
+    path, start, end = chunk
+    with conn.cursor() as cur:
+        if path_compression(path) != "none":
+            # 압축 파일은 파일 전체가 한 청크 (스트리밍 해제)
+            with open_output_file(path) as f:
+                cur.copy_expert(copy_sql(table_name, is_binary_path(path)), f)
+        else:
+            with open(path, 'rb') as f:
+                cur.copy_expert(copy_sql(table_name, is_binary_path(path)), FileSlice(f, start, end))
+        return cur.rowcount
+
+
+def commit_with_retry(conn, table_name, load, max_retries=3):
+    """load() 실행 + 커밋 (deadlock 시 재시도)"""
+    for attempt in range(1, max_retries + 1):
+        try:
+            count = load()
+            conn.commit()  # 테이블/청크 단위 커밋으로 락 유지 시간 최소화
+            return count
+        except psycopg2.errors.DeadlockDetected:
+            conn.rollback()
+            if attempt == max_retries:
+                raise
+            wait_sec = attempt
+            print(f"  [RETRY {attempt}/{max_retries}] {table_name} deadlock 감지, {wait_sec}s 후 재시도")
+            time.sleep(wait_sec)
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def load_table(conn, csv_file, table_name, manifest=None):
+    """테이블 하나 COPY + 커밋"""
+    return commit_with_retry(conn, table_name, lambda: load_csv(conn, csv_file, table_name, manifest))
+
+
+def print_manifest_status(manifest):
+    if manifest is None:
+        print("[INFO] manifest.json 없음: COPY 건수 대조 없이 적재합니다.\n")
+
+
+def load_all_csv(conn, staging=False):
+    """모든 CSV 파일 로드, 테이블별 적재 행 수 반환 (staging이면 스테이징 테이블에 COPY, 파일 없는 테이블은 0)"""
     print("CSV 데이터 로드 중...")
     print(f"CSV 파일 경로: {OUTPUT_DIR}\n")
 
+    manifest = load_manifest()
+    print_manifest_status(manifest)
+
+    loaded = {}
     for csv_file, table_name in CSV_TABLE_MAPPING:
-        max_retries = 3
-        for attempt in range(1, max_retries + 1):
-            try:
-                print(f"  - {csv_file} -> {table_name}", end=" ")
-                count = load_csv(conn, csv_file, table_name)
-                conn.commit()  # 테이블 단위 커밋으로 락 유지 시간 최소화
-                print(f"({count:,} rows)")
-                break
-            except psycopg2.errors.DeadlockDetected:
-                conn.rollback()
-                if attempt == max_retries:
-                    raise
-                wait_sec = attempt
-                print(f"[RETRY {attempt}/{max_retries}] deadlock 감지, {wait_sec}s 후 재시도")
-                time.sleep(wait_sec)
-            except Exception:
-                conn.rollback()
-                raise
+        target = staging_table(table_name) if staging else table_name
+        count = load_table(conn, csv_file, target, manifest)
+        loaded[table_name] = count or 0
+        if count is not None:
+            print(f"  - {csv_file} -> {table_name} ({count:,} rows)")
+
+    print("\nCSV 데이터 로드 완료!\n")
+    return loaded
+
+
+def load_all_csv_parallel(jobs, chunk_size_mb=DEFAULT_CHUNK_SIZE_MB, staging=False):
+    """
+    커넥션 풀로 독립 테이블을 동시에 COPY
+    - TABLE_DEPENDENCIES의 선행 테이블이 모두 커밋된 테이블부터 실행
+    - 예: member → subscription → (family_sub, notification_allow, notification, policy_sub, ...)
+    - 큰 CSV(notification_allow, notification, subscription, member 등)는 chunk_size_mb 단위
+      청크로 나눠 같은 테이블에 여러 커넥션이 동시에 COPY (청크 단위 커밋)
+    - 청크별 COPY 결과(cursor.rowcount)를 합산해 테이블 단위로 manifest와 대조, 테이블별 행 수 반환
+    - staging이면 스테이징 테이블에 COPY (청크 커밋이 본 테이블에 남지 않는다, publish_staging_tables로 반영)
+    """
+    print(f"CSV 데이터 병렬 로드 중... (jobs={jobs}, chunk={chunk_size_mb}MB)")
+    print(f"CSV 파일 경로: {OUTPUT_DIR}\n")
+
+    manifest = load_manifest()
+    print_manifest_status(manifest)
+
+    csv_files = {table_name: csv_file for csv_file, table_name in CSV_TABLE_MAPPING}
+    pool = ThreadedConnectionPool(1, jobs, client_encoding='UTF8', **get_connection_params())
+
+    def run(table_name, chunk):
+        conn = pool.getconn()
+        try:
+            target = staging_table(table_name) if staging else table_name
+            return commit_with_retry(conn, table_name, lambda: copy_chunk(conn, target, chunk))
+        finally:
+            pool.putconn(conn)
+
+    pending = [table_name for _, table_name in CSV_TABLE_MAPPING]
+    loaded = set()
+    running = {}
+    remaining = {}
+    rows = {}
+    expected = {}
+    started = {}
+
+    def finish(table_name):
+        check_row_count(table_name, rows[table_name], expected[table_name])
+        loaded.add(table_name)
+        elapsed = time.time() - started[table_name]
+        print(f"  - {csv_files[table_name]} -> {table_name} ({rows[table_name]:,} rows, {elapsed:.1f}s)")
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            while pending or running:
+                ready = [
+                    table_name for table_name in pending
+                    if all(dep in loaded or dep not in csv_files for dep in TABLE_DEPENDENCIES.get(table_name, []))
+                ]
+                for table_name in ready:
+                    pending.remove(table_name)
+                    paths = table_paths(os.path.splitext(csv_files[table_name])[0])
+                    if not paths:
+                        print(f"  [SKIP] {csv_files[table_name]} 파일이 없습니다.")
+                        loaded.add(table_name)
+                        rows[table_name] = 0
+                        continue
+
+                    check_file_sizes(manifest, paths)
+                    chunks = plan_copy_chunks(paths, int(chunk_size_mb * 1024 * 1024))
+                    started[table_name] = time.time()
+                    rows[table_name] = 0
+                    expected[table_name] = expected_rows(manifest, paths)
+                    remaining[table_name] = len(chunks)
+                    if not chunks:
+                        finish(table_name)
+                        continue
+                    for chunk in chunks:
+                        running[executor.submit(run, table_name, chunk)] = table_name
+
+                if not running:
+                    if pending:
+                        raise RuntimeError(f"적재 순서를 결정할 수 없습니다: {pending}")
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table_name = running.pop(future)
+                    rows[table_name] += future.result()
+                    remaining[table_name] -= 1
+                    if remaining[table_name] == 0:
+                        finish(table_name)
+    finally:
+        pool.closeall()
 
     print("\nCSV 데이터 로드 완료!\n")
+    return rows
+
+
+def drop_foreign_keys(conn):
+    """
+    COPY 스트리밍 적재용: FK 제약 정의를 보관한 뒤 제거
+    (테이블별 커넥션이 동시에 적재하므로 부모 행이 아직 커밋 전일 수 있음)
+    """
+    print("FK 제약 임시 해제 중...")
+
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT con.conrelid::regclass::text, con.conname, pg_get_constraintdef(con.oid)
+            FROM pg_constraint con
+            JOIN pg_namespace nsp ON nsp.oid = con.connamespace
+            WHERE con.contype = 'f'
+              AND nsp.nspname = current_schema()
+            ORDER BY 1, 2
+        """)
+        foreign_keys = cur.fetchall()
+
+        for table, name, _ in foreign_keys:
+            cur.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+
+    conn.commit()
+    print(f"FK 제약 {len(foreign_keys)}개 해제 완료!\n")
+    return foreign_keys
+
+
+def restore_foreign_keys(conn, foreign_keys):
+    """drop_foreign_keys로 해제한 FK 제약 재생성 (적재 데이터 전체 검증)"""
+    print("FK 제약 복원 중...")
+
+    with conn.cursor() as cur:
+        for table, name, definition in foreign_keys:
+            cur.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+    conn.commit()
+    print(f"FK 제약 {len(foreign_keys)}개 복원 완료!\n")
 
 
 def create_indexes(conn):
@@ -178,37 +480,106 @@ def reset_sequences(conn):
     conn.commit()
     print("시퀀스 재설정 완료!\n")
 
-def verify_data(conn):
-    """데이터 검증 (각 테이블 COUNT)"""
-    print("데이터 검증 중...")
-
-    tables = [
-        "member",
-        "social_account",
-        "subscription",
-        "subscription_key",
-        "family",
-        "family_sub",
-        "notification_allow",
-        "policy_sub",
-        "blocked_service_sub",
-        "present_data",
-        "notification",
-        "family_apply",
-        "family_apply_target",
-        "family_remove_schedule",
-    ]
+VERIFY_TABLES = [
+    "member",
+    "social_account",
+    "subscription",
+    "subscription_key",
+    "family",
+    "family_sub",
+    "notification_allow",
+    "policy_sub",
+    "blocked_service_sub",
+    "present_data",
+    "notification",
+    "data_usage",
+    "family_apply",
+    "family_apply_target",
+    "family_remove_schedule",
+]
+
+
+# deep verify 중복 검사 (append가 기존 실행의 난수 스트림을 되풀이하면 드러남)
+# - GCM nonce: phone_enc = "gcm:" + base64(nonce 12바이트 + 암호문 + tag) → 앞 16자가 nonce, 같은 버킷 키에서 재사용 금지
+# - member: 이름 / 생년월일 / 가입 시각(초)이 모두 같은 회원
+DUPLICATE_CHECKS = {
+    "subscription GCM nonce": """
+        SELECT COUNT(*) FROM (
+            SELECT 1 FROM subscription
+            WHERE phone_enc LIKE 'gcm:%'
+            GROUP BY phone_key_bucket_id, phone_key_version, substr(phone_enc, 5, 16)
+            HAVING COUNT(*) > 1
+        ) AS duplicated
+    """,
+    "member (name, birth, created_time)": """
+        SELECT COUNT(*) FROM (
+            SELECT 1 FROM member
+            GROUP BY name, birth, created_time
+            HAVING COUNT(*) > 1
+        ) AS duplicated
+    """,
+}
+
 
+def check_duplicates(conn):
     with conn.cursor() as cur:
-        for table in tables:
+        for label, sql in DUPLICATE_CHECKS.items():
+            cur.execute(sql)
+            duplicated = cur.fetchone()[0]
+            if duplicated:
+                raise RuntimeError(f"검증 실패: {label} 중복 {duplicated:,}건")
+            print(f"  - {label}: 중복 없음")
+
+
+def count_tables(conn):
+    """테이블별 COUNT(*) (append 적재 deep verify의 적재 전 기준값)"""
+    counts = {}
+    with conn.cursor() as cur:
+        for table in VERIFY_TABLES:
+            cur.execute(f'SELECT COUNT(*) FROM "{table}"')
+            counts[table] = cur.fetchone()[0]
+    return counts
+
+
+def verify_data(conn, loaded_rows=None, deep_verify=False, base_counts=None):
+    """
+    데이터 검증
+    - 기본: 적재 단계의 COPY 행 수(loaded_rows)를 출력, 적재하지 않은 테이블만 COUNT
+    - deep_verify: 모든 테이블을 COUNT(*)로 다시 세고 COPY 행 수와 대조
+    - base_counts: append 적재 전 COUNT (COUNT = 적재 전 + COPY 행 수로 대조)
+    - deep_verify: GCM nonce 재사용 / 회원 행 중복 검사 (DUPLICATE_CHECKS)
+    """
+    print("데이터 검증 중..." + (" (deep verify: COUNT)" if deep_verify else ""))
+    loaded_rows = loaded_rows or {}
+    base_counts = base_counts or {}
+    appended = " 추가" if base_counts else ""
+
+    with conn.cursor() as cur:
+        for table in VERIFY_TABLES:
+            if not deep_verify and table in loaded_rows:
+                print(f"  - {table}: {loaded_rows[table]:,} rows{appended}")
+                continue
+
             cur.execute(f'SELECT COUNT(*) FROM "{table}"')
             count = cur.fetchone()[0]
             print(f"  - {table}: {count:,} rows")
 
+            expected = base_counts.get(table, 0) + loaded_rows[table] if table in loaded_rows else None
+            if expected is not None and expected != count:
+                raise RuntimeError(f"검증 실패: {table} (기존 {base_counts.get(table, 0):,} + COPY {loaded_rows[table]:,} / COUNT {count:,})")
+
+    if deep_verify:
+        check_duplicates(conn)
+
     print("검증 완료!")
 
 
-def main():
+def is_append_manifest(manifest):
+    """generator --append 출력이면 테이블을 초기화하지 않고 추가분만 적재"""
+    return bool(manifest) and manifest.get("mode") == "append"
+
+
+def main(jobs=1, chunk_size_mb=DEFAULT_CHUNK_SIZE_MB, deep_verify=False):
     print("=" * 60)
     print("CSV to PostgreSQL Loader")
     print("=" * 60 + "\n")
@@ -217,20 +588,41 @@ def main():
         conn = get_connection()
         print(f"DB 연결 성공: {DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['database']}\n")
 
-        # 1. 테이블 초기화
-        init_tables(conn)
-
-        # 2. CSV 로드
-        load_all_csv(conn)
-        
-        # 3. 인덱스 생성
-        create_indexes(conn)
+        # 1. 테이블 초기화 (append 출력이면 기존 데이터 유지)
+        manifest = load_manifest()
+        if manifest and manifest["config"].get("output") == "parquet":
+            raise RuntimeError("parquet 출력(manifest)은 DB 적재 대상이 아닙니다: --output csv로 다시 생성하세요")
+        append = is_append_manifest(manifest)
+        if append:
+            print("append 모드 manifest: 테이블을 초기화하지 않고 추가분만 적재합니다.\n")
+        else:
+            init_tables(conn)
+        base_counts = count_tables(conn) if append and deep_verify else None
+
+        # 2. CSV 로드 (append는 스테이징 테이블에 적재 후 한 트랜잭션으로 반영, 실패하면 기존 데이터 그대로)
+        if append:
+            create_staging_tables(conn)
+        try:
+            if jobs > 1:
+                loaded_rows = load_all_csv_parallel(jobs, chunk_size_mb, staging=append)
+            else:
+                loaded_rows = load_all_csv(conn, staging=append)
+            if append:
+                publish_staging_tables(conn)
+        except Exception:
+            if append:
+                drop_staging_tables(conn)
+            raise
+
+        # 3. 인덱스 생성 (append는 기존 인덱스가 스테이징 반영 중 함께 갱신됨)
+        if not append:
+            create_indexes(conn)
 
         # 4. 시퀀스 재설정
         reset_sequences(conn)
 
         # 5. 검증
-        verify_data(conn)
+        verify_data(conn, loaded_rows, deep_verify, base_counts)
 
         conn.close()
         print("\n데이터 로드 완료!")
@@ -243,5 +635,24 @@ def main():
         raise
 
 
+def add_loader_arguments(parser):
+    parser.add_argument(
+        "--load-jobs", type=int, default=1,
+        help="동시 COPY 커넥션 수 (기본 1: 순차 적재, FK 선행 테이블 순서는 항상 보장)"
+    )
+    parser.add_argument(
+        "--chunk-size-mb", type=float, default=DEFAULT_CHUNK_SIZE_MB,
+        help="병렬 적재 시 큰 CSV를 나누는 청크 크기(MB)"
+    )
+    parser.add_argument(
+        "--deep-verify", action="store_true",
+        help="검증 단계에서 COPY 행 수 대신 모든 테이블을 COUNT(*)로 다시 세어 대조, GCM nonce 재사용 / 회원 행 중복 검사"
+    )
+
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="CSV → PostgreSQL 적재")
+    add_loader_arguments(parser)
+    args = parser.parse_args()
+
+    main(jobs=args.load_jobs, chunk_size_mb=args.chunk_size_mb, deep_verify=args.deep_verify)
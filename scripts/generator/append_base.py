@@ -0,0 +1,133 @@
+from typing import Any, Dict, Optional
+
+from generator.constants import *
+from generator.manifest import load_manifest
+from generator.utils import derive_seed, unwrap_dek
+
+# ======================================================
+# Append (delta) generation base state
+# ======================================================
+#
+# --append N: 기존 데이터셋 위에 N명분(가족/정책/알림 포함)만 추가 생성한다.
+# 기준 상태는 직전 manifest.json 또는 DB에서 읽는다.
+# - next_ids: 테이블별 다음 ID (새 행은 이 값부터 발급)
+# - key_buckets: 버킷별 활성 키 (래핑된 DEK, 새 회선도 같은 DEK로 암호화)
+# - phone_seed: 전화번호 순열 seed (기존 회선과 같은 순열을 써야 번호가 겹치지 않음)
+# - 난수 스트림 seed는 append_seed로 기준 상태마다 새로 파생 (같은 --seed로 기존 행 / GCM nonce를 되풀이하지 않음)
+
+APPEND_SOURCES = ("manifest", "db")
+
+# 다음 ID를 관리하는 테이블 → PK 컬럼
+NEXT_ID_COLUMNS = {
+    "member": "member_id",
+    "social_account": "social_account_id",
+    "subscription": "sub_id",
+    "notification_allow": "notification_allow_id",
+    "family": "family_id",
+    "family_sub": "family_sub_id",
+    "family_apply": "family_apply_id",
+    "family_apply_target": "family_apply_target_id",
+    "block_policy": "block_policy_id",
+    "policy_sub": "policy_sub_id",
+    "blocked_service_sub": "blocked_service_sub_id",
+    "present_data": "present_data_id",
+    "notification": "notification_id",
+    "data_usage": "data_usage_id",
+}
+
+
+def default_next_ids() -> Dict[str, int]:
+    """빈 DB 기준 다음 ID (block_policy 1~N은 03_insert_master_data.sql의 관리자 템플릿)"""
+    next_ids = {table: 1 for table in NEXT_ID_COLUMNS}
+    next_ids["block_policy"] = len(block_policies) + 1
+    return next_ids
+
+
+def align_user_ids(next_ids: Dict[str, int]) -> Dict[str, int]:
+    """member_id == sub_id == social_account_id로 발급하도록 세 테이블의 다음 ID를 최댓값에 맞춘다"""
+    user_start = max(next_ids["member"], next_ids["subscription"], next_ids["social_account"])
+    next_ids.update(member=user_start, subscription=user_start, social_account=user_start)
+    return next_ids
+
+
+def base_from_manifest(manifest: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not manifest or "next_ids" not in manifest:
+        raise RuntimeError("append 기준 manifest.json(next_ids 포함)이 없습니다. 전체 생성을 먼저 실행하세요.")
+
+    return {
+        "source": "manifest",
+        "phone_seed": manifest["phone_seed"],
+        "next_ids": align_user_ids(dict(manifest["next_ids"])),
+        "key_buckets": {int(bucket_id): key for bucket_id, key in manifest["key_buckets"].items()},
+    }
+
+
+def base_from_db(conn, manifest: Optional[Dict[str, Any]], seed: int) -> Dict[str, Any]:
+    """
+    DB의 MAX(PK)와 활성 버킷 키로 기준 상태 구성 (team_seed 등 manifest 이후 변경 반영)
+    - phone_seed는 DB에 없으므로 manifest 값을 쓰고, manifest가 없으면 seed(기존 실행과 같아야 함)
+    """
+    next_ids = {}
+    with conn.cursor() as cur:
+        for table, column in NEXT_ID_COLUMNS.items():
+            cur.execute(f'SELECT COALESCE(MAX({column}), 0) + 1 FROM "{table}"')
+            next_ids[table] = cur.fetchone()[0]
+        next_ids["block_policy"] = max(next_ids["block_policy"], len(block_policies) + 1)
+
+        cur.execute("""
+            SELECT bucket_id, key_version, encrypted_dek, kek_key_id
+            FROM subscription_key
+            WHERE status = 'active'
+        """)
+        key_buckets = {
+            bucket_id: {"version": version, "encrypted_dek": encrypted_dek, "kek_key_id": kek_key_id}
+            for bucket_id, version, encrypted_dek, kek_key_id in cur.fetchall()
+        }
+
+    return {
+        "source": "db",
+        "phone_seed": manifest["phone_seed"] if manifest and "phone_seed" in manifest else seed,
+        "next_ids": align_user_ids(next_ids),
+        "key_buckets": key_buckets,
+    }
+
+
+def append_seed(seed: int, base: Dict[str, Any]) -> int:
+    """
+    append 실행의 난수 seed: --seed에 기준 상태의 테이블별 시작 ID를 섞어 파생
+    - 샤드 / 단계 라벨은 0부터 다시 시작하므로 seed가 같으면 기존 실행의 회원 행과 nonce가 그대로 재생된다
+    - 같은 기준 상태 + 같은 --seed면 같은 결과 (재현 가능)
+    """
+    next_ids = base["next_ids"]
+    return derive_seed(seed, "append", *(f"{table}={next_ids[table]}" for table in sorted(next_ids)))
+
+
+def load_append_base(source: str, seed: Optional[int]) -> Dict[str, Any]:
+    manifest = load_manifest()
+    if source == "manifest":
+        return base_from_manifest(manifest)
+    if source != "db":
+        raise ValueError(f"append source must be one of {APPEND_SOURCES}")
+
+    if seed is None and not (manifest and "phone_seed" in manifest):
+        raise RuntimeError("--append-from db: manifest.json이 없으면 기존 실행과 같은 --seed가 필요합니다 (전화번호 순열)")
+
+    from generator.copy_sink import get_connection
+    conn = get_connection()
+    try:
+        return base_from_db(conn, manifest, seed)
+    finally:
+        conn.close()
+
+
+def unwrap_bucket_keys(key_buckets: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """래핑된 버킷 키 → bucket_active_key_cache 형식 (KMS는 버킷마다 Decrypt 1회)"""
+    return {
+        bucket_id: {
+            "version": key["version"],
+            "dek": unwrap_dek(key["encrypted_dek"], key.get("kek_key_id")),
+            "encrypted_dek": key["encrypted_dek"],
+            "kek_key_id": key.get("kek_key_id"),
+        }
+        for bucket_id, key in key_buckets.items()
+    }
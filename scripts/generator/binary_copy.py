@@ -0,0 +1,87 @@
+import struct
+from datetime import datetime
+
+from generator.timestamps import to_epoch
+
+# ======================================================
+# PostgreSQL binary COPY (FORMAT BINARY)
+# ======================================================
+#
+# 파일 구조: 헤더(시그니처 + flags + 확장 길이) → 튜플들 → 트레일러(-1)
+# 튜플: int16 필드 수 + 필드마다 int32 길이 + 값 (NULL은 길이 -1)
+
+BINARY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+BINARY_HEADER = BINARY_SIGNATURE + struct.pack("!ii", 0, 0)
+BINARY_TRAILER = struct.pack("!h", -1)
+
+# timestamp는 2000-01-01 기준 마이크로초 (int64), 생성기 행의 시각은 epoch 초(int)
+PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_SECONDS = to_epoch(PG_EPOCH)
+
+# 정수/시각 위주 테이블의 컬럼 타입 (02_create_tables.sql 컬럼 순서)
+BINARY_COPY_TABLES = {
+    'notification_allow': ['int8', 'int8', 'text', 'bool', 'bool', 'timestamp', 'timestamp'],
+    'policy_sub': ['int8', 'int8', 'int8', 'bool', 'timestamp', 'timestamp'],
+    'family_sub': ['int8', 'int8', 'int8', 'text', 'int4', 'int8'],
+    'blocked_service_sub': ['int8', 'int8', 'int8', 'bool', 'timestamp', 'timestamp'],
+}
+
+_NULL = struct.pack("!i", -1)
+_INT8 = struct.Struct("!iq")
+_INT4 = struct.Struct("!ii")
+_BOOL_TRUE = struct.pack("!ib", 1, 1)
+_BOOL_FALSE = struct.pack("!ib", 1, 0)
+_INT32 = struct.Struct("!i")
+
+
+def _encode_int8(value) -> bytes:
+    return _INT8.pack(8, value)
+
+
+def _encode_int4(value) -> bytes:
+    return _INT4.pack(4, value)
+
+
+def _encode_bool(value) -> bytes:
+    return _BOOL_TRUE if value else _BOOL_FALSE
+
+
+def _encode_text(value) -> bytes:
+    data = str(value).encode('utf-8')
+    return _INT32.pack(len(data)) + data
+
+
+def _encode_timestamp(value) -> bytes:
+    return _INT8.pack(8, (value - _PG_EPOCH_SECONDS) * 1_000_000)
+
+
+_ENCODERS = {
+    'int8': _encode_int8,
+    'int4': _encode_int4,
+    'bool': _encode_bool,
+    'text': _encode_text,
+    'timestamp': _encode_timestamp,
+}
+
+
+class BinaryCopyWriter:
+    """csv.writer와 같은 writerow 인터페이스로 binary COPY 스트림을 기록"""
+
+    def __init__(self, f, column_types):
+        self._f = f
+        self._encoders = [_ENCODERS[t] for t in column_types]
+        self._field_count = struct.pack("!h", len(column_types))
+        f.write(BINARY_HEADER)
+
+    def writerow(self, row):
+        parts = [self._field_count]
+        for encode, value in zip(self._encoders, row):
+            parts.append(_NULL if value is None else encode(value))
+        self._f.write(b"".join(parts))
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def finish(self):
+        self._f.write(BINARY_TRAILER)
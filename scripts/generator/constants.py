@@ -52,6 +52,26 @@ class NotificationCategory(str, Enum):
 TOTAL_USERS = 1_000_000
 TOTAL_FAMILIES = 250_000
 
+# 샤드 크기 (워커 수와 무관하게 고정해야 직렬/병렬 결과가 같다)
+FAMILY_SHARD_SIZE = 10_000
+USER_SHARD_SIZE = 50_000
+
+# 이벤트 시뮬레이터 청크 크기 (회선 수, 청크마다 난수 스트림 / notification_id 구간 고정)
+EVENT_CHUNK_SIZE = 10_000
+
+# 단계별 알림 상한 (notification_id 구간 크기 산정용)
+MAX_FAMILY_POLICIES = 3       # policy_sub: 가족당 정책 수 (구성원당 정책별 알림 최대 1건)
+MAX_BLOCKED_SERVICES = 3      # blocked_service_sub: 회선당 차단 서비스 수 (서비스별 알림 1건)
+
+# 010-XXXX-XXXX 번호 공간
+PHONE_SPACE = 100_000_000
+
+# team_seed.py 전용 번호 대역 [시작, 끝) — 더미 회선 번호는 이 대역을 건너뛴다
+TEAM_PHONE_RANGE = (10_000_000, 10_100_000)
+
+# 전화번호 암호화 키 버킷 수 (bucket_id = sub_id % KEY_BUCKET_COUNT)
+KEY_BUCKET_COUNT = 1000
+
 PRIORITY_FAMILY_RATE = 0.2
 MOTHER_SAME_LASTNAME_RATE = 0.3
 
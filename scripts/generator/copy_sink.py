@@ -0,0 +1,141 @@
+import os
+import threading
+from typing import Dict, List, Optional
+
+import psycopg2
+
+from config.db_config import DB_CONFIG
+from generator.binary_copy import BINARY_COPY_TABLES, BinaryCopyWriter
+from generator.csv_writer import TABLE_NAMES, COPY_FORMATS, RowSink, text_writer, uses_binary
+
+# COPY 스트림 버퍼 (CSVWriterManager 파일 버퍼와 동일)
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def get_connection():
+    return psycopg2.connect(
+        host=DB_CONFIG["host"],
+        port=DB_CONFIG["port"],
+        database=DB_CONFIG["database"],
+        user=DB_CONFIG["user"],
+        password=DB_CONFIG["password"],
+    )
+
+
+def copy_sql(table_name: str, binary: bool = False) -> str:
+    if binary:
+        return f'COPY "{table_name}" FROM STDIN WITH (FORMAT BINARY)'
+    return f'COPY "{table_name}" FROM STDIN WITH (FORMAT CSV, NULL \'\\N\')'
+
+
+class CopyStreamWriterManager(RowSink):
+    """
+    COPY 스트림 sink (--output copy).
+    테이블마다 os.pipe + COPY 스레드를 하나씩 두고, csv.writer 출력을
+    파일 대신 파이프로 흘려 생성과 동시에 DB에 적재한다.
+
+    - 테이블별 커넥션/트랜잭션이 분리되므로 FK 제약은 적재 전에 내려야 한다
+      (db_loader.drop_foreign_keys / restore_foreign_keys)
+    - close()에서 스트림을 닫고 각 COPY를 커밋한다
+    """
+
+    def __init__(
+        self,
+        tables: Optional[List[str]] = None,
+        part: Optional[int] = None,
+        copy_format: str = "csv",
+        compression: str = "none",
+        writer_threads: int = 0
+    ):
+        if copy_format not in COPY_FORMATS:
+            raise ValueError(f"copy_format must be one of {COPY_FORMATS}")
+        if compression != "none":
+            raise ValueError("COPY 스트림 출력은 압축을 지원하지 않습니다 (--compress는 --output csv / parquet에서만 사용)")
+
+        super().__init__(writer_threads)
+        self.files = {}
+        self.binary_writers = {}
+        self.copied_rows: Dict[str, int] = {}
+        self._errors: Dict[str, BaseException] = {}
+        self._connections = {}
+        self._threads = {}
+
+        for name in (tables or TABLE_NAMES):
+            binary = uses_binary(name, copy_format)
+            read_fd, write_fd = os.pipe()
+            reader = os.fdopen(read_fd, 'rb')
+            conn = get_connection()
+
+            thread = threading.Thread(
+                target=self._copy,
+                args=(name, conn, reader, binary),
+                name=f"copy-{name}",
+                daemon=True
+            )
+            thread.start()
+
+            if binary:
+                f = open(write_fd, 'wb', buffering=COPY_BUFFER_SIZE)
+                self.binary_writers[name] = BinaryCopyWriter(f, BINARY_COPY_TABLES[name])
+                self.add_writer(name, self.binary_writers[name])
+            else:
+                f = open(
+                    write_fd,
+                    'w',
+                    newline='',
+                    encoding='utf-8',
+                    buffering=COPY_BUFFER_SIZE
+                )
+                self.add_writer(name, text_writer(name, f))
+
+            self.files[name] = f
+            self._connections[name] = conn
+            self._threads[name] = thread
+
+    def _copy(self, name, conn, reader, binary):
+        try:
+            with conn.cursor() as cur:
+                cur.copy_expert(copy_sql(name, binary), reader, size=COPY_BUFFER_SIZE)
+                self.copied_rows[name] = cur.rowcount
+        except BaseException as e:
+            self._errors[name] = e
+        finally:
+            # 실패 시 쓰는 쪽이 막히지 않도록 읽는 쪽을 먼저 닫는다 (BrokenPipe로 전파)
+            reader.close()
+
+    def close(self):
+        try:
+            self.finish_writers()
+        except RuntimeError:
+            # COPY 실패로 파이프가 닫힌 경우 (BrokenPipe) 원인은 아래 COPY 오류로 보고
+            if not self._errors:
+                raise
+
+        for name, f in self.files.items():
+            try:
+                if name in self.binary_writers:
+                    self.binary_writers[name].finish()
+                f.close()
+            except BrokenPipeError:
+                pass
+
+        for thread in self._threads.values():
+            thread.join()
+
+        # 별도 COUNT 없이 COPY가 보고한 건수를 생성 건수와 대조 (불일치 테이블은 롤백)
+        for name, rows in self.row_counts.items():
+            if name not in self._errors and self.copied_rows.get(name) != rows:
+                self._errors[name] = RuntimeError(
+                    f"COPY 건수 불일치: 생성 {rows:,} / COPY {self.copied_rows.get(name)}"
+                )
+
+        for name, conn in self._connections.items():
+            if name in self._errors:
+                conn.rollback()
+            else:
+                conn.commit()
+            conn.close()
+
+        if self._errors:
+            name, error = next(iter(self._errors.items()))
+            raise RuntimeError(f"COPY 스트림 실패: {name}") from error
@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import hmac
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from Crypto.Cipher import AES
+
+from config.db_config import get_hash_key
+from generator.utils import GCM_PREFIX, GCM_TAG_SIZE
+
+# ======================================================
+# Batched phone crypto (phone_enc / phone_hash)
+# ======================================================
+#
+# 회선 블록을 bucket_id(sub_id % KEY_BUCKET_COUNT)별로 묶어
+# - AES-GCM: DEK마다 cipher를 한 번만 만들고 (cryptography AESGCM, 없으면 pycryptodome)
+# - blind index: HASH_KEY를 한 번 넣은 HMAC 객체를 copy()해서 사용
+# 결과 포맷은 utils.encrypt_with_dek / generate_blind_index와 같다.
+
+# 생성기가 subscription 행을 모아 암호화하는 블록 크기 (회선 수)
+CRYPTO_BLOCK_SIZE = 10_000
+
+# 프로세스 풀 사용 시 작업 하나의 크기 (회선 수, 버킷 단위로 묶음)
+CRYPTO_TASK_SIZE = 20_000
+
+_AESGCM = None
+
+
+def _aesgcm_class():
+    """cryptography의 AESGCM (선택 의존성, 없으면 None)"""
+    global _AESGCM
+    if _AESGCM is None:
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+            _AESGCM = AESGCM
+        except ImportError:
+            _AESGCM = False
+    return _AESGCM or None
+
+
+def crypto_backend() -> str:
+    return "cryptography" if _aesgcm_class() is not None else "pycryptodome"
+
+
+def _dek_encryptor(dek: bytes):
+    """DEK 하나에 대한 encrypt(plain, nonce) -> nonce + ciphertext + tag"""
+    aesgcm = _aesgcm_class()
+    if aesgcm is not None:
+        encrypt = aesgcm(dek).encrypt
+        return lambda plain, nonce: nonce + encrypt(nonce, plain, None)
+
+    def encrypt_pycryptodome(plain, nonce):
+        cipher = AES.new(dek, AES.MODE_GCM, nonce=nonce, mac_len=GCM_TAG_SIZE)
+        encrypted, tag = cipher.encrypt_and_digest(plain)
+        return nonce + encrypted + tag
+
+    return encrypt_pycryptodome
+
+
+def _encrypt_groups(groups: List[Tuple[bytes, List[Tuple[int, str, bytes]]]]) -> List[Tuple[int, str, str]]:
+    """
+    [(dek, [(index, phone, nonce), ...]), ...] → [(index, phone_enc, phone_hash), ...]
+    (프로세스 풀 작업 단위)
+    """
+    b64encode = base64.b64encode
+    hmac_base = hmac.new(get_hash_key(), digestmod=hashlib.sha256)
+    results = []
+
+    for dek, items in groups:
+        encrypt = _dek_encryptor(dek)
+        for index, phone, nonce in items:
+            plain = phone.encode('utf-8')
+
+            mac = hmac_base.copy()
+            mac.update(plain)
+
+            results.append((
+                index,
+                GCM_PREFIX + b64encode(encrypt(plain, nonce)).decode('utf-8'),
+                b64encode(mac.digest()).decode('utf-8'),
+            ))
+
+    return results
+
+
+def _split_tasks(groups, task_size: int):
+    """버킷 그룹을 task_size 내외의 작업으로 묶는다 (버킷은 쪼개지 않음)"""
+    task, count = [], 0
+    for group in groups:
+        task.append(group)
+        count += len(group[1])
+        if count >= task_size:
+            yield task
+            task, count = [], 0
+    if task:
+        yield task
+
+
+def encrypt_phone_block(
+    sub_ids: Sequence[int],
+    phones: Sequence[str],
+    nonces: Sequence[bytes],
+    bucket_keys: Dict[int, Dict[str, Any]],
+    bucket_count: int,
+    executor: Optional[Any] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    회선 블록의 phone_enc / phone_hash를 입력 순서대로 반환
+    - bucket_keys: bucket_id → {"dek", ...} (모든 버킷 키가 미리 발급되어 있어야 함)
+    - executor: 지정 시 버킷 묶음 단위로 프로세스 풀에서 병렬 처리
+    """
+    buckets: Dict[int, List[Tuple[int, str, bytes]]] = {}
+    for index, (sub_id, phone, nonce) in enumerate(zip(sub_ids, phones, nonces)):
+        buckets.setdefault(sub_id % bucket_count, []).append((index, phone, nonce))
+
+    groups = [(bucket_keys[bucket_id]["dek"], items) for bucket_id, items in buckets.items()]
+
+    if executor is None:
+        results = _encrypt_groups(groups)
+    else:
+        results = [
+            result
+            for task_results in executor.map(_encrypt_groups, _split_tasks(groups, CRYPTO_TASK_SIZE))
+            for result in task_results
+        ]
+
+    phone_enc: List[str] = [""] * len(phones)
+    phone_hash: List[str] = [""] * len(phones)
+    for index, enc, blind_index in results:
+        phone_enc[index] = enc
+        phone_hash[index] = blind_index
+
+    return phone_enc, phone_hash
@@ -1,43 +1,545 @@
 import csv
+import glob
+import hashlib
+import importlib
+import io
 import os
+import queue
+import threading
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
 from config.db_config import OUTPUT_DIR
+from generator.binary_copy import BINARY_COPY_TABLES, BinaryCopyWriter
+from generator.timestamps import format_ts
 
-class CSVWriterManager:
+TABLE_NAMES = [
+    'member',
+    'social_account',
+    'subscription',
+    'subscription_key',
+    'notification_allow',
+    'family',
+    'family_sub',
+    'family_apply',
+    'family_apply_target',
+    'block_policy',
+    'policy_sub',
+    'blocked_service_sub',
+    'present_data',
+    'notification',
+    'data_usage',
+]
 
-    def __init__(self):
+# 테이블별 시각 컬럼 위치 (02_create_tables.sql 컬럼 순서)
+# 생성기 행은 시각을 epoch 초(int)로 넘기고, 텍스트 출력(CSV 파일 / COPY csv 스트림)만 format_ts로 문자열을 만든다
+# (binary COPY / parquet은 epoch를 그대로 기록)
+TIMESTAMP_COLUMNS = {
+    'member': (5, 6),
+    'social_account': (6, 7),
+    'subscription': (9, 10),
+    'subscription_key': (6, 7),
+    'notification_allow': (5, 6),
+    'family': (5, 6),
+    'family_apply': (6, 7),
+    'block_policy': (8, 9),
+    'policy_sub': (4, 5),
+    'blocked_service_sub': (4, 5),
+    'present_data': (4,),
+    'notification': (5,),
+    'data_usage': (5,),
+}
+
+# --usage-ledger에서만 기록하는 테이블 (원장 없이 실행하면 sink를 열지 않는다)
+LEDGER_TABLES = ['data_usage']
+
+
+def output_tables(usage_ledger: bool) -> List[str]:
+    """본 sink가 여는 테이블 목록"""
+    return [name for name in TABLE_NAMES if usage_ledger or name not in LEDGER_TABLES]
+
+
+# 출력 방식 → sink 구현 (모듈, 클래스). 모듈은 선택된 경우에만 import (copy는 psycopg2 필요)
+# - csv: output/ 파일 (manifest / db_loader 적재)
+# - copy: DB COPY 스트림 (생성과 동시에 적재)
+# - parquet: output/parquet/ 분석용 내보내기 (pyarrow 필요, DB 적재 대상 아님)
+SINKS = {
+    "csv": ("generator.csv_writer", "CSVWriterManager"),
+    "copy": ("generator.copy_sink", "CopyStreamWriterManager"),
+    "parquet": ("generator.parquet_sink", "ParquetWriterManager"),
+}
+OUTPUT_MODES = tuple(SINKS)
+
+# COPY 포맷: csv (전 테이블) | binary (BINARY_COPY_TABLES만 FORMAT BINARY, 나머지는 csv)
+COPY_FORMATS = ("csv", "binary")
+
+# 출력 파일 압축 (--compress): 확장자 뒤에 접미사 (<table>.csv.gz, <table>.part-NNNNN.bin.zst)
+COMPRESSIONS = ("none", "gzip", "zstd")
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+# gzip은 속도 우선(1: 6 대비 약 2배 빠르고 크기는 약 1.2배), zstd는 기본 레벨
+COMPRESSION_LEVELS = {"gzip": 1, "zstd": 3}
+
+OUTPUT_EXTENSIONS = tuple(
+    ext + suffix for ext in (".csv", ".bin") for suffix in ("",) + tuple(COMPRESSION_SUFFIXES.values())
+)
+
+
+def uses_binary(name: str, copy_format: str) -> bool:
+    return copy_format == "binary" and name in BINARY_COPY_TABLES
+
+
+def path_compression(path: str) -> str:
+    """파일 압축 방식 (접미사 기준, 비압축은 none)"""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return "none"
+
+
+def is_binary_path(path: str) -> bool:
+    compression = path_compression(path)
+    if compression != "none":
+        path = path[:-len(COMPRESSION_SUFFIXES[compression])]
+    return path.endswith(".bin")
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:  # 선택 의존성: --compress zstd에서만 필요
+        raise ImportError("zstd 압축 출력에는 zstandard가 필요합니다 (pip install zstandard)") from e
+    return zstandard
+
+
+def open_output_file(path: str):
+    """출력 파일을 바이너리 스트림으로 열기 (압축 파일은 스트리밍 해제, 임시 파일 없음)"""
+    compression = path_compression(path)
+    if compression == "gzip":
+        import gzip
+        return gzip.open(path, 'rb')
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+def part_filename(name: str, part: int, ext: str = ".csv") -> str:
+    return f"{name}.part-{part:05d}{ext}"
+
+
+def table_paths(name: str) -> List[str]:
+    """테이블의 출력 파일 목록 (본 파일 + 샤드 part 파일, 이름순 / .csv·.bin 모두)"""
+    paths = []
+    for ext in OUTPUT_EXTENSIONS:
+        main_path = os.path.join(OUTPUT_DIR, f"{name}{ext}")
+        if os.path.exists(main_path):
+            paths.append(main_path)
+    for ext in OUTPUT_EXTENSIONS:
+        paths.extend(sorted(glob.glob(os.path.join(OUTPUT_DIR, f"{name}.part-*{ext}"))))
+    return paths
+
+
+def remove_part_files():
+    """이전 실행에서 남은 샤드 part 파일 정리"""
+    for ext in OUTPUT_EXTENSIONS:
+        for path in glob.glob(os.path.join(OUTPUT_DIR, f"*.part-*{ext}")):
+            os.remove(path)
+
+
+def remove_stale_main_file(name: str, ext: Optional[str] = None):
+    """다른 포맷으로 남은 본 파일 제거 (포맷을 바꿔 재실행해도 중복 적재 방지, ext가 없으면 전부)"""
+    for other in OUTPUT_EXTENSIONS:
+        path = os.path.join(OUTPUT_DIR, f"{name}{other}")
+        if other != ext and os.path.exists(path):
+            os.remove(path)
+
+
+# 출력 파일 버퍼 크기
+FILE_BUFFER_SIZE = 1024 * 1024
+
+
+class HashingFileIO(io.RawIOBase):
+    """
+    버퍼 flush 단위로 바이트 수와 sha256을 누적하는 raw 파일
+    (행 단위 오버헤드 없이 manifest의 bytes / sha256 계산, 파일 재읽기 없음)
+    """
+
+    def __init__(self, path: str):
+        self._f = open(path, 'wb', buffering=0)
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        view = memoryview(b)
+        written = 0
+        while written < len(view):
+            written += self._f.write(view[written:])
+        self.sha256.update(view)
+        self.bytes += written
+        return written
+
+    def close(self):
+        if not self.closed:
+            self._f.close()
+        super().close()
+
+
+class CompressingFileIO(io.RawIOBase):
+    """
+    압축 raw 파일: 버퍼 flush 단위 블록을 백그라운드 스레드가 압축해 하위 raw 파일(HashingFileIO)에 기록
+    - 생성 스레드는 블록을 큐에 넣고 바로 다음 행을 만든다 (zlib / zstd는 압축 중 GIL 해제)
+    - 큐 크기 제한으로 압축이 밀리면 생성 쪽이 기다린다 (메모리 상한)
+    - 압축 스레드 오류는 다음 write / close에서 다시 발생
+    """
+
+    QUEUE_BLOCKS = 4
+
+    def __init__(self, raw: io.RawIOBase, compression: str):
+        if compression == "gzip":
+            # wbits 31: gzip 헤더/트레일러 (gzip.open / zcat으로 읽힘)
+            self._compressor = zlib.compressobj(COMPRESSION_LEVELS["gzip"], zlib.DEFLATED, 31)
+        elif compression == "zstd":
+            self._compressor = _zstandard().ZstdCompressor(level=COMPRESSION_LEVELS["zstd"]).compressobj()
+        else:
+            raise ValueError(f"compression must be one of {COMPRESSIONS[1:]}")
+        self._raw = raw
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=self.QUEUE_BLOCKS)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="compress", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        finished = False
+        try:
+            while True:
+                block = self._queue.get()
+                if block is None:
+                    finished = True
+                    break
+                self._raw.write(self._compressor.compress(block))
+            self._raw.write(self._compressor.flush())
+        except BaseException as e:
+            self._error = e
+            # 생성 쪽이 큐에서 막히지 않도록 남은 블록은 버린다
+            while not finished and self._queue.get() is not None:
+                pass
+
+    def _check(self):
+        if self._error is not None:
+            raise RuntimeError("출력 파일 압축 실패") from self._error
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._check()
+        data = bytes(b)
+        self._queue.put(data)
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._queue.put(None)
+            self._thread.join()
+            self._raw.close()
+            super().close()
+            self._check()
+
+
+class TimestampTextWriter:
+    """csv.writer 래퍼: 행의 시각 컬럼(epoch 초)을 format_ts 문자열로 바꿔 기록 (행 리스트는 그 자리에서 바꾼다)"""
+
+    __slots__ = ("_writer", "_columns")
+
+    def __init__(self, writer, columns: Sequence[int]):
+        self._writer = writer
+        self._columns = columns
+
+    def writerows(self, rows):
+        columns = self._columns
+        formatted = []
+        for row in rows:
+            # write_block(컬럼 묶음)은 zip 튜플로 들어온다
+            if row.__class__ is not list:
+                row = list(row)
+            for index in columns:
+                row[index] = format_ts(row[index])
+            formatted.append(row)
+        return self._writer.writerows(formatted)
+
+
+def text_writer(name: str, f):
+    """텍스트(CSV) 행 writer: 시각 컬럼이 있는 테이블은 format_ts 변환을 거친다"""
+    writer = csv.writer(f)
+    columns = TIMESTAMP_COLUMNS.get(name)
+    return TimestampTextWriter(writer, columns) if columns else writer
+
+
+class CountingWriter:
+    """writer 래퍼: 기록한 행 수를 센다 (manifest / COPY 건수 검증용)"""
+
+    __slots__ = ("_writer", "rows")
+
+    def __init__(self, writer):
+        self._writer = writer
+        self.rows = 0
+
+    def writerows(self, rows):
+        # 블록 단위 기록은 writer의 writerows(C 루프)에 그대로 넘긴다
+        rows = rows if isinstance(rows, list) else list(rows)
+        self.rows += len(rows)
+        return self._writer.writerows(rows)
+
+
+# 백그라운드 writer (--writer-threads): 테이블별 행 묶음 크기 / 스레드별 대기 묶음 수 (백프레셔)
+WRITE_BATCH_ROWS = 4096
+WRITE_QUEUE_BATCHES = 8
+
+
+class BackgroundWriter:
+    """
+    writer 래퍼: 행을 WRITE_BATCH_ROWS 묶음으로 모아 writer 스레드 큐에 넘긴다
+    - 실제 writer(csv.writer / BinaryCopyWriter / parquet)는 writer 스레드에서만 호출
+    - 넘긴 행은 기록 전까지 바꾸지 않는다 (생성기는 행마다 새 리스트를 만든다)
+    """
+
+    __slots__ = ("_pool", "_queue", "_writer", "_rows")
+
+    def __init__(self, pool: "WriterPool", tasks: "queue.Queue", writer):
+        self._pool = pool
+        self._queue = tasks
+        self._writer = writer
+        self._rows: List[Any] = []
+
+    def writerows(self, rows):
+        if not self._rows and len(rows) >= WRITE_BATCH_ROWS:
+            self._put(self._writer.writerows, rows)
+            return
+        self._rows.extend(rows)
+        if len(self._rows) >= WRITE_BATCH_ROWS:
+            self.flush()
+
+    def submit(self, fn, arg):
+        """대기 중인 행 다음 순서로 fn(arg)를 writer 스레드에서 실행 (컬럼 묶음 기록 등)"""
+        self.flush()
+        self._put(fn, arg)
+
+    def flush(self):
+        if self._rows:
+            rows, self._rows = self._rows, []
+            self._put(self._writer.writerows, rows)
+
+    def _put(self, fn, arg):
+        self._pool.check()
+        self._queue.put((fn, arg))
+
+
+class WriterPool:
+    """
+    백그라운드 writer 스레드 풀
+    - 테이블마다 스레드 하나를 고정 배정 (열린 순서대로 돌아가며) → 테이블 안 행 순서 유지
+    - 스레드별 큐 크기 제한으로 기록이 밀리면 생성 쪽이 기다린다 (메모리 상한)
+    - 기록 오류는 다음 묶음 제출 / close()에서 다시 발생 (오류 뒤 남은 묶음은 버려 생성 쪽이 막히지 않게 한다)
+    """
+
+    def __init__(self, threads: int):
+        self._queues = [queue.Queue(maxsize=WRITE_QUEUE_BATCHES) for _ in range(threads)]
+        self._threads = [
+            threading.Thread(target=self._run, args=(tasks,), name=f"writer-{index}", daemon=True)
+            for index, tasks in enumerate(self._queues)
+        ]
+        self._writers: List[BackgroundWriter] = []
+        self._error: Optional[BaseException] = None
+        for thread in self._threads:
+            thread.start()
+
+    def writer(self, writer) -> BackgroundWriter:
+        background = BackgroundWriter(self, self._queues[len(self._writers) % len(self._queues)], writer)
+        self._writers.append(background)
+        return background
+
+    def _run(self, tasks: "queue.Queue"):
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            if self._error is not None:
+                continue
+            fn, arg = task
+            try:
+                fn(arg)
+            except BaseException as e:
+                self._error = e
+
+    def check(self):
+        if self._error is not None:
+            raise RuntimeError("백그라운드 행 기록 실패") from self._error
+
+    def close(self):
+        """대기 중인 행을 모두 기록하고 스레드 종료 (파일을 닫기 전에 호출)"""
+        for writer in self._writers:
+            if self._error is None:
+                writer.flush()
+        for tasks in self._queues:
+            tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+        self.check()
+
+
+class RowSink(ABC):
+    """
+    테이블별 행 출력 (sink) 공통 인터페이스
+    - write_rows(name, rows): 행 묶음 기록 (행 단위로 만드는 단계는 generator가 묶어서 넘긴다)
+    - write_block(name, columns): 컬럼 묶음 기록 (길이가 같은 컬럼 시퀀스 목록, 컬럼형 sink는 그대로 사용)
+    - row_counts / file_stats / close()
+    - file_output: 파일로 기록하는 sink인지 (manifest / part 파일 통계 대상)
+    - writer_threads > 0이면 행 포맷 / 파일 기록을 WriterPool 스레드가 맡는다 (close()는 finish_writers()부터)
+    """
+
+    file_output = False
+
+    def __init__(self, writer_threads: int = 0):
+        self.writers: Dict[str, CountingWriter] = {}
+        self.background: Dict[str, BackgroundWriter] = {}
+        self.writer_pool = WriterPool(writer_threads) if writer_threads > 0 else None
+
+    def add_writer(self, name: str, writer):
+        if self.writer_pool is not None:
+            writer = self.background[name] = self.writer_pool.writer(writer)
+        self.writers[name] = CountingWriter(writer)
+
+    def run_in_writer(self, name: str, fn, arg):
+        """테이블 행 순서에 맞춰 fn(arg) 실행 (writer 스레드가 있으면 그 스레드에서)"""
+        background = self.background.get(name)
+        if background is None:
+            fn(arg)
+        else:
+            background.submit(fn, arg)
+
+    def finish_writers(self):
+        if self.writer_pool is not None:
+            pool, self.writer_pool = self.writer_pool, None
+            pool.close()
+
+    def write_rows(self, name: str, rows):
+        self.writers[name].writerows(rows)
+
+    def write_block(self, name: str, columns: Sequence[Sequence[Any]]):
+        self.writers[name].writerows(list(zip(*columns)))
+
+    @property
+    def row_counts(self) -> Dict[str, int]:
+        return {name: writer.rows for name, writer in self.writers.items()}
+
+    @property
+    def file_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+
+    @abstractmethod
+    def close(self):
+        """대기 중인 행을 모두 기록하고 출력을 닫는다 (sink마다 구현)"""
+
+
+class CSVWriterManager(RowSink):
+
+    file_output = True
+
+    def __init__(
+        self,
+        tables: Optional[List[str]] = None,
+        part: Optional[int] = None,
+        copy_format: str = "csv",
+        compression: str = "none",
+        writer_threads: int = 0
+    ):
+        """
+        - tables: 열 테이블 목록 (기본: 전체)
+        - part: 지정 시 샤드 part 파일(<table>.part-NNNNN.csv)로 기록
+        - copy_format: binary면 BINARY_COPY_TABLES를 <table>.bin (PostgreSQL binary COPY)으로 기록
+        - compression: gzip / zstd면 <table>.csv.gz / .csv.zst로 압축 기록 (파일별 백그라운드 압축 스레드)
+        - writer_threads: 행 포맷 / 파일 기록을 맡는 백그라운드 스레드 수 (0: 생성 스레드에서 바로 기록)
+        """
+        if copy_format not in COPY_FORMATS:
+            raise ValueError(f"copy_format must be one of {COPY_FORMATS}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}")
+
+        super().__init__(writer_threads)
         os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-        self.files = {
-            'member': self._open('member.csv'),
-            'social_account': self._open('social_account.csv'),
-            'subscription': self._open('subscription.csv'),
-            'subscription_key': self._open('subscription_key.csv'),
-            'notification_allow': self._open('notification_allow.csv'),
-            'family': self._open('family.csv'),
-            'family_sub': self._open('family_sub.csv'),
-            'family_apply': self._open('family_apply.csv'),
-            'family_apply_target': self._open('family_apply_target.csv'),
-            'block_policy': self._open('block_policy.csv'),
-            'policy_sub': self._open('policy_sub.csv'),
-            'blocked_service_sub': self._open('blocked_service_sub.csv'),
-            'present_data': self._open('present_data.csv'),
-            'notification': self._open('notification.csv'),
-        }
+        self.files = {}
+        self.filenames = {}
+        self.raw_files = {}
+        self.binary_writers = {}
 
-        self.writers = {k: csv.writer(v) for k, v in self.files.items()}
+        tables = tables or TABLE_NAMES
+        if part is None:
+            # 이번 실행에서 열지 않는 테이블(원장 없는 data_usage 등)의 이전 본 파일은 적재되지 않게 지운다
+            for name in TABLE_NAMES:
+                if name not in tables:
+                    remove_stale_main_file(name)
 
-    def _open(self, filename):
-        return open(
-            os.path.join(OUTPUT_DIR, filename),
-            'w',
-            newline='',
-            encoding='utf-8',
-            buffering=1024*1024
-        )
+        for name in tables:
+            binary = uses_binary(name, copy_format)
+            ext = (".bin" if binary else ".csv") + COMPRESSION_SUFFIXES.get(compression, "")
+            if part is None:
+                remove_stale_main_file(name, ext)
 
-    def writer(self, name):
-        return self.writers[name]
+            filename = f"{name}{ext}" if part is None else part_filename(name, part, ext)
+
+            # manifest 바이트 수 / sha256은 디스크에 기록되는 (압축된) 파일 기준
+            raw = HashingFileIO(os.path.join(OUTPUT_DIR, filename))
+            stream = raw if compression == "none" else CompressingFileIO(raw, compression)
+            f = io.BufferedWriter(stream, buffer_size=FILE_BUFFER_SIZE)
+
+            if binary:
+                self.binary_writers[name] = BinaryCopyWriter(f, BINARY_COPY_TABLES[name])
+                self.add_writer(name, self.binary_writers[name])
+            else:
+                f = io.TextIOWrapper(f, encoding='utf-8', newline='')
+                self.add_writer(name, text_writer(name, f))
+            self.files[name] = f
+            self.filenames[name] = filename
+            self.raw_files[name] = raw
+
+    @property
+    def file_stats(self) -> Dict[str, Dict[str, Any]]:
+        """파일명별 행 수 / 바이트 수 / sha256 (manifest의 files 항목, close() 이후 확정)"""
+        return {
+            self.filenames[name]: {
+                "rows": writer.rows,
+                "bytes": self.raw_files[name].bytes,
+                "sha256": self.raw_files[name].sha256.hexdigest(),
+            }
+            for name, writer in self.writers.items()
+        }
 
     def close(self):
-        for f in self.files.values():
-            f.close()
+        try:
+            self.finish_writers()
+        finally:
+            for writer in self.binary_writers.values():
+                writer.finish()
+            for f in self.files.values():
+                f.close()
+
+
+def open_writer_manager(
+    output: str = "csv",
+    tables: Optional[List[str]] = None,
+    part: Optional[int] = None,
+    copy_format: str = "csv",
+    compression: str = "none",
+    writer_threads: int = 0
+) -> RowSink:
+    """출력 방식(SINKS)에 맞는 sink 생성"""
+    if output not in SINKS:
+        raise ValueError(f"output must be one of {OUTPUT_MODES}")
+    module_name, class_name = SINKS[output]
+    sink_class = getattr(importlib.import_module(module_name), class_name)
+    return sink_class(
+        tables=tables, part=part, copy_format=copy_format, compression=compression, writer_threads=writer_threads
+    )
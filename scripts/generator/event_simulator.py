@@ -0,0 +1,422 @@
+import calendar
+import random
+from array import array
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from generator.constants import *
+from generator.subscription_store import SubscriptionStore
+from generator.timestamps import DAY_SECONDS, to_epoch
+
+# ======================================================
+# Time-series event simulator (--event-days)
+# ======================================================
+#
+# 기간 [시작일, 시작일 + N일) 동안 회선별 이벤트를 시간 순으로 재생해 알림을 만든다.
+# - 시간 차단 정책: 활성 policy_sub 스냅샷(days/startTime/endTime)을 날마다 재생 → APPLIED / RELEASED 쌍
+# - 데이터 사용량: 요금제 제공량 대비 일별 사용량을 누적 → 잔여 50/30/10% / 소진 알림 (무제한 요금제 제외)
+#   (--usage-ledger면 가족 공유 데이터까지 반영한 usage_ledger 원장 기준)
+# - 회선 약 EVENT_CHUNK_SIZE개(가족 단위 경계) 청크로 생성 (청크별 난수 스트림 / notification_id 구간 고정, 메모리는 청크 크기만큼)
+# - 기준 시각(now()) 이후 이벤트는 만들지 않는다
+
+WEEK_DAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]  # datetime.weekday() 순서
+
+DAY_MINUTES = 24 * 60
+
+# 사용량 임계 (누적 사용 비율, 알림 타입, 메시지)
+USAGE_THRESHOLDS = [
+    (0.5, NotificationType.SINGLE_USAGE_THRESHOLD_50, "데이터 잔여량이 50% 남았습니다."),
+    (0.7, NotificationType.SINGLE_USAGE_THRESHOLD_30, "데이터 잔여량이 30% 남았습니다."),
+    (0.9, NotificationType.SINGLE_USAGE_THRESHOLD_10, "데이터 잔여량이 10% 남았습니다."),
+    (1.0, NotificationType.SINGLE_USAGE_EXHAUSTED, "데이터를 모두 사용했습니다."),
+]
+
+# 회선별 사용 강도 (제공량을 기간에 고르게 쓰면 1.0) / 일별 변동 폭
+USAGE_INTENSITY_RANGE = (0.3, 1.6)
+USAGE_DAILY_RANGE = (0.2, 1.8)
+
+# 사용 시간대 08:00~24:00 (임계 도달 시각은 이 구간에 선형 배분)
+USAGE_ACTIVE_START = 8 * 60 * 60
+USAGE_ACTIVE_SECONDS = 16 * 60 * 60
+
+
+def week_mask(days: Sequence[str]) -> int:
+    """요일 목록 → 비트마스크 (MONDAY = bit 0)"""
+    mask = 0
+    for day in days:
+        mask |= 1 << WEEK_DAYS.index(day)
+    return mask
+
+
+def week_bitmap(day_mask: int, start_min: int, end_min: int) -> int:
+    """
+    요일 비트마스크 + 시간대 → 주간 분 단위 비트맵 (bit = 요일 * 1440 + 분, [시작, 종료) 구간)
+    - 시간대가 겹치는지는 비트맵 AND 한 번으로 판정
+    """
+    window = ((1 << (end_min - start_min)) - 1) << start_min
+    bitmap = 0
+    for day in range(len(WEEK_DAYS)):
+        if day_mask >> day & 1:
+            bitmap |= window << (day * DAY_MINUTES)
+    return bitmap
+
+
+class PolicySchedules:
+    """
+    활성 시간 차단 정책 (policy_sub.is_active = true) 스케줄, 이벤트 시뮬레이터 입력
+    - 매핑 1건: sub_id, 요일 비트마스크, 시작/종료 분, 정책 생성 시각(epoch), 정책 이름 인덱스
+    - 가족 순서로 쌓이므로 회선별 조회는 group_by_subscription으로 묶는다
+    """
+
+    def __init__(self):
+        self.sub_ids = array('q')
+        self.day_masks = array('B')
+        self.start_mins = array('H')
+        self.end_mins = array('H')
+        self.created = array('q')
+        self.name_ids = array('I')
+        self.names: List[str] = []
+        self.name_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.sub_ids)
+
+    def _name_id(self, name: str) -> int:
+        name_id = self.name_index.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.name_index[name] = name_id
+        return name_id
+
+    def add(self, sub_id: int, day_mask: int, start_min: int, end_min: int, name: str, created: int):
+        """created: 정책 생성 시각 (epoch 초)"""
+        self.sub_ids.append(sub_id)
+        self.day_masks.append(day_mask)
+        self.start_mins.append(start_min)
+        self.end_mins.append(end_min)
+        self.created.append(created)
+        self.name_ids.append(self._name_id(name))
+
+    def group_by_subscription(self, first_sub_id: int, count: int) -> Tuple[array, array]:
+        """
+        sub_id 기준 CSR (계수 정렬, 회선 내 순서 유지)
+        - sub_id의 매핑: order[offsets[sub_id - first_sub_id]:offsets[sub_id - first_sub_id + 1]]
+        """
+        offsets = array('q', bytes(8 * (count + 1)))
+        for sub_id in self.sub_ids:
+            offsets[sub_id - first_sub_id + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array('q', offsets[:-1])
+        order = array('q', bytes(8 * len(self.sub_ids)))
+        for entry, sub_id in enumerate(self.sub_ids):
+            position = sub_id - first_sub_id
+            order[cursor[position]] = entry
+            cursor[position] += 1
+        return offsets, order
+
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            "sub_ids": self.sub_ids,
+            "day_masks": self.day_masks,
+            "start_mins": self.start_mins,
+            "end_mins": self.end_mins,
+            "created": self.created,
+            "names": self.names,
+            "name_ids": self.name_ids,
+        }
+
+    def merge_state(self, state: Dict[str, Any]):
+        for column in ("sub_ids", "day_masks", "start_mins", "end_mins", "created"):
+            getattr(self, column).extend(state[column])
+        name_ids = [self._name_id(name) for name in state["names"]]
+        self.name_ids.extend(name_ids[name_id] for name_id in state["name_ids"])
+
+
+# ======================================================
+# 기간 / 청크 계획
+# ======================================================
+
+def plan_event_range(start: datetime, days: int, until: datetime) -> Dict[str, Any]:
+    """
+    시뮬레이션 기간 [start 0시, + days일) ∩ [.., until)
+    - days: 날짜별 (0시 epoch, 요일, 월 키, 일, 그 달의 일 수)
+    - mask_days: 요일 비트마스크별 기간 내 해당 요일 수 (notification_id 구간 산정용)
+    """
+    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = min(start + timedelta(days=days), until)
+    if end <= start:
+        raise ValueError(f"event range is empty: {start} ~ {end} (기준 시각 {until} 이전이어야 합니다)")
+
+    day_list = []
+    day = start
+    while day < end:
+        month_days = calendar.monthrange(day.year, day.month)[1]
+        day_list.append((to_epoch(day), day.weekday(), day.year * 12 + day.month, day.day, month_days))
+        day += timedelta(days=1)
+
+    weekday_counts = [0] * 7
+    for _, weekday, _, _, _ in day_list:
+        weekday_counts[weekday] += 1
+
+    return {
+        "start": to_epoch(start),
+        "end": to_epoch(end),
+        "days": day_list,
+        "months": len({month for _, _, month, _, _ in day_list}),
+        "mask_days": [
+            sum(count for weekday, count in enumerate(weekday_counts) if mask >> weekday & 1)
+            for mask in range(1 << 7)
+        ],
+    }
+
+
+def usage_event_limit(plan: Dict[str, Any], event_range: Dict[str, Any]) -> int:
+    """회선당 사용량 알림 상한 (기간별 임계 수 × 기간 수)"""
+    if plan["amount"] == -1:
+        return 0
+    periods = len(event_range["days"]) if plan["period"] == "DAY" else event_range["months"]
+    return len(USAGE_THRESHOLDS) * periods
+
+
+def family_positions(subscriptions: SubscriptionStore) -> Tuple[array, array]:
+    """
+    회선 위치(sub_id - first_sub_id) → FamilyIndex 가족 인덱스 / 구성원 인덱스 (비가족은 -1)
+    - 가족 구성원은 sub_id가 연속이라 (generate_family가 가족 순서대로 회선 발급) 청크 경계를 가족 단위로 맞출 수 있다
+    """
+    families = subscriptions.families
+    family_of = array('q', [-1]) * len(subscriptions)
+    member_of = array('q', [-1]) * len(subscriptions)
+    for i in range(len(families)):
+        for member in range(families.offsets[i], families.offsets[i + 1]):
+            position = families.members[member] - subscriptions.first_sub_id
+            family_of[position] = i
+            member_of[position] = member
+    return family_of, member_of
+
+
+def plan_event_chunks(
+    subscriptions: SubscriptionStore,
+    schedules: PolicySchedules,
+    offsets: Sequence[int],
+    order: Sequence[int],
+    family_of: Sequence[int],
+    event_range: Dict[str, Any],
+    notification_start: int,
+    data_usage_start: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    회선 약 EVENT_CHUNK_SIZE개 단위 청크 (가족이 두 청크로 나뉘지 않게 경계를 가족 끝까지 늘린다)
+    - notification_id 구간: 청크 알림 상한(정책 발생일 × 2 + 사용량 임계)만큼, 적게 만든 구간은 비워 둔다
+    - data_usage_id 구간: 사용량 원장(--usage-ledger)일 때 회선당 하루 1행
+    - entry_start / entry_end: group_by_subscription order 구간
+    """
+    usage_limits = {plan_id: usage_event_limit(plan, event_range) for plan_id, plan in PLANS.items()}
+    mask_days = event_range["mask_days"]
+    total = len(subscriptions)
+
+    chunks = []
+    offset = 0
+    while offset < total:
+        chunk_end = min(offset + EVENT_CHUNK_SIZE, total)
+        while chunk_end < total and family_of[chunk_end] != -1 and family_of[chunk_end] == family_of[chunk_end - 1]:
+            chunk_end += 1
+        count = chunk_end - offset
+        entry_start, entry_end = offsets[offset], offsets[chunk_end]
+
+        limit = sum(usage_limits[plan_id] for plan_id in subscriptions.plan_ids[offset:chunk_end])
+        limit += 2 * sum(mask_days[schedules.day_masks[entry]] for entry in order[entry_start:entry_end])
+        chunk = {
+            "index": len(chunks),
+            "offset": offset,
+            "count": count,
+            "entry_start": entry_start,
+            "entry_end": entry_end,
+            "notification_start": notification_start,
+            "notification_end": notification_start + limit,
+        }
+        notification_start += limit
+        if data_usage_start is not None:
+            rows = count * len(event_range["days"])
+            chunk.update(data_usage_start=data_usage_start, data_usage_end=data_usage_start + rows)
+            data_usage_start += rows
+        chunks.append(chunk)
+        offset = chunk_end
+    return chunks
+
+
+def event_chunk_payload(
+    subscriptions: SubscriptionStore,
+    schedules: PolicySchedules,
+    order: Sequence[int],
+    chunk: Dict[str, Any],
+    family_of: Optional[Sequence[int]] = None,
+    member_of: Optional[Sequence[int]] = None
+) -> Dict[str, Any]:
+    """
+    청크 워커 입력 (청크 회선의 요금제/개통 시각과 sub_id 순 정책 매핑만 잘라서 전달)
+    - family_of / member_of 지정 시(사용량 원장) 청크 가족의 공유 데이터, 구성원 priority / data_limit 포함
+    """
+    offset, count = chunk["offset"], chunk["count"]
+    payload = dict(
+        chunk,
+        first_sub_id=subscriptions.first_sub_id + offset,
+        plan_ids=subscriptions.plan_ids[offset:offset + count],
+        created=subscriptions.created[offset:offset + count],
+        entries=[
+            (
+                schedules.sub_ids[entry],
+                schedules.day_masks[entry],
+                schedules.start_mins[entry],
+                schedules.end_mins[entry],
+                schedules.created[entry],
+                schedules.names[schedules.name_ids[entry]],
+            )
+            for entry in order[chunk["entry_start"]:chunk["entry_end"]]
+        ],
+    )
+    if family_of is None:
+        return payload
+
+    families = subscriptions.families
+    local: Dict[int, int] = {}
+    family_local = array('q')
+    member_priorities = array('b')
+    member_limits = array('q')
+    family_amounts = array('q')
+    family_priority = array('b')
+    for position in range(offset, offset + count):
+        i = family_of[position]
+        if i == -1:
+            family_local.append(-1)
+            member_priorities.append(0)
+            member_limits.append(0)
+            continue
+        if i not in local:
+            local[i] = len(family_amounts)
+            family_amounts.append(families.data_amounts[i])
+            family_priority.append(families.is_priority(i))
+        family_local.append(local[i])
+        member_priorities.append(families.member_priorities[member_of[position]])
+        member_limits.append(families.member_limits[member_of[position]])
+
+    payload.update(
+        family_local=family_local,
+        member_priorities=member_priorities,
+        member_limits=member_limits,
+        family_amounts=family_amounts,
+        family_priority=family_priority,
+    )
+    return payload
+
+
+# ======================================================
+# 시뮬레이션
+# ======================================================
+
+def _policy_events(events: List[Tuple[int, NotificationType, str]], entry, sub_created: int, event_range: Dict[str, Any]):
+    """정책 요일마다 시작 시각 APPLIED / 종료 시각 RELEASED (기간 끝을 넘긴 해제는 생략: 적용 중)"""
+    _, mask, start_min, end_min, policy_created, name = entry
+    not_before = max(sub_created, policy_created)
+    end = event_range["end"]
+    applied = f"“{name}” 시간 차단 정책이 적용되었습니다"
+    released = f"“{name}” 시간 차단 정책이 해제되었습니다"
+
+    for day_start, weekday, _, _, _ in event_range["days"]:
+        if not mask >> weekday & 1:
+            continue
+        applied_at = day_start + start_min * 60
+        if applied_at < not_before or applied_at >= end:
+            continue
+        events.append((applied_at, NotificationType.TIME_WINDOW_POLICY_APPLIED, applied))
+        released_at = day_start + end_min * 60
+        if released_at < end:
+            events.append((released_at, NotificationType.TIME_WINDOW_POLICY_RELEASED, released))
+
+
+def _usage_events(
+    events: List[Tuple[int, NotificationType, str]],
+    plan: Dict[str, Any],
+    sub_created: int,
+    event_range: Dict[str, Any],
+    rng: random.Random
+):
+    """
+    요금제 기간(월/일)별 누적 사용량이 임계를 넘는 시각에 알림
+    - 기간 시작 전에 이미 지난 월 초 사용분은 채워 두고, 그 사이 넘은 임계는 알림 없이 건너뛴다
+    """
+    amount = plan["amount"]
+    if amount == -1:
+        return
+
+    daily = plan["period"] == "DAY"
+    intensity = rng.uniform(*USAGE_INTENSITY_RANGE)
+    end = event_range["end"]
+    period = None
+    used = 0.0
+    passed = 0
+
+    for day_start, _, month, day_of_month, month_days in event_range["days"]:
+        if day_start + DAY_SECONDS <= sub_created:
+            continue
+
+        daily_mean = amount * intensity if daily else amount * intensity / month_days
+        key = day_start if daily else month
+        if key != period:
+            period = key
+            used = 0.0
+            if not daily:
+                elapsed_days = min(day_of_month - 1, max(0, (day_start - sub_created) // DAY_SECONDS))
+                used = daily_mean * elapsed_days
+            passed = 0
+            while passed < len(USAGE_THRESHOLDS) and used >= USAGE_THRESHOLDS[passed][0] * amount:
+                passed += 1
+
+        if passed == len(USAGE_THRESHOLDS):
+            continue
+
+        usage = daily_mean * rng.uniform(*USAGE_DAILY_RANGE)
+        while passed < len(USAGE_THRESHOLDS):
+            ratio, noti_type, message = USAGE_THRESHOLDS[passed]
+            crossing = ratio * amount
+            if used + usage < crossing:
+                break
+            at = day_start + USAGE_ACTIVE_START + int(USAGE_ACTIVE_SECONDS * (crossing - used) / usage)
+            if at >= end or at < sub_created:
+                break
+            events.append((at, noti_type, message))
+            passed += 1
+        used += usage
+
+
+def simulate_chunk(
+    chunk: Dict[str, Any],
+    event_range: Dict[str, Any],
+    rng: random.Random,
+    usage_events: Optional[Dict[int, List[Tuple[int, NotificationType, str]]]] = None
+) -> Iterator[Tuple[int, List[Tuple[int, NotificationType, str]]]]:
+    """
+    청크 회선별 이벤트 (sub_id, [(epoch, 알림 타입, 메시지), ...] 시간 순), 이벤트 없는 회선은 생략
+    - usage_events: 사용량 원장이 만든 회선 위치별 임계 알림 (지정 시 _usage_events 대신 사용)
+    """
+    entries = chunk["entries"]
+    entry = 0
+    for position, plan_id in enumerate(chunk["plan_ids"]):
+        sub_id = chunk["first_sub_id"] + position
+        sub_created = chunk["created"][position]
+        events: List[Tuple[int, NotificationType, str]] = []
+
+        while entry < len(entries) and entries[entry][0] == sub_id:
+            _policy_events(events, entries[entry], sub_created, event_range)
+            entry += 1
+        if usage_events is None:
+            _usage_events(events, PLANS[plan_id], sub_created, event_range, rng)
+        else:
+            events.extend(usage_events.get(position, ()))
+
+        if events:
+            events.sort(key=itemgetter(0))
+            yield sub_id, events
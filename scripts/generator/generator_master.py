@@ -1,51 +1,180 @@
-import json
+import argparse
 import os
 import random
 import time
-import uuid
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 
 from generator.constants import *
 from generator.utils import *
 from generator.csv_writer import *
+from generator.sharding import *
+from generator.manifest import write_manifest, remove_manifest
+from generator.phone_allocator import PhoneAllocator
+from generator.subscription_store import SubscriptionStore
+from generator.timestamps import to_epoch, from_epoch
+from generator.scale import parse_scale, resolve_scale, scale_for_users
+from generator.append_base import APPEND_SOURCES, append_seed, default_next_ids, load_append_base, unwrap_bucket_keys
+from generator.crypto_batch import CRYPTO_BLOCK_SIZE, crypto_backend, encrypt_phone_block
+from generator.event_simulator import (
+    PolicySchedules,
+    family_positions,
+    plan_event_range,
+    plan_event_chunks,
+    event_chunk_payload,
+    simulate_chunk,
+)
+from generator.policy_snapshot import PolicySnapshot
+
+# 사용자 행 생성 엔진: python (write_user 행 단위) | numpy (numpy_engine 블록 단위)
+ENGINES = ("python", "numpy")
+
+# 행 단위로 만드는 단계의 기록 묶음 크기 (테이블별로 모았다가 sink write_rows로 한 번에 기록)
+ROW_BLOCK_SIZE = 4096
+
+# 사용자/가족 샤드가 기록하는 테이블
+USER_SHARD_TABLES = [
+    'member',
+    'social_account',
+    'subscription',
+    'subscription_key',
+    'notification_allow',
+    'family',
+    'family_sub',
+    'notification',
+]
+
+# 사용자 단계 이후 서로 독립인 단계 → 기록 테이블
+# (공유 상태는 읽기만 하고 notification_id는 단계별 구간을 쓰므로 워커에서 동시에 실행 가능)
+INDEPENDENT_STAGE_TABLES = {
+    "policy_sub": ['block_policy', 'policy_sub', 'notification'],
+    "blocked_service_sub": ['blocked_service_sub', 'notification'],
+    "present_data": ['present_data', 'notification'],
+}
+
+# 이벤트 시뮬레이터 알림 읽음 처리: 기준 시각 EVENT_READ_AFTER_DAYS일 이전 알림은 대부분 읽음
+EVENT_READ_AFTER_DAYS = 3
+EVENT_READ_RATES = (0.9, 0.3)   # (이전, 최근)
+
+# 테이블 → 다음 ID 시퀀스 속성 (manifest next_ids, append 모드 기준 ID)
+SEQ_ATTRS = {
+    "member": "member_seq",
+    "social_account": "social_seq",
+    "subscription": "subscription_seq",
+    "notification_allow": "notification_allow_seq",
+    "family": "family_seq",
+    "family_sub": "family_sub_seq",
+    "family_apply": "family_apply_seq",
+    "family_apply_target": "family_apply_target_seq",
+    "block_policy": "block_policy_seq",
+    "policy_sub": "policy_sub_seq",
+    "blocked_service_sub": "blocked_service_sub_seq",
+    "present_data": "present_data_seq",
+    "notification": "notification_seq",
+    "data_usage": "data_usage_seq",
+}
 
 # ======================================================
 # Bulk Data Generator
 # ======================================================
 
 class BulkDataGenerator:
-    def __init__(self):
-        self.csv = CSVWriterManager()
-
-        self.member_seq = 1
-        self.subscription_seq = 1
-        self.subscription_key_seq = 1
-        self.social_seq = 1
-        self.family_seq = 1
-        self.family_sub_seq = 1
-        self.family_apply_seq = 1
-        self.family_apply_target_seq = 1
-        # 1~N은 sql/03_insert_master_data.sql의 관리자 템플릿 정책이 사용
-        # 더미에서 생성하는 가족별 정책은 그 다음 ID부터 사용
-        self.block_policy_seq = len(block_policies) + 1
-        self.policy_sub_seq = 1
-        self.blocked_service_sub_seq = 1
-        self.present_data_seq = 1
-        self.notification_seq = 1
-        self.notification_allow_seq = 1
-
-        self.phone_seq = 0
-        self.used_phones = set()
-
-        self.subscription_member_map: Dict[int, str] = {}
-        self.subscription_plan_map: Dict[int, Dict[str, Any]] = {}
-        self.subscription_created_map: Dict[int, datetime] = {}
-        self.family_subscriptions: List[Dict[str, Any]] = []
-        self.non_family_subscriptions: List[int] = []
-        self.bucket_active_key_cache: Dict[int, Dict[str, Any]] = {}
+    def __init__(
+        self,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        csv: Optional[RowSink] = None,
+        base_time: Optional[datetime] = None,
+        output: str = "csv",
+        copy_format: str = "csv",
+        compression: str = "none",
+        writer_threads: int = 0,
+        engine: str = "python",
+        crypto_workers: int = 1,
+        scale: Optional[Dict[str, Any]] = None,
+        base: Optional[Dict[str, Any]] = None,
+        event_days: int = 0,
+        event_start: Optional[datetime] = None,
+        usage_ledger: bool = False,
+        reproducible_keys: bool = False
+    ):
+        self.workers = max(1, int(workers))
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2 ** 63)
+        self.base_time = base_time
+        self.output = output
+        self.copy_format = copy_format
+        self.compression = compression
+        self.writer_threads = max(0, int(writer_threads))
+        self.engine = engine
+        self.crypto_workers = max(1, int(crypto_workers))
+        # 버킷 DEK: 기본은 get_random_bytes, --reproducible-keys면 KEK에서 HKDF 파생 (seed만으로는 복원 불가)
+        self.reproducible_keys = reproducible_keys
+        # 규모 설정 (회원/가족 수, 가족 신청 건수), 기본은 DUMMY_SCALE 환경변수 또는 default
+        self.scale = scale if scale is not None else resolve_scale()
+        self.csv = csv if csv is not None else open_writer_manager(
+            output, tables=output_tables(usage_ledger), copy_format=copy_format, compression=compression,
+            writer_threads=self.writer_threads
+        )
 
+        # numpy 엔진: 사용자 행을 블록 단위로 생성 (numpy는 이 경우에만 import)
+        self.numpy_engine = None
+        self.np_rng = None
+        if engine == "numpy":
+            from generator import numpy_engine
+            self.numpy_engine = numpy_engine
+        elif engine != "python":
+            raise ValueError(f"engine must be one of {ENGINES}")
+
+        # 단계/샤드별 난수 스트림 (run_user_shard / begin_stage에서 교체)
+        self.family_rng = make_rng(self.seed, "family")
+        self.user_rng = make_rng(self.seed, "user")
+        self.crypto_rng = make_rng(self.seed, "crypto")
+        self.notification_rng = make_rng(self.seed, "notification")
+
+        # append 모드 기준 상태 (append_base: next_ids / key_buckets / phone_seed), None이면 빈 DB 기준 전체 생성
+        self.base = base
+        # 테이블별 시작 ID (block_policy 1~N은 sql/03_insert_master_data.sql의 관리자 템플릿 정책)
+        self.next_ids: Dict[str, int] = dict(base["next_ids"]) if base else default_next_ids()
+        for table, attr in SEQ_ATTRS.items():
+            setattr(self, attr, self.next_ids[table])
+        # 단계별 notification_id 구간 [시작, 끝) (generate_users 이후 확정)
+        self.notification_ranges: Dict[str, Tuple[int, int]] = {}
+        self.notification_limit: Optional[int] = None
+        # 다음 part 파일 번호 (사용자 샤드 다음부터 독립 단계 워커가 사용)
+        self.next_part = 0
+
+        # 회선 번호: sub_id 기반 순열 (발급 이력 없이 중복 없음, append 모드는 기존 데이터셋의 순열 사용)
+        self.phone_seed = base["phone_seed"] if base else self.seed
+        self.phone_allocator = PhoneAllocator(self.phone_seed)
+
+        # 후속 단계용 회선/가족 정보 (sub_id 인덱스 컬럼 저장소)
+        self.subscriptions = SubscriptionStore(self.next_ids["subscription"])
+        self.bucket_active_key_cache: Dict[int, Dict[str, Any]] = {}
+        # 일괄 암호화 대기 중인 subscription 행 / 암호화 프로세스 풀 (--crypto-workers)
+        self.pending_subscriptions: List[List[Any]] = []
+        # 테이블별 기록 대기 행 (queue_row / flush_rows)
+        self.pending_rows: Dict[str, List[List[Any]]] = {}
+        self.crypto_executor: Optional[ProcessPoolExecutor] = None
+        # 샤드 워커가 기록한 part 파일별 / 테이블별 행 수 (manifest, 적재 검증용)
+        self.part_file_stats: Dict[str, Dict[str, Any]] = {}
+        self.part_row_counts: Dict[str, int] = {}
+        # 이벤트 시뮬레이터 (--event-days, 0이면 미실행): 기간과 policy_sub 단계가 남기는 활성 정책 스케줄
+        self.event_days = max(0, int(event_days))
+        self.event_start = event_start
+        self.schedules: Optional[PolicySchedules] = PolicySchedules() if self.event_days else None
+        self.event_range: Optional[List[str]] = None
+        # 사용량 원장 (--usage-ledger): data_usage 행과 사용량 임계 알림을 가족 공유 데이터까지 반영해 생성 (numpy는 이 경우에만 import)
+        self.usage_ledger = None
+        if usage_ledger:
+            from generator import usage_ledger as usage_ledger_module
+            self.usage_ledger = usage_ledger_module
+        # 단계별 실행 시간(초), generate() 완료 후 manifest
+        self.stage_seconds: Dict[str, float] = {}
+        self.manifest: Dict[str, Any] = {}
+
+        # 관리자 템플릿 (스냅샷은 PolicySnapshot으로 한 번만 만들어 가족 정책이 공유)
         self.block_policy_map = {
-            idx + 1: p for idx, p in enumerate(block_policies)
+            idx + 1: {**p, "snapshot": PolicySnapshot(p["snapshot"])} for idx, p in enumerate(block_policies)
         }
 
         self.app_code_to_id: Dict[str, int] = {code: idx + 1 for idx, (_, code) in enumerate(APP_BLOCKED_SERVICES)}
@@ -55,15 +184,11 @@ class BulkDataGenerator:
     #  1️⃣ USER 생성
     # ======================================================
 
-    def generate_unique_phone(self) -> str:
-        while True:
-            n = random.randint(0, 99_999_999)
-            phone = f"010-{n // 10_000:04d}-{n % 10_000:04d}"
-            if phone not in self.used_phones:
-                self.used_phones.add(phone)
-                return phone
+    def generate_unique_phone(self, sub_id: int) -> str:
+        return self.phone_allocator.phone(sub_id - 1)
 
     def write_user(self, last_name: Optional[str], role_for_birth: FamilyRole):
+        rng = self.user_rng
 
         member_id = self.member_seq
         self.member_seq += 1
@@ -75,15 +200,15 @@ class BulkDataGenerator:
         self.social_seq += 1
 
         if last_name is None:
-            last_name = rand_last_name()
+            last_name = rand_last_name(rng)
 
-        name = rand_name_with_last(last_name)
-        birth = birth_by_role(role_for_birth)
+        name = rand_name_with_last(last_name, rng)
+        birth = birth_by_role(role_for_birth, rng)
 
-        member_created = rand_datetime_between_years(3)
+        member_created = rand_epoch_between_years(3, rng)
 
         # MEMBER
-        self.csv.writer('member').writerow([
+        self.queue_row('member', [
             member_id, 
             name, 
             birth,
@@ -94,11 +219,11 @@ class BulkDataGenerator:
         ])
 
         # SOCIAL_ACCOUNT
-        provider = random.choice(PROVIDERS)
-        social_id = f"{provider}_{pseudo_uuid_hex(member_id)}"
+        provider = rng.choice(PROVIDERS)
+        social_id = f"{provider}_{pseudo_uuid_hex(member_id, rng)}"
         email = f"user{member_id}@example.com"
 
-        self.csv.writer('social_account').writerow([
+        self.queue_row('social_account', [
             social_id_seq, 
             member_id,
             email, 
@@ -110,42 +235,40 @@ class BulkDataGenerator:
         ])
 
         # SUBSCRIPTION
-        plan_id = random.choice(list(PLANS.keys()))
-        phone_raw = self.generate_unique_phone()
-        bucket_id = sub_id % 1000
+        plan_id = rng.choice(list(PLANS.keys()))
+        phone_raw = self.generate_unique_phone(sub_id)
+        bucket_id = sub_id % KEY_BUCKET_COUNT
         bucket_key = self.bucket_active_key_cache.get(bucket_id)
         if bucket_key is None:
-            dek, encrypted_dek = generate_data_key()
-            key_version = 1
-            self.csv.writer('subscription_key').writerow([
-                self.subscription_key_seq,
+            bucket_key = self.create_bucket_key(bucket_id)
+
+        key_version = bucket_key["version"]
+
+        # 버킷의 첫 회선이 키 이력을 기록 (subscription_key_id == sub_id)
+        if sub_id <= KEY_BUCKET_COUNT:
+            self.queue_row('subscription_key', [
+                sub_id,
                 bucket_id,
                 key_version,
-                encrypted_dek,
+                bucket_key["encrypted_dek"],
                 get_kek_key_id(),
                 'active',
                 member_created,
                 member_created
             ])
-            self.subscription_key_seq += 1
-            bucket_key = {"version": key_version, "dek": dek}
-            self.bucket_active_key_cache[bucket_id] = bucket_key
-        else:
-            dek = bucket_key["dek"]
-            key_version = bucket_key["version"]
 
-        phone_enc = encrypt_with_dek(phone_raw, dek)
-        phone_hash = generate_blind_index(phone_raw)
+        nonce = self.crypto_rng.randbytes(GCM_NONCE_SIZE)
 
-        sub_created = rand_datetime_between(member_created, now())
-        is_locked = random.random() < 0.05
+        sub_created = rand_epoch_between(member_created, now_epoch(), rng)
+        is_locked = rng.random() < 0.05
 
-        self.csv.writer('subscription').writerow([
+        # phone_enc / phone_hash는 블록 단위로 암호화 (flush_subscriptions)
+        self.queue_subscription([
             sub_id, 
             plan_id, 
             member_id,
-            phone_enc, 
-            phone_hash,
+            phone_raw, 
+            nonce,
             bucket_id,
             key_version,
             is_locked,
@@ -154,13 +277,11 @@ class BulkDataGenerator:
             sub_created
         ])
 
-        self.subscription_plan_map[sub_id] = PLANS[plan_id]
-        self.subscription_member_map[sub_id] = name
-        self.subscription_created_map[sub_id] = sub_created
+        self.subscriptions.append(sub_id, plan_id, sub_created, name)
 
         # NOTIFICATION_ALLOW
         for category in NotificationCategory:
-            self.csv.writer('notification_allow').writerow([
+            self.queue_row('notification_allow', [
                 self.notification_allow_seq, 
                 sub_id, 
                 category.value,
@@ -181,44 +302,91 @@ class BulkDataGenerator:
         
         return sub_id
 
+    def queue_row(self, name: str, row: List[Any]):
+        """행을 테이블별 대기 묶음에 추가 (ROW_BLOCK_SIZE마다 sink write_rows로 기록)"""
+        rows = self.pending_rows.get(name)
+        if rows is None:
+            rows = self.pending_rows[name] = []
+        rows.append(row)
+        if len(rows) >= ROW_BLOCK_SIZE:
+            self.csv.write_rows(name, rows)
+            self.pending_rows[name] = []
+
+    def flush_rows(self):
+        """대기 중인 행 묶음을 모두 기록 (단계 / 샤드 / 청크 끝, sink close 전)"""
+        for name, rows in self.pending_rows.items():
+            if rows:
+                self.csv.write_rows(name, rows)
+        self.pending_rows = {}
+
+    def queue_subscription(self, row: List[Any]):
+        """phone_enc / phone_hash 자리에 (전화번호, nonce)를 둔 subscription 행을 적재 대기열에 추가"""
+        self.pending_subscriptions.append(row)
+        if len(self.pending_subscriptions) >= CRYPTO_BLOCK_SIZE:
+            self.flush_subscriptions()
+
+    def flush_subscriptions(self):
+        """대기 중인 subscription 행을 버킷별 일괄 암호화 후 기록 (행 순서 유지)"""
+        rows = self.pending_subscriptions
+        if not rows:
+            return
+
+        phone_enc, phone_hash = encrypt_phone_block(
+            [row[0] for row in rows],
+            [row[3] for row in rows],
+            [row[4] for row in rows],
+            self.bucket_active_key_cache,
+            KEY_BUCKET_COUNT,
+            self.crypto_executor
+        )
+        for row, enc, blind_index in zip(rows, phone_enc, phone_hash):
+            row[3] = enc
+            row[4] = blind_index
+
+        self.csv.write_rows('subscription', rows)
+        self.pending_subscriptions = []
+
+    def write_users(self, last_names: List[Optional[str]], roles: List[FamilyRole]) -> List[int]:
+        """회원 목록 기록 (numpy 엔진은 NUMPY_BLOCK_SIZE 블록 단위), sub_id 목록 반환"""
+        if self.numpy_engine is None:
+            return [self.write_user(last_name, role) for last_name, role in zip(last_names, roles)]
+
+        block_size = self.numpy_engine.NUMPY_BLOCK_SIZE
+        sub_ids: List[int] = []
+        for offset in range(0, len(roles), block_size):
+            sub_ids.extend(self.numpy_engine.write_user_block(
+                self,
+                last_names[offset:offset + block_size],
+                roles[offset:offset + block_size]
+            ))
+        return sub_ids
+
     # ======================================================
     #  2️⃣ FAMILY 생성
     # ======================================================
 
-    def generate_family(self):
-        log_step("가족 생성")
-        total_family_members = 0
-
-        for i in range(TOTAL_FAMILIES):
-            size = random.choices(
-                FAMILY_SIZES,
-                weights=FAMILY_SIZE_WEIGHTS,
-                k=1
-            )[0]
-
-            # 전체 유저 수 초과 방지
-            if total_family_members + size > TOTAL_USERS:
-                size = TOTAL_USERS - total_family_members
+    def generate_family(self, family_sizes: List[int]):
+        rng = self.family_rng
+        # 가족 구성을 먼저 정한 뒤 회원을 한 번에 기록 (family_rng와 user_rng는 서로 독립)
+        members = []
 
-            if size <= 0:
-                break
-
-            family_last = rand_last_name()
-            roles = build_roles(size)
+        for size in family_sizes:
+            family_last = rand_last_name(rng)
+            roles = build_roles(size, rng)
 
             family_data_amount = size * (5 * GB)
 
             priority_type = (
                 PriorityType.PRIORITY
-                if random.random() < PRIORITY_FAMILY_RATE
+                if rng.random() < PRIORITY_FAMILY_RATE
                 else PriorityType.FIFO
             )
 
-            family_created = rand_datetime_between_years(2)
+            family_created = rand_epoch_between_years(2, rng)
 
             family_id = self.family_seq
 
-            self.csv.writer('family').writerow([
+            self.queue_row('family', [
                 family_id,
                 size,
                 family_data_amount,
@@ -230,12 +398,12 @@ class BulkDataGenerator:
 
             if priority_type == PriorityType.PRIORITY:
                 priorities  = list(range(1, size + 1))
-                random.shuffle(priorities )
+                rng.shuffle(priorities )
             else:
                 priorities  = [-1] * size
 
             parent_indexes = [i for i, r in enumerate(roles) if r ==  FamilyRole.PARENT]
-            other_parent_index = random.choice(parent_indexes) if parent_indexes else None
+            other_parent_index = rng.choice(parent_indexes) if parent_indexes else None
 
             for idx, role in enumerate(roles):
                 is_other_parent = (idx == other_parent_index)
@@ -243,71 +411,221 @@ class BulkDataGenerator:
                 last_name = choose_last_name_for_role(
                     role,
                     family_last,
-                    is_other_parent=is_other_parent
+                    is_other_parent=is_other_parent,
+                    rng=rng
                 )
 
-                sub_id = self.write_user(last_name, role)
-
-                family_sub_id = self.family_sub_seq
+                members.append((family_id, role, last_name, priorities[idx], family_data_amount))
 
-                self.csv.writer('family_sub').writerow([
-                    family_sub_id,
-                    sub_id,
-                    family_id,
-                    role.value,
-                    priorities[idx],
-                    family_data_amount
-                ])
+            self.family_seq += 1
 
-                self.family_sub_seq += 1
-                self.family_subscriptions.append({
-                    "family_id": family_id,
-                    "sub_id": sub_id,
-                    "role": role
-                })
+        sub_ids = self.write_users(
+            [last_name for _, _, last_name, _, _ in members],
+            [role for _, role, _, _, _ in members]
+        )
 
-                total_family_members += 1
+        family_members: Dict[int, Tuple[List[int], List[FamilyRole], List[int], int]] = {}
+        for (family_id, role, _, priority, family_data_amount), sub_id in zip(members, sub_ids):
+            family_sub_id = self.family_sub_seq
 
-            self.family_seq += 1
+            self.queue_row('family_sub', [
+                family_sub_id,
+                sub_id,
+                family_id,
+                role.value,
+                priority,
+                family_data_amount
+            ])
 
-            if (i + 1) % 50000 == 0:
-                log_progress("FAMILY_GROUP", i + 1, TOTAL_FAMILIES)
+            self.family_sub_seq += 1
+            family_sub_ids, family_roles, family_priorities, _ = family_members.setdefault(
+                family_id, ([], [], [], family_data_amount)
+            )
+            family_sub_ids.append(sub_id)
+            family_roles.append(role)
+            family_priorities.append(priority)
+
+        for family_id, (family_sub_ids, family_roles, family_priorities, family_data_amount) in family_members.items():
+            # family_sub.data_limit = 가족 공유 데이터 전체
+            self.subscriptions.add_family(
+                family_id, family_sub_ids, family_roles, family_priorities,
+                family_data_amount, [family_data_amount] * len(family_sub_ids)
+            )
 
-        log_done(f"가족 소속 전체 인원: {total_family_members:,}명")
-        return total_family_members
+        return len(members)
 
     # ======================================================
     #  3️⃣ NON FAMILY 생성
     # ======================================================
 
-    def generate_remaining_users(self, already_created_members):
-        log_step("비가족 사용자 생성")
+    def generate_remaining_users(self, count: int):
+        self.subscriptions.add_non_family(
+            self.write_users([None] * count, [FamilyRole.PARENT] * count)
+        )
 
-        remaining = TOTAL_USERS - already_created_members
+    # ======================================================
+    #  USER/FAMILY 샤드 실행
+    # ======================================================
+
+    def create_bucket_key(self, bucket_id: int) -> Dict[str, Any]:
+        if self.reproducible_keys:
+            dek, encrypted_dek = derive_data_key("subscription_key", self.seed, bucket_id)
+        else:
+            dek, encrypted_dek = generate_data_key()
+        bucket_key = {"version": 1, "dek": dek, "encrypted_dek": encrypted_dek, "kek_key_id": get_kek_key_id()}
+        self.bucket_active_key_cache[bucket_id] = bucket_key
+        return bucket_key
+
+    def prepare_bucket_keys(self, total_users: int):
+        # 샤드 워커가 같은 DEK를 쓰도록 버킷 키는 부모에서 미리 발급
+        # (append 모드는 기존 버킷 키를 풀어 쓰고, 처음 쓰는 버킷만 새로 발급)
+        if self.base is not None:
+            self.bucket_active_key_cache.update(unwrap_bucket_keys(self.base["key_buckets"]))
+
+        first_sub_id = self.next_ids["subscription"]
+        last_sub_id = first_sub_id + total_users - 1
+        for sub_id in range(first_sub_id, min(last_sub_id, KEY_BUCKET_COUNT) + 1):
+            if sub_id % KEY_BUCKET_COUNT not in self.bucket_active_key_cache:
+                self.create_bucket_key(sub_id % KEY_BUCKET_COUNT)
+
+        # 키 이력(subscription_key)은 sub_id <= KEY_BUCKET_COUNT 회선이 기록하므로 그 밖의 버킷은 기존 키가 있어야 한다
+        used_buckets = {
+            sub_id % KEY_BUCKET_COUNT
+            for sub_id in range(first_sub_id, first_sub_id + min(total_users, KEY_BUCKET_COUNT))
+        }
+        missing = used_buckets - self.bucket_active_key_cache.keys()
+        if missing:
+            raise RuntimeError(f"기존 데이터셋에 활성 키가 없는 버킷 {len(missing)}개 (subscription_key 확인)")
+
+    def run_user_shard(self, shard: Dict[str, Any]):
+        index = shard["index"]
+        self.family_rng = make_rng(self.seed, "family", index)
+        self.user_rng = make_rng(self.seed, "user", index)
+        self.crypto_rng = make_rng(self.seed, "crypto", index)
+        self.notification_rng = make_rng(self.seed, "notification", "shard", index)
+        if self.numpy_engine is not None:
+            self.np_rng = self.numpy_engine.make_np_rng(self.seed, "user_np", index)
+
+        sub_start = shard["sub_start"]
+        self.member_seq = sub_start
+        self.subscription_seq = sub_start
+        self.social_seq = sub_start
+        self.family_sub_seq = shard["family_sub_start"]
+        self.notification_allow_seq = shard["notification_allow_start"]
+        self.notification_seq = shard["notification_start"]
+
+        if shard["kind"] == "family":
+            self.family_seq = shard["family_start"]
+            self.generate_family(shard["family_sizes"])
+        else:
+            self.generate_remaining_users(shard["user_count"])
 
-        for i in range(remaining):
-            sub_id = self.write_user(None, FamilyRole.PARENT)
-            self.non_family_subscriptions.append(sub_id)
+        self.flush_subscriptions()
+        self.flush_rows()
 
-            if (i + 1) % 100000 == 0:
-                log_progress("NON_FAMILY", i + 1, remaining)
+    def worker_base(self) -> Dict[str, Any]:
+        """워커 generator용 기준 상태 (시작 ID / 전화번호 순열 seed, 버킷 키는 별도 전달)"""
+        return {"next_ids": self.next_ids, "phone_seed": self.phone_seed, "key_buckets": {}}
 
-        log_done(f"비가족 사용자 생성 완료 ({remaining:,}명)")
+    def current_next_ids(self) -> Dict[str, int]:
+        """생성 후 테이블별 다음 ID (manifest, 다음 append의 기준)"""
+        next_ids = {table: getattr(self, attr) for table, attr in SEQ_ATTRS.items()}
+        if self.notification_ranges:
+            next_ids["notification"] = max(end for _, end in self.notification_ranges.values())
+        return next_ids
+
+    def export_user_state(self) -> Dict[str, Any]:
+        return {"subscriptions": self.subscriptions.export_state()}
+
+    def import_part_stats(self, state: Dict[str, Any]):
+        self.part_file_stats.update(state.get("file_stats", {}))
+        for name, rows in state["row_counts"].items():
+            self.part_row_counts[name] = self.part_row_counts.get(name, 0) + rows
+
+    def import_user_state(self, state: Dict[str, Any]):
+        self.import_part_stats(state)
+        self.subscriptions.merge_state(state["subscriptions"])
+
+    def generate_users(self):
+        log_step(f"가족/비가족 사용자 생성 (workers={self.workers})")
+
+        family_sizes = plan_family_sizes(
+            make_rng(self.seed, "family_sizes"),
+            self.scale["total_families"],
+            self.scale["total_users"]
+        )
+        shards = plan_user_shards(family_sizes, self.scale["total_users"], self.next_ids)
+        self.prepare_bucket_keys(self.scale["total_users"])
+
+        if self.workers == 1:
+            if self.crypto_workers > 1:
+                self.crypto_executor = ProcessPoolExecutor(max_workers=self.crypto_workers)
+            try:
+                for done, shard in enumerate(shards, start=1):
+                    self.run_user_shard(shard)
+                    log_progress("USER_SHARD", done, len(shards))
+            finally:
+                if self.crypto_executor is not None:
+                    self.crypto_executor.shutdown()
+                    self.crypto_executor = None
+        else:
+            if self.crypto_workers > 1:
+                log_warn("--workers > 1에서는 샤드 워커가 각자 암호화하므로 --crypto-workers를 사용하지 않습니다")
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = executor.map(
+                    _run_user_shard_worker,
+                    [
+                        (self.seed, now(), self.output, self.copy_format, self.compression, self.writer_threads,
+                         self.engine, self.bucket_active_key_cache, self.worker_base(), shard)
+                        for shard in shards
+                    ]
+                )
+                for done, state in enumerate(results, start=1):
+                    self.import_user_state(state)
+                    log_progress("USER_SHARD", done, len(shards))
+
+        # 이후 단계의 ID는 샤드 구간 다음부터 사용
+        user_count = sum(shard["user_count"] for shard in shards)
+        next_id = self.next_ids["subscription"] + user_count
+        self.member_seq = next_id
+        self.subscription_seq = next_id
+        self.social_seq = next_id
+        self.family_seq = self.next_ids["family"] + len(family_sizes)
+        self.family_sub_seq = self.next_ids["family_sub"] + sum(family_sizes)
+        self.notification_allow_seq = self.next_ids["notification_allow"] + user_count * len(NotificationCategory)
+        self.notification_seq = self.next_ids["notification"] + user_count
+        self.next_part = len(shards)
+
+        families = self.subscriptions.families
+        self.notification_ranges = plan_stage_notification_ranges(
+            self.notification_seq, len(families.members), len(families)
+        )
+
+        log_done(f"가족 {len(family_sizes):,}개 / 가족 소속 {sum(family_sizes):,}명")
+        log_done(f"비가족 사용자 {len(self.subscriptions.non_family):,}명")
 
     # ======================================================
     #  4️⃣ FAMILY_APPLY(CREATE) 생성
     # ======================================================
     
+    def begin_stage(self, stage: str) -> random.Random:
+        """단계 전용 난수 스트림 / notification_id 구간 준비 (알림 event_id 스트림도 단계별로 분리)"""
+        self.notification_rng = make_rng(self.seed, "notification", stage)
+        if stage in self.notification_ranges:
+            self.notification_seq, self.notification_limit = self.notification_ranges[stage]
+        return make_rng(self.seed, stage)
+
     def generate_family_apply_create(self):
         log_step("FAMILY_APPLY(CREATE) 생성")
+        rng = self.begin_stage("family_apply_create")
 
-        candidates = self.non_family_subscriptions[:]
+        candidates = self.subscriptions.non_family_sub_ids()
         if len(candidates) < 2:
             log_warn("비가족 사용자 부족으로 FAMILY_APPLY 생성 스킵")
             return
 
-        random.shuffle(candidates)
-        max_apply = min(random.randint(5, 10), len(candidates))
+        rng.shuffle(candidates)
+        max_apply = min(rng.randint(*self.scale["family_apply_create"]), len(candidates))
         created_apply = 0
         created_target = 0
 
@@ -317,15 +635,16 @@ class BulkDataGenerator:
             requester_sub_id = candidates[idx]
             idx += 1
 
-            apply_created = rand_datetime_between(
-                self.subscription_created_map[requester_sub_id],
-                now()
+            apply_created = rand_epoch_between(
+                self.subscriptions.created_at(requester_sub_id),
+                now_epoch(),
+                rng
             )
 
             status = "PENDING"
 
             family_apply_id = self.family_apply_seq
-            self.csv.writer("family_apply").writerow([
+            self.queue_row("family_apply", [
                 family_apply_id,
                 requester_sub_id,
                 "\\N",      # CREATE 신청은 family_id 없음
@@ -340,7 +659,7 @@ class BulkDataGenerator:
 
             # 요청자 제외 2~8명 타겟
             target_count = min(
-                random.randint(2, 8),
+                rng.randint(2, 8),
                 len(candidates) - idx
             )
             target_pool = []
@@ -350,8 +669,8 @@ class BulkDataGenerator:
                 idx += 1
 
             for target_sub_id in target_pool:
-                target_role = random.choice(["PARENT", "CHILD"])
-                self.csv.writer("family_apply_target").writerow([
+                target_role = rng.choice(["PARENT", "CHILD"])
+                self.queue_row("family_apply_target", [
                     self.family_apply_target_seq,
                     family_apply_id,
                     target_sub_id,
@@ -364,33 +683,32 @@ class BulkDataGenerator:
 
     def generate_family_apply_add(self):
         log_step("FAMILY_APPLY(ADD) 생성")
+        rng = self.begin_stage("family_apply_add")
 
-        family_group_map: Dict[int, List[Dict[str, Any]]] = {}
-        for item in self.family_subscriptions:
-            family_group_map.setdefault(item["family_id"], []).append(item)
-
+        families = self.subscriptions.families
         eligible_families: List[Dict[str, Any]] = []
-        for family_id, members in family_group_map.items():
-            owner = next((m for m in members if m["role"] == FamilyRole.OWNER), None)
-            if owner is None:
+        for i, family_id in enumerate(families.family_ids):
+            owner_sub_id = families.owners[i]
+            if not owner_sub_id:
                 continue
-            if len(members) >= 8:
+            size = families.size(i)
+            if size >= 8:
                 continue
             eligible_families.append({
                 "family_id": family_id,
-                "owner_sub_id": owner["sub_id"],
-                "size": len(members)
+                "owner_sub_id": owner_sub_id,
+                "size": size
             })
 
-        candidates = self.non_family_subscriptions[:]
+        candidates = self.subscriptions.non_family_sub_ids()
         if not eligible_families or not candidates:
             log_warn("ADD 대상 가족/비가족 사용자 부족으로 FAMILY_APPLY(ADD) 생성 스킵")
             return
 
-        random.shuffle(eligible_families)
-        random.shuffle(candidates)
+        rng.shuffle(eligible_families)
+        rng.shuffle(candidates)
 
-        target_apply = min(random.randint(4, 5), len(eligible_families))
+        target_apply = min(rng.randint(*self.scale["family_apply_add"]), len(eligible_families))
         created_apply = 0
         created_target = 0
         idx = 0
@@ -405,13 +723,14 @@ class BulkDataGenerator:
             if max_addable < 1:
                 continue
 
-            apply_created = rand_datetime_between(
-                self.subscription_created_map[requester_sub_id],
-                now()
+            apply_created = rand_epoch_between(
+                self.subscriptions.created_at(requester_sub_id),
+                now_epoch(),
+                rng
             )
 
             family_apply_id = self.family_apply_seq
-            self.csv.writer("family_apply").writerow([
+            self.queue_row("family_apply", [
                 family_apply_id,
                 requester_sub_id,
                 family_id,
@@ -424,13 +743,13 @@ class BulkDataGenerator:
             self.family_apply_seq += 1
             created_apply += 1
 
-            target_count = random.randint(1, max_addable)
+            target_count = rng.randint(1, max_addable)
             for _ in range(target_count):
                 target_sub_id = candidates[idx]
                 idx += 1
 
-                target_role = random.choice(["PARENT", "CHILD"])
-                self.csv.writer("family_apply_target").writerow([
+                target_role = rng.choice(["PARENT", "CHILD"])
+                self.queue_row("family_apply_target", [
                     self.family_apply_target_seq,
                     family_apply_id,
                     target_sub_id,
@@ -443,24 +762,22 @@ class BulkDataGenerator:
 
     def generate_family_apply_remove(self):
         log_step("FAMILY_APPLY(REMOVE) 생성")
+        rng = self.begin_stage("family_apply_remove")
 
-        family_group_map: Dict[int, List[Dict[str, Any]]] = {}
-        for item in self.family_subscriptions:
-            family_group_map.setdefault(item["family_id"], []).append(item)
-
+        families = self.subscriptions.families
         eligible_families: List[Dict[str, Any]] = []
-        for family_id, members in family_group_map.items():
-            owner = next((m for m in members if m["role"] == FamilyRole.OWNER), None)
-            if owner is None:
+        for i, family_id in enumerate(families.family_ids):
+            owner_sub_id = families.owners[i]
+            if not owner_sub_id:
                 continue
-            removable_members = [m for m in members if m["role"] != FamilyRole.OWNER]
-            max_removable = min(len(removable_members), len(members) - 2)
+            # 가족당 OWNER는 1명 (build_roles)이라 OWNER 외 구성원은 size - 1명, 최소 2명은 남긴다
+            max_removable = families.size(i) - 2
             if max_removable < 1:
                 continue
             eligible_families.append({
                 "family_id": family_id,
-                "owner_sub_id": owner["sub_id"],
-                "removable_members": removable_members,
+                "owner_sub_id": owner_sub_id,
+                "index": i,
                 "max_removable": max_removable
             })
 
@@ -468,8 +785,8 @@ class BulkDataGenerator:
             log_warn("REMOVE 대상 가족 부족으로 FAMILY_APPLY(REMOVE) 생성 스킵")
             return
 
-        random.shuffle(eligible_families)
-        target_apply = min(random.randint(4, 5), len(eligible_families))
+        rng.shuffle(eligible_families)
+        target_apply = min(rng.randint(*self.scale["family_apply_remove"]), len(eligible_families))
         created_apply = 0
         created_target = 0
 
@@ -480,15 +797,19 @@ class BulkDataGenerator:
             family_id = family["family_id"]
             requester_sub_id = family["owner_sub_id"]
             max_removable = family["max_removable"]
-            removable_members = family["removable_members"]
+            removable_members = [
+                (sub_id, role) for sub_id, role in families.member_list(family["index"])
+                if role != FamilyRole.OWNER
+            ]
 
-            apply_created = rand_datetime_between(
-                self.subscription_created_map[requester_sub_id],
-                now()
+            apply_created = rand_epoch_between(
+                self.subscriptions.created_at(requester_sub_id),
+                now_epoch(),
+                rng
             )
 
             family_apply_id = self.family_apply_seq
-            self.csv.writer("family_apply").writerow([
+            self.queue_row("family_apply", [
                 family_apply_id,
                 requester_sub_id,
                 family_id,
@@ -501,13 +822,12 @@ class BulkDataGenerator:
             self.family_apply_seq += 1
             created_apply += 1
 
-            target_count = random.randint(1, max_removable)
-            selected_targets = random.sample(removable_members, k=target_count)
+            target_count = rng.randint(1, max_removable)
+            selected_targets = rng.sample(removable_members, k=target_count)
 
-            for member in selected_targets:
-                target_sub_id = member["sub_id"]
-                target_role = member["role"].value
-                self.csv.writer("family_apply_target").writerow([
+            for target_sub_id, role in selected_targets:
+                target_role = role.value
+                self.queue_row("family_apply_target", [
                     self.family_apply_target_seq,
                     family_apply_id,
                     target_sub_id,
@@ -522,46 +842,43 @@ class BulkDataGenerator:
     #  5️⃣ POLICY_SUB 생성
     # ======================================================
 
-    def _random_time_window(self):
-        duration_minutes = random.randint(1, 8) * 60
-        start_minutes = random.randint(0, (24 * 60) - duration_minutes)
+    def _random_time_window(self, rng):
+        duration_minutes = rng.randint(1, 8) * 60
+        start_minutes = rng.randint(0, (24 * 60) - duration_minutes)
         end_minutes = start_minutes + duration_minutes
         start_time = f"{start_minutes // 60:02d}:{start_minutes % 60:02d}"
         end_time = f"{end_minutes // 60:02d}:{end_minutes % 60:02d}"
         return start_time, end_time
 
-    def _build_new_policy(self):
+    def _build_new_policy(self, rng):
         all_days = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-        day_count = random.randint(3, 7)
-        start_time, end_time = self._random_time_window()
-        snapshot = {
-            "days": random.sample(all_days, k=day_count),
+        day_count = rng.randint(3, 7)
+        start_time, end_time = self._random_time_window(rng)
+        snapshot = PolicySnapshot({
+            "days": rng.sample(all_days, k=day_count),
             "startTime": start_time,
             "endTime": end_time
-        }
+        })
         return {
-            "name": random.choice(["학습 집중 시간", "야간 사용 제한", "주중 규칙 모드"]),
+            "name": rng.choice(["학습 집중 시간", "야간 사용 제한", "주중 규칙 모드"]),
             "description": "가족 대표가 직접 생성한 가족 전용 시간 정책입니다.",
             "type": PolicyType.SCHEDULED,
             "snapshot": snapshot
         }
 
-    def _build_customized_policy(self, base):
-        snapshot = json.loads(json.dumps(base["snapshot"]))
+    def _build_customized_policy(self, base, rng):
+        base_snapshot = base["snapshot"]
         policy_type = base["type"]
 
         if policy_type == PolicyType.SCHEDULED:
             all_days = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-            day_count = random.randint(3, 7)
-            start_time, end_time = self._random_time_window()
-            snapshot["days"] = random.sample(all_days, k=day_count)
-            snapshot["startTime"] = start_time
-            snapshot["endTime"] = end_time
+            day_count = rng.randint(3, 7)
+            start_time, end_time = self._random_time_window(rng)
+            snapshot = base_snapshot.with_schedule(rng.sample(all_days, k=day_count), start_time, end_time)
         else:
-            start_time, end_time = self._random_time_window()
-            snapshot["days"] = snapshot.get("days", ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"])
-            snapshot["startTime"] = start_time
-            snapshot["endTime"] = end_time
+            start_time, end_time = self._random_time_window(rng)
+            days = base_snapshot.data.get("days", ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"])
+            snapshot = base_snapshot.with_schedule(days, start_time, end_time)
 
         return {
             "name": f"{base['name']} (커스텀)",
@@ -571,44 +888,16 @@ class BulkDataGenerator:
         }
 
     def _policy_signature(self, family_policy):
-        # 같은 가족 내에서 정책 본문 중복 생성을 방지하기 위한 식별자
+        # 같은 가족 내에서 정책 본문 중복 생성을 방지하기 위한 식별자 (스냅샷 해시/정규화 키는 생성 시 계산됨)
         return (
             family_policy["type"].value,
             family_policy["name"],
-            json.dumps(family_policy["snapshot"], ensure_ascii=False, sort_keys=True)
+            family_policy["snapshot"]
         )
-
-    def _time_to_minutes(self, hhmm):
-        hour, minute = hhmm.split(":")
-        return int(hour) * 60 + int(minute)
-
-    def _extract_scheduled_intervals(self, snapshot):
-        days = snapshot.get("days", [])
-        start_time = snapshot.get("startTime")
-        end_time = snapshot.get("endTime")
-        if not days or not start_time or not end_time:
-            return []
-
-        start_min = self._time_to_minutes(start_time)
-        end_min = self._time_to_minutes(end_time)
-        if end_min <= start_min:
-            return []
-
-        return [(day, start_min, end_min) for day in days]
-
-    def _has_schedule_conflict(self, active_windows_by_day, intervals):
-        for day, start_min, end_min in intervals:
-            for existing_start, existing_end in active_windows_by_day.get(day, []):
-                if max(start_min, existing_start) < min(end_min, existing_end):
-                    return True
-        return False
-
-    def _append_active_windows(self, active_windows_by_day, intervals):
-        for day, start_min, end_min in intervals:
-            active_windows_by_day.setdefault(day, []).append((start_min, end_min))
     
     def generate_policy_sub(self):
         log_step("POLICY_SUB 생성")
+        rng = self.begin_stage("policy_sub")
 
         template_ids = [
             pid for pid, p in self.block_policy_map.items()
@@ -618,21 +907,19 @@ class BulkDataGenerator:
             log_warn("활성화된 SCHEDULED 관리자 정책 템플릿이 없어 POLICY_SUB 생성 스킵")
             return
 
-        family_group_map: Dict[int, List[Dict[str, Any]]] = {}
-        for item in self.family_subscriptions:
-            family_group_map.setdefault(item["family_id"], []).append(item)
-
         created_policy = 0
         created_mapping = 0
 
-        for family_id, members in family_group_map.items():
-            owner = next((m for m in members if m["role"] == FamilyRole.OWNER), None)
-            if owner is None:
+        families = self.subscriptions.families
+        for i, family_id in enumerate(families.family_ids):
+            owner_sub_id = families.owners[i]
+            if not owner_sub_id:
                 continue
 
-            owner_sub_id = owner["sub_id"]
-            member_active_windows = {m["sub_id"]: {} for m in members}
-            policy_count = random.randint(0, 3)
+            members = families.member_list(i)
+            # 구성원별 활성 정책 시간대 (주간 분 단위 비트맵, 겹침은 AND 한 번으로 판정)
+            member_busy = {sub_id: 0 for sub_id, _ in members}
+            policy_count = rng.randint(0, MAX_FAMILY_POLICIES)
             family_policy_signatures = set()
             generated_count = 0
             max_attempts = max(1, policy_count * 5)
@@ -640,31 +927,32 @@ class BulkDataGenerator:
             attempts = 0
             while generated_count < policy_count and attempts < max_attempts:
                 attempts += 1
-                policy_created = rand_datetime_between(
-                    self.subscription_created_map[owner_sub_id],
-                    now()
+                policy_created = rand_epoch_between(
+                    self.subscriptions.created_at(owner_sub_id),
+                    now_epoch(),
+                    rng
                 )
 
-                policy_mode = random.choices(
+                policy_mode = rng.choices(
                     ["COPY", "CUSTOMIZE", "NEW"],
                     weights=[45, 35, 20],
                     k=1
                 )[0]
 
                 if policy_mode == "NEW":
-                    family_policy = self._build_new_policy()
+                    family_policy = self._build_new_policy(rng)
                 else:
-                    template_policy_id = random.choice(template_ids)
+                    template_policy_id = rng.choice(template_ids)
                     base = self.block_policy_map[template_policy_id]
                     if policy_mode == "COPY":
                         family_policy = {
                             "name": f"{base['name']} (템플릿)",
                             "description": base.get("description", ""),
                             "type": base["type"],
-                            "snapshot": json.loads(json.dumps(base["snapshot"]))
+                            "snapshot": base["snapshot"]
                         }
                     else:
-                        family_policy = self._build_customized_policy(base)
+                        family_policy = self._build_customized_policy(base, rng)
 
                 signature = self._policy_signature(family_policy)
                 if signature in family_policy_signatures:
@@ -672,13 +960,13 @@ class BulkDataGenerator:
                 family_policy_signatures.add(signature)
 
                 family_policy_id = self.block_policy_seq
-                self.csv.writer("block_policy").writerow([
+                self.queue_row("block_policy", [
                     family_policy_id,
                     family_policy["name"],
                     family_policy["description"],
                     family_id,
                     family_policy["type"].value,
-                    json.dumps(family_policy["snapshot"], ensure_ascii=False),
+                    family_policy["snapshot"].json,
                     True,
                     False,
                     policy_created,
@@ -687,26 +975,26 @@ class BulkDataGenerator:
                 self.block_policy_seq += 1
                 created_policy += 1
                 generated_count += 1
-                policy_intervals = self._extract_scheduled_intervals(family_policy["snapshot"])
-
-                for member in members:
-                    sub_id = member["sub_id"]
-                    role = member["role"]
+                window = family_policy["snapshot"].window
 
+                for sub_id, role in members:
                     if role == FamilyRole.CHILD:
-                        is_policy_active = random.random() < 0.8
+                        is_policy_active = rng.random() < 0.8
                     elif role == FamilyRole.PARENT:
-                        is_policy_active = random.random() < 0.55
+                        is_policy_active = rng.random() < 0.55
                     else:
-                        is_policy_active = random.random() < 0.35
+                        is_policy_active = rng.random() < 0.35
 
-                    if is_policy_active and policy_intervals:
-                        if self._has_schedule_conflict(member_active_windows[sub_id], policy_intervals):
+                    if is_policy_active and window:
+                        day_mask, start_min, end_min, bitmap = window
+                        if member_busy[sub_id] & bitmap:
                             is_policy_active = False
                         else:
-                            self._append_active_windows(member_active_windows[sub_id], policy_intervals)
+                            member_busy[sub_id] |= bitmap
+                            if self.schedules is not None:
+                                self.schedules.add(sub_id, day_mask, start_min, end_min, family_policy["name"], policy_created)
 
-                    self.csv.writer("policy_sub").writerow([
+                    self.queue_row("policy_sub", [
                         self.policy_sub_seq,
                         sub_id,
                         family_policy_id,
@@ -738,34 +1026,32 @@ class BulkDataGenerator:
     def generate_blocked_service_sub(self):
 
         log_step("BLOCKED_SERVICE_SUB 생성")
+        rng = self.begin_stage("blocked_service_sub")
 
         created = 0
 
-        for item in self.family_subscriptions:
-            sub_id = item["sub_id"]
-            role = item["role"]
-
+        for sub_id, role in self.subscriptions.families.subscriptions():
             if role == FamilyRole.CHILD:
-                if random.random() >= 0.7:
+                if rng.random() >= 0.7:
                     continue
-                block_count = random.choices([1, 2, 3], weights=[50, 35, 15])[0]
+                block_count = rng.choices([1, 2, 3], weights=[50, 35, 15])[0]
             else:
-                if random.random() >= 0.2:
+                if rng.random() >= 0.2:
                     continue
-                block_count = random.choices([1, 2], weights=[80, 20])[0]
+                block_count = rng.choices([1, 2], weights=[80, 20])[0]
 
-            selected_codes = random.sample(PREFERRED_CODES, k=min(block_count, len(PREFERRED_CODES)))
+            selected_codes = rng.sample(PREFERRED_CODES, k=min(block_count, len(PREFERRED_CODES)))
 
-            sub_created = self.subscription_created_map[sub_id]
+            sub_created = self.subscriptions.created_at(sub_id)
 
             for code in selected_codes:
                 blocked_service_id = self.app_code_to_id.get(code)
                 if not blocked_service_id:
                     continue
 
-                blocked_created = rand_datetime_between(sub_created, now())
+                blocked_created = rand_epoch_between(sub_created, now_epoch(), rng)
 
-                self.csv.writer("blocked_service_sub").writerow([
+                self.queue_row("blocked_service_sub", [
                     self.blocked_service_sub_seq,
                     sub_id,
                     blocked_service_id,
@@ -795,41 +1081,29 @@ class BulkDataGenerator:
     def generate_present_data(self):
 
         log_step("PRESENT_DATA 생성")
+        rng = self.begin_stage("present_data")
 
-        family_group_map: Dict[int, List[Dict[str, Any]]] = {}
-        for item in self.family_subscriptions:
-            family_group_map.setdefault(item["family_id"], []).append(item)
-
-        start = datetime(2026, 2, 1, 0, 0, 0)
-        end = datetime(2026, 2, 20, 23, 59, 59)
+        start = to_epoch(datetime(2026, 2, 1, 0, 0, 0))
+        end = to_epoch(datetime(2026, 2, 20, 23, 59, 59))
 
         created = 0
 
-        for family_id, members in family_group_map.items():
+        families = self.subscriptions.families
+        for i in range(len(families)):
             # 50% 가족만 선물 이벤트 발생
-            if random.random() > 0.5:
+            if rng.random() > 0.5:
                 continue
 
-            parents = [
-                m for m in members 
-                if m["role"] in (FamilyRole.OWNER, FamilyRole.PARENT)
-            ]
-
-            children = [
-                m for m in members 
-                if m["role"] == FamilyRole.CHILD
-            ]
+            parents = families.adult_sub_ids(i)
+            children = families.child_sub_ids(i)
 
             if not parents or not children:
                 continue
 
-            sender = random.choice(parents)
-            receiver = random.choice(children)
-
-            sender_sub_id = sender["sub_id"]
-            receiver_sub_id = receiver["sub_id"]
+            sender_sub_id = rng.choice(parents)
+            receiver_sub_id = rng.choice(children)
 
-            plan = self.subscription_plan_map.get(sender_sub_id)
+            plan = self.subscriptions.plan(sender_sub_id)
             if not plan:
                 continue
 
@@ -846,12 +1120,12 @@ class BulkDataGenerator:
             if max_gift_gb <= 0:
                 continue
 
-            gift_gb = random.randint(1, max_gift_gb)
+            gift_gb = rng.randint(1, max_gift_gb)
             gift_amount = gift_gb * GB
 
-            present_created = rand_datetime_between(start, end)
+            present_created = rand_epoch_between(start, end, rng)
 
-            self.csv.writer("present_data").writerow([
+            self.queue_row("present_data", [
                 self.present_data_seq,
                 receiver_sub_id,
                 sender_sub_id,
@@ -859,7 +1133,7 @@ class BulkDataGenerator:
                 present_created
             ])
 
-            sender_name = self.subscription_member_map.get(sender_sub_id, "가족")
+            sender_name = self.subscriptions.name(sender_sub_id) or "가족"
             self.create_notification(
                 sub_id=receiver_sub_id,
                 noti_type=NotificationType.PRESENT_DATA,
@@ -872,8 +1146,115 @@ class BulkDataGenerator:
 
         log_done(f"PRESENT_DATA 생성 완료 ({created:,}건)")
 
-   # ======================================================
-    # 8️⃣ NOTIFIACTION 생성
+    # ======================================================
+    # 8️⃣ 이벤트 시뮬레이션 (--event-days)
+    # ======================================================
+
+    def write_event_chunk(self, chunk: Dict[str, Any], event_range: Dict[str, Any]) -> Dict[str, int]:
+        """청크 회선의 이벤트 알림을 회선별 시간 순으로 기록 (사용량 원장이면 data_usage 행 먼저), 알림 타입별 / data_usage 건수 반환"""
+        rng = make_rng(self.seed, "events", chunk["index"])
+        self.notification_rng = make_rng(self.seed, "notification", "events", chunk["index"])
+        self.notification_seq = chunk["notification_start"]
+        self.notification_limit = chunk["notification_end"]
+
+        counts: Dict[str, int] = {}
+        usage_events = None
+        if self.usage_ledger is not None:
+            usage = self.usage_ledger.simulate_usage(
+                chunk, event_range, self.usage_ledger.make_np_rng(self.seed, "usage", chunk["index"])
+            )
+            counts["data_usage"] = 0
+            for rows in self.usage_ledger.ledger_rows(chunk, usage, event_range, chunk["data_usage_start"]):
+                self.csv.write_rows("data_usage", rows)
+                counts["data_usage"] += len(rows)
+            usage_events = usage["events"]
+
+        read_before = now_epoch() - EVENT_READ_AFTER_DAYS * 24 * 60 * 60
+        read_old, read_recent = EVENT_READ_RATES
+        for sub_id, events in simulate_chunk(chunk, event_range, rng, usage_events):
+            for at, noti_type, message in events:
+                self.create_notification(
+                    sub_id=sub_id,
+                    noti_type=noti_type,
+                    message=message,
+                    created_time=at,
+                    is_read=rng.random() < (read_old if at < read_before else read_recent)
+                )
+                counts[noti_type.value] = counts.get(noti_type.value, 0) + 1
+
+        self.flush_rows()
+        self.notification_limit = None
+        return counts
+
+    def generate_events(self):
+        start = self.event_start or now() - timedelta(days=self.event_days)
+        event_range = plan_event_range(start, self.event_days, now())
+        log_step(
+            f"이벤트 시뮬레이션 ({from_epoch(event_range['start']):%Y-%m-%d} ~ {from_epoch(event_range['end'])}, "
+            f"{len(event_range['days'])}일)"
+        )
+
+        # 이전 단계 구간 다음부터 청크별 notification_id 구간
+        offsets, order = self.schedules.group_by_subscription(self.subscriptions.first_sub_id, len(self.subscriptions))
+        family_of, member_of = family_positions(self.subscriptions)
+        notification_start = self.current_next_ids()["notification"]
+        chunks = plan_event_chunks(
+            self.subscriptions, self.schedules, offsets, order, family_of, event_range, notification_start,
+            self.data_usage_seq if self.usage_ledger is not None else None
+        )
+        # 사용량 원장은 가족 공유 데이터 배분에 가족 정보가 필요하다
+        ledger_families = (family_of, member_of) if self.usage_ledger is not None else (None, None)
+        if not chunks:
+            log_warn("회선이 없어 이벤트 시뮬레이션 스킵")
+            return
+        self.notification_ranges["events"] = (notification_start, chunks[-1]["notification_end"])
+        self.event_range = [str(from_epoch(event_range["start"])), str(from_epoch(event_range["end"]))]
+        if self.usage_ledger is not None:
+            self.data_usage_seq = chunks[-1]["data_usage_end"]
+
+        counts: Dict[str, int] = {}
+        if self.workers == 1:
+            for done, chunk in enumerate(chunks, start=1):
+                chunk_counts = self.write_event_chunk(
+                    event_chunk_payload(self.subscriptions, self.schedules, order, chunk, *ledger_families), event_range
+                )
+                for name, rows in chunk_counts.items():
+                    counts[name] = counts.get(name, 0) + rows
+                log_progress("EVENT_CHUNK", done, len(chunks))
+        else:
+            # 청크 입력은 워커 수만큼씩 만들어 넘긴다 (전체 청크를 한 번에 직렬화하지 않음)
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for wave in range(0, len(chunks), self.workers):
+                    results = executor.map(
+                        _run_event_chunk_worker,
+                        [
+                            (self.seed, now(), self.output, self.copy_format, self.compression, self.writer_threads,
+                             self.next_part + chunk["index"], event_range, self.usage_ledger is not None,
+                             event_chunk_payload(self.subscriptions, self.schedules, order, chunk, *ledger_families))
+                            for chunk in chunks[wave:wave + self.workers]
+                        ]
+                    )
+                    for done, state in enumerate(results, start=wave + 1):
+                        self.import_part_stats(state)
+                        for name, rows in state["counts"].items():
+                            counts[name] = counts.get(name, 0) + rows
+                        log_progress("EVENT_CHUNK", done, len(chunks))
+            self.next_part += len(chunks)
+
+        ledger_rows = counts.pop("data_usage", 0)
+        policy_events = sum(
+            counts.get(noti_type.value, 0)
+            for noti_type in (NotificationType.TIME_WINDOW_POLICY_APPLIED, NotificationType.TIME_WINDOW_POLICY_RELEASED)
+        )
+        log_done(
+            f"이벤트 알림 {sum(counts.values()):,}건 "
+            f"(정책 적용/해제 {policy_events:,}건 / 사용량 {sum(counts.values()) - policy_events:,}건)"
+        )
+        if self.usage_ledger is not None:
+            log_done(f"DATA_USAGE 생성 완료 ({ledger_rows:,}건)")
+
+    # ======================================================
+    # 9️⃣ NOTIFIACTION 생성
     # ======================================================
 
     def create_notification(
@@ -881,67 +1262,409 @@ class BulkDataGenerator:
         sub_id: int,
         noti_type: NotificationType,
         message: str,
-        created_time: datetime
+        created_time: int,
+        is_read: bool = False
     ):
-        # 랜덤 event_id 생성
-        event_id = f"evt_{uuid.uuid4().hex}"
+        """created_time은 epoch 초"""
+        if self.notification_limit is not None and self.notification_seq >= self.notification_limit:
+            raise RuntimeError(f"notification_id 구간 초과: {self.notification_seq} (limit={self.notification_limit})")
+
+        # 랜덤 event_id 생성 (단계/샤드별 알림 스트림 사용)
+        event_id = f"evt_{random_uuid_hex(self.notification_rng)}"
 
         # 알림 제목을 생성 (noti_type이나 기획에 맞게 수정하셔도 됩니다)
         title = "알림이 도착했습니다." 
 
-        self.csv.writer("notification").writerow([
+        self.queue_row("notification", [
             self.notification_seq,   # 1. notification_id
             sub_id,                  # 2. sub_id
             noti_type.value,         # 3. notification_type
             title,                   # 4. notification_title (💡 새로 추가됨!)
             message,                 # 5. notification_content
-            created_time,            # 6. created_time
-            False,                   # 7. is_read
+            created_time,            # 6. created_time (epoch 초, sink가 기록 형식으로 변환)
+            is_read,                 # 7. is_read
             event_id                 # 8. event_id
         ])
 
         self.notification_seq += 1
 
     # ======================================================
-    # 9️⃣ MAIN 실행
+    # 🔟 MAIN 실행
     # ======================================================
 
+    def table_row_counts(self) -> Dict[str, int]:
+        """테이블별 생성 행 수 (본 파일 + 샤드 워커 합계)"""
+        counts = dict(self.csv.row_counts)
+        for name, rows in self.part_row_counts.items():
+            counts[name] = counts.get(name, 0) + rows
+        return counts
+
+    def build_manifest(self) -> Dict[str, Any]:
+        """
+        생성 결과 manifest
+        - tables / files: 행 수, 바이트 수, 파일별 sha256 (writer가 기록하며 누적, 파일 재읽기 없음)
+        - seed / base_time / config / 단계별 실행 시간
+        - mode / next_ids / key_buckets / phone_seed: 다음 append 실행의 기준 상태
+          (key_buckets는 래핑된 DEK만 기록, subscription_key.csv와 같은 값)
+        """
+        files = {}
+        if self.csv.file_output:
+            files.update(self.csv.file_stats)
+            files.update(self.part_file_stats)
+
+        tables = {
+            name: {"rows": rows, "bytes": 0, "files": 0}
+            for name, rows in self.table_row_counts().items()
+        }
+        for filename, stat in files.items():
+            table = tables[filename.split(".", 1)[0]]
+            table["bytes"] += stat["bytes"]
+            table["files"] += 1
+
+        return {
+            "seed": self.seed,
+            "base_time": now(),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "config": {
+                "scale": self.scale["profile"],
+                "scale_factor": self.scale["factor"],
+                "total_users": self.scale["total_users"],
+                "total_families": self.scale["total_families"],
+                "family_shard_size": FAMILY_SHARD_SIZE,
+                "user_shard_size": USER_SHARD_SIZE,
+                "workers": self.workers,
+                "output": self.output,
+                "copy_format": self.copy_format,
+                "compression": self.compression,
+                "writer_threads": self.writer_threads,
+                "engine": self.engine,
+                "crypto_backend": crypto_backend(),
+                "encryption_provider": ENCRYPTION_PROVIDER,
+                "reproducible_keys": self.reproducible_keys,
+                "event_days": self.event_days,
+                "event_range": self.event_range,
+                "usage_ledger": self.usage_ledger is not None,
+            },
+            "stages": self.stage_seconds,
+            "tables": tables,
+            "files": dict(sorted(files.items())),
+            "mode": "append" if self.base is not None else "full",
+            "append_from": self.base["source"] if self.base is not None else None,
+            "phone_seed": self.phone_seed,
+            "next_ids": self.current_next_ids(),
+            "key_buckets": {
+                str(bucket_id): {
+                    "version": key["version"],
+                    "encrypted_dek": key["encrypted_dek"],
+                    "kek_key_id": key["kek_key_id"],
+                }
+                for bucket_id, key in sorted(self.bucket_active_key_cache.items())
+            },
+        }
+
     def print_summary(self):
         log_step("📊 생성된 파일 요약")
 
-        for name in self.csv.files.keys():
-            path = os.path.join(OUTPUT_DIR, f"{name}.csv")
+        if self.output == "copy":
+            log_info("COPY 스트림 모드: 생성 건수는 스트림별 COPY 건수와 대조 완료")
+
+        for name, table in self.manifest["tables"].items():
+            if not self.csv.file_output:
+                log_info(f"{name} → {table['rows']:,} rows")
+                continue
 
-            if not os.path.exists(path):
-                log_warn(f"{name}.csv → 파일 없음")
+            if not table["files"]:
+                log_warn(f"{name} → 파일 없음")
                 continue
 
-            with open(path, encoding="utf-8") as f:
-                row_count = sum(1 for _ in f)
+            log_info(
+                f"{name} → {table['rows']:,} rows / {table['bytes'] / (1024 * 1024):,.1f} MB "
+                f"({table['files']} files)"
+            )
+
+        # 규모가 다른 실행끼리 비교할 수 있도록 회원 100만 명당 시간도 함께 출력
+        per_million = 1_000_000 / self.scale["total_users"]
+        for stage, seconds in self.manifest["stages"].items():
+            log_info(f"[{stage}] {seconds:,.1f}s ({seconds * per_million:,.1f}s / 100만 명)")
+
+    def run_stage(self, stage: str):
+        stage_start = time.time()
+        getattr(self, f"generate_{stage}")()
+        self.flush_rows()
+        self.stage_seconds[stage] = round(time.time() - stage_start, 3)
+
+    def run_independent_stages(self):
+        """policy_sub / blocked_service_sub / present_data (--workers > 1이면 단계별 워커가 part 파일로 기록)"""
+        if self.workers == 1:
+            for stage in INDEPENDENT_STAGE_TABLES:
+                self.run_stage(stage)
+            return
 
-            log_info(f"{name}.csv → {row_count:,} rows")
+        log_step(f"독립 단계 병렬 실행 ({', '.join(INDEPENDENT_STAGE_TABLES)})")
+        subscriptions = self.subscriptions.export_state()
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(INDEPENDENT_STAGE_TABLES))) as executor:
+            results = executor.map(
+                _run_stage_worker,
+                [
+                    (self.seed, now(), self.output, self.copy_format, self.compression, self.writer_threads,
+                     self.next_part + offset, stage, self.worker_base(), self.notification_ranges, subscriptions,
+                     self.event_days)
+                    for offset, stage in enumerate(INDEPENDENT_STAGE_TABLES)
+                ]
+            )
+            for stage, state in zip(INDEPENDENT_STAGE_TABLES, results):
+                self.import_part_stats(state)
+                self.stage_seconds[stage] = state["seconds"]
+                for table, next_id in state["next_ids"].items():
+                    setattr(self, SEQ_ATTRS[table], next_id)
+                if "schedules" in state:
+                    self.schedules.merge_state(state["schedules"])
+        self.next_part += len(INDEPENDENT_STAGE_TABLES)
 
     def generate(self):
 
         start_time = time.time()
 
         log_step("▶️  더미 데이터 생성 시작")
+        log_info(f"seed={self.seed}")
+        if self.base is not None:
+            log_info(
+                f"append 모드 (기준: {self.base['source']}): "
+                f"sub_id {self.next_ids['subscription']:,}부터 {self.scale['total_users']:,}명 추가"
+            )
+        log_info(
+            f"scale={self.scale['profile']}({self.scale['factor']:g}) "
+            f"회원 {self.scale['total_users']:,}명 / 가족 {self.scale['total_families']:,}개"
+        )
+
+        # 모든 샤드가 같은 기준 시각을 쓰도록 고정 (--base-time 지정 시 그 시각)
+        set_now_anchor(self.base_time or now())
+        log_info(f"base_time={now()}")
+        remove_part_files()
+        remove_manifest()
+
+        stages = [
+            "users",
+            "family_apply_create",
+            "family_apply_add",
+            "family_apply_remove",
+        ]
 
-        total_family_members = self.generate_family()
-        self.generate_remaining_users(total_family_members)
-        self.generate_family_apply_create()
-        self.generate_family_apply_add()
-        self.generate_family_apply_remove()
+        try:
+            for stage in stages:
+                self.run_stage(stage)
+            self.run_independent_stages()
+            if self.event_days:
+                self.run_stage("events")
+        finally:
+            # COPY 스트림 모드에서는 실패 원인(DB 오류)이 close()에서 드러난다
+            self.csv.close()
 
-        self.generate_policy_sub()
-        self.generate_blocked_service_sub()
-        self.generate_present_data()
+        self.manifest = self.build_manifest()
+        if self.csv.file_output:
+            write_manifest(self.manifest)
 
-        self.csv.close()
         self.print_summary()
 
         log_done(f"✅ 전체 더미 데이터 생성 완료 (실행 시간: {elapsed_hms(start_time)})")
 
 
+def _run_user_shard_worker(args):
+    """프로세스 풀 워커: 샤드 하나를 part 파일로 생성하고 상태를 반환"""
+    seed, anchor, output, copy_format, compression, writer_threads, engine, bucket_keys, base, shard = args
+    set_now_anchor(anchor)
+
+    shard_csv = open_writer_manager(
+        output, tables=USER_SHARD_TABLES, part=shard["index"], copy_format=copy_format, compression=compression,
+        writer_threads=writer_threads
+    )
+    generator = BulkDataGenerator(seed=seed, csv=shard_csv, engine=engine, base=base)
+    generator.bucket_active_key_cache = bucket_keys
+    generator.subscriptions = SubscriptionStore(shard["sub_start"])
+    try:
+        generator.run_user_shard(shard)
+    finally:
+        shard_csv.close()
+
+    state = generator.export_user_state()
+    state["row_counts"] = shard_csv.row_counts
+    state["file_stats"] = shard_csv.file_stats
+    return state
+
+
+def _run_stage_worker(args):
+    """프로세스 풀 워커: 독립 단계 하나를 part 파일로 생성하고 행 수/실행 시간을 반환"""
+    seed, anchor, output, copy_format, compression, writer_threads, part, stage, base, notification_ranges, subscriptions, event_days = args
+    set_now_anchor(anchor)
+
+    stage_csv = open_writer_manager(
+        output, tables=INDEPENDENT_STAGE_TABLES[stage], part=part, copy_format=copy_format, compression=compression,
+        writer_threads=writer_threads
+    )
+    generator = BulkDataGenerator(seed=seed, csv=stage_csv, base=base, event_days=event_days)
+    generator.subscriptions = SubscriptionStore(subscriptions["first_sub_id"])
+    generator.subscriptions.merge_state(subscriptions)
+    generator.notification_ranges = notification_ranges
+    stage_start = time.time()
+    try:
+        getattr(generator, f"generate_{stage}")()
+        generator.flush_rows()
+    finally:
+        stage_csv.close()
+
+    # notification 다음 ID는 단계별 구간으로 부모가 계산
+    next_ids = generator.current_next_ids()
+    state = {
+        "row_counts": stage_csv.row_counts,
+        "seconds": round(time.time() - stage_start, 3),
+        "next_ids": {
+            table: next_ids[table]
+            for table in INDEPENDENT_STAGE_TABLES[stage]
+            if table in SEQ_ATTRS and table != "notification"
+        },
+    }
+    if generator.schedules is not None and stage == "policy_sub":
+        state["schedules"] = generator.schedules.export_state()
+    state["file_stats"] = stage_csv.file_stats
+    return state
+
+
+def _run_event_chunk_worker(args):
+    """프로세스 풀 워커: 이벤트 청크 하나를 notification (/ data_usage) part 파일로 생성하고 건수를 반환"""
+    seed, anchor, output, copy_format, compression, writer_threads, part, event_range, usage_ledger, chunk = args
+    set_now_anchor(anchor)
+
+    tables = ['notification', 'data_usage'] if usage_ledger else ['notification']
+    chunk_csv = open_writer_manager(
+        output, tables=tables, part=part, copy_format=copy_format, compression=compression,
+        writer_threads=writer_threads
+    )
+    generator = BulkDataGenerator(seed=seed, csv=chunk_csv, usage_ledger=usage_ledger)
+    try:
+        counts = generator.write_event_chunk(chunk, event_range)
+    finally:
+        chunk_csv.close()
+
+    state = {"row_counts": chunk_csv.row_counts, "counts": counts}
+    state["file_stats"] = chunk_csv.file_stats
+    return state
+
+
+def _scale_arg(value: str) -> str:
+    try:
+        parse_scale(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+
+def add_generator_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="사용자/가족 샤드 및 독립 단계(policy_sub, blocked_service_sub, present_data) 생성 프로세스 수 (기본 1: 직렬)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="난수 seed (단계/샤드별 난수 스트림의 기준, 같은 seed면 같은 데이터 생성)"
+    )
+    parser.add_argument(
+        "--output", choices=OUTPUT_MODES, default="csv",
+        help="출력 방식: csv(output/ 파일) | copy(DB COPY 스트림 직접 적재) | parquet(output/parquet/ 분석용, pyarrow 필요)"
+    )
+    parser.add_argument(
+        "--copy-format", choices=COPY_FORMATS, default="csv",
+        help="COPY 포맷: csv | binary(notification_allow, policy_sub, family_sub, blocked_service_sub를 FORMAT BINARY로 기록)"
+    )
+    parser.add_argument(
+        "--compress", choices=COMPRESSIONS, default="none",
+        help="출력 파일 압축: none | gzip(.gz) | zstd(.zst, zstandard 필요), 로더가 스트리밍 해제해 COPY. parquet은 페이지 압축 코덱 (none: snappy)"
+    )
+    parser.add_argument(
+        "--writer-threads", type=int, default=0, metavar="N",
+        help="sink별 백그라운드 writer 스레드 수: 행 포맷/파일 기록을 생성과 겹쳐 실행 (기본 0: 생성 스레드에서 바로 기록)"
+    )
+    parser.add_argument(
+        "--engine", choices=ENGINES, default="python",
+        help="사용자 행 생성 엔진: python(행 단위) | numpy(블록 단위 배열 생성, numpy 필요)"
+    )
+    parser.add_argument(
+        "--crypto-workers", type=int, default=1,
+        help="전화번호 일괄 암호화 프로세스 수 (--workers 1일 때만 사용, 기본 1: 인라인)"
+    )
+    parser.add_argument(
+        "--scale", type=_scale_arg, default=None,
+        help="생성 규모: smoke(10만) | default(100만) | large(500만) | stress(2,000만) | 배율(예: 0.5). 기본: DUMMY_SCALE 환경변수 또는 default"
+    )
+    parser.add_argument(
+        "--append", type=int, default=0, metavar="N",
+        help="기존 데이터셋에 회원 N명(가족/정책/알림 포함)만 추가 생성. 적재 시 테이블을 지우지 않고 COPY"
+    )
+    parser.add_argument(
+        "--append-from", choices=APPEND_SOURCES, default="manifest",
+        help="append 기준 상태: manifest(직전 생성 manifest.json) | db(DB의 MAX(PK)와 활성 버킷 키)"
+    )
+    parser.add_argument(
+        "--event-days", type=int, default=0, metavar="N",
+        help="이벤트 시뮬레이션 기간(일): 활성 시간 정책 적용/해제, 데이터 사용량 임계 알림을 회선별 시간 순으로 생성 (기본 0: 미생성)"
+    )
+    parser.add_argument(
+        "--event-start", type=datetime.fromisoformat, default=None,
+        help="이벤트 시뮬레이션 시작일 (예: 2026-02-01, 기본: 기준 시각 - --event-days일). 기준 시각 이후는 생성하지 않음"
+    )
+    parser.add_argument(
+        "--usage-ledger", action="store_true",
+        help="--event-days 기간의 회선별 일 사용량(data_usage)을 요금제/가족 공유 데이터(FIFO·PRIORITY) 기준으로 생성, 사용량 알림도 원장 기준 (numpy 필요)"
+    )
+    parser.add_argument(
+        "--base-time", type=datetime.fromisoformat, default=None,
+        help="생성 기준 시각 (예: 2026-03-01T00:00:00, 기본: 실행 시각). --seed와 함께 쓰면 암호화 컬럼 외 바이트 단위 재현"
+    )
+    parser.add_argument(
+        "--reproducible-keys", action="store_true",
+        help="버킷 DEK를 SECRET_KEY(KEK)에서 HKDF로 파생해 암호화 컬럼까지 재현 (ENCRYPTION_PROVIDER=local 전용, 개발/테스트용. 기본: 매번 무작위 DEK)"
+    )
+
+
+def generator_from_args(args) -> "BulkDataGenerator":
+    if args.usage_ledger and not args.event_days:
+        raise ValueError("--usage-ledger는 --event-days와 함께 지정해야 합니다 (원장 기간)")
+    if args.compress != "none" and args.output == "copy":
+        raise ValueError("--compress는 --output csv / parquet에서만 사용할 수 있습니다 (COPY 스트림은 비압축)")
+    if args.reproducible_keys and ENCRYPTION_PROVIDER != "local":
+        raise ValueError("--reproducible-keys는 ENCRYPTION_PROVIDER=local에서만 사용할 수 있습니다")
+
+    base = None
+    seed = args.seed
+    scale = resolve_scale(args.scale)
+    if args.append:
+        # phone_seed 기본값(--append-from db, manifest 없음)은 기존 실행의 --seed 그대로
+        base = load_append_base(args.append_from, args.seed)
+        scale = scale_for_users(args.append)
+        if seed is not None:
+            seed = append_seed(seed, base)
+
+    return BulkDataGenerator(
+        workers=args.workers,
+        seed=seed,
+        base_time=args.base_time,
+        output=args.output,
+        copy_format=args.copy_format,
+        compression=args.compress,
+        writer_threads=args.writer_threads,
+        engine=args.engine,
+        crypto_workers=args.crypto_workers,
+        scale=scale,
+        base=base,
+        event_days=args.event_days,
+        event_start=args.event_start,
+        usage_ledger=args.usage_ledger,
+        reproducible_keys=args.reproducible_keys
+    )
+
+
 if __name__ == "__main__":
-    BulkDataGenerator().generate()
+    parser = argparse.ArgumentParser(description="더미 데이터 CSV 생성")
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    generator_from_args(args).generate()
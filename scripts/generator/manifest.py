@@ -0,0 +1,75 @@
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from config.db_config import OUTPUT_DIR
+
+# ======================================================
+# Generation manifest (output/manifest.json)
+# ======================================================
+#
+# 생성기가 테이블/파일별 행 수, 바이트 수, sha256과 seed/config/단계별 실행 시간을 남기고,
+# 로더는 파일 크기와 COPY 결과(cursor.rowcount)를 이 값과 대조한다 (COUNT(*) 재스캔 없음).
+#
+# {
+#   "seed", "base_time", "generated_at", "config": {...}, "stages": {단계: 초},
+#   "tables": {테이블: {"rows", "bytes", "files"}},
+#   "files": {파일명: {"rows", "bytes", "sha256"}}
+# }
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def manifest_path() -> str:
+    return os.path.join(OUTPUT_DIR, MANIFEST_FILENAME)
+
+
+def write_manifest(manifest: Dict[str, Any]):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    tmp_path = manifest_path() + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, default=str)
+    os.replace(tmp_path, manifest_path())
+
+
+def load_manifest() -> Optional[Dict[str, Any]]:
+    """manifest가 없으면 None (이전 버전 생성기 출력 등)"""
+    try:
+        with open(manifest_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def remove_manifest():
+    """생성 시작 시 이전 실행의 manifest 제거 (중간 실패 시 낡은 건수로 검증하지 않도록)"""
+    if os.path.exists(manifest_path()):
+        os.remove(manifest_path())
+
+
+def file_entry(manifest: Optional[Dict[str, Any]], path: str) -> Optional[Dict[str, Any]]:
+    if not manifest:
+        return None
+    return manifest.get("files", {}).get(os.path.basename(path))
+
+
+def expected_rows(manifest: Optional[Dict[str, Any]], paths: Iterable[str]) -> Optional[int]:
+    """파일들의 manifest 기록 행 수 합계 (manifest에 없는 파일이 있으면 None)"""
+    total = 0
+    for path in paths:
+        entry = file_entry(manifest, path)
+        if entry is None:
+            return None
+        total += entry["rows"]
+    return total
+
+
+def check_file_sizes(manifest: Optional[Dict[str, Any]], paths: Iterable[str]):
+    """COPY 전 파일 크기를 manifest와 대조 (잘린/덮어쓴 파일 조기 검출, 내용 재읽기 없음)"""
+    for path in paths:
+        entry = file_entry(manifest, path)
+        if entry is not None and os.path.getsize(path) != entry["bytes"]:
+            raise RuntimeError(
+                f"파일 크기 불일치: {os.path.basename(path)} "
+                f"(파일 {os.path.getsize(path):,} / manifest {entry['bytes']:,} bytes)"
+            )
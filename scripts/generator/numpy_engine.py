@@ -0,0 +1,197 @@
+from typing import Any, List, Optional
+
+try:
+    import numpy as np
+except ImportError as e:  # 선택 의존성: --engine numpy에서만 필요
+    raise ImportError("--engine numpy 실행에는 numpy가 필요합니다 (pip install numpy)") from e
+
+from generator.constants import *
+from generator.utils import *
+
+# ======================================================
+# NumPy batch engine (--engine numpy)
+# ======================================================
+#
+# write_user의 행 단위 난수/포맷 호출을 블록 단위 배열 연산으로 대체한다.
+# - 이름/생년월일/가입·개통 시각/요금제/잠금/소셜 provider를 블록 전체에 대해 한 번에 뽑고
+# - member / social_account / subscription / notification_allow 행을 sink write_block으로 컬럼 단위 일괄 기록
+# - 난수 스트림은 numpy Generator(샤드별 seed)라 python 엔진과 값은 다르지만,
+#   같은 seed/샤드 구성이면 워커 수와 무관하게 동일한 데이터가 생성된다
+
+NUMPY_BLOCK_SIZE = 100_000
+
+_LAST_NAMES = np.array(LAST_NAMES)
+_LAST_NAME_P = np.array(LAST_NAME_WEIGHTS, dtype=np.float64) / sum(LAST_NAME_WEIGHTS)
+_FIRST_SYLLABLES = np.array(FIRST_SYLLABLES)
+_SECOND_SYLLABLES = np.array(SECOND_SYLLABLES)
+_PLAN_IDS = np.array(list(PLANS.keys()))
+_PROVIDERS = np.array(PROVIDERS)
+_CATEGORIES = [category.value for category in NotificationCategory]
+
+# birth_by_role과 같은 연령 구간
+_ADULT_AGE = (30, 55)
+_CHILD_AGE = (5, 25)
+
+
+def make_np_rng(seed: int, *labels) -> "np.random.Generator":
+    return np.random.default_rng(derive_seed(seed, *labels))
+
+
+def _rand_names(rng, last_names: Optional[List[Optional[str]]], n: int) -> List[str]:
+    """rand_last_name + rand_name_with_last (두 번째 음절은 첫 음절과 다르게)"""
+    last = _LAST_NAMES[rng.choice(len(_LAST_NAMES), size=n, p=_LAST_NAME_P)]
+    if last_names is not None:
+        given = np.array([name is not None for name in last_names])
+        if given.any():
+            last = last.astype(object)
+            last[given] = [name for name in last_names if name is not None]
+
+    first = _FIRST_SYLLABLES[rng.integers(0, len(_FIRST_SYLLABLES), size=n)]
+    second = _SECOND_SYLLABLES[rng.integers(0, len(_SECOND_SYLLABLES), size=n)]
+    same = second == first
+    while same.any():
+        second[same] = _SECOND_SYLLABLES[rng.integers(0, len(_SECOND_SYLLABLES), size=int(same.sum()))]
+        same = second == first
+
+    return np.char.add(np.char.add(last.astype(str), first), second).tolist()
+
+
+def _rand_births(rng, roles: List[FamilyRole]) -> List[str]:
+    """birth_by_role (YYMMDD)"""
+    adult = np.array([role in (FamilyRole.OWNER, FamilyRole.PARENT) for role in roles])
+    min_age = np.where(adult, _ADULT_AGE[0], _CHILD_AGE[0])
+    max_age = np.where(adult, _ADULT_AGE[1], _CHILD_AGE[1])
+
+    today = np.datetime64(now().date(), "D")
+    start = today - max_age * 365
+    days = (max_age - min_age) * 365
+    births = start + rng.integers(0, days + 1)
+
+    year = births.astype("datetime64[Y]").astype(np.int64) + 1970
+    month_start = births.astype("datetime64[M]")
+    month = month_start.astype(np.int64) % 12 + 1
+    day = (births - month_start).astype(np.int64) + 1
+    return np.char.zfill(((year % 100) * 10000 + month * 100 + day).astype(str), 6).tolist()
+
+
+def _rand_created(rng, n: int):
+    """rand_epoch_between_years(3) → rand_epoch_between(member_created, now_epoch()), epoch 초 배열"""
+    cur = now_epoch()
+    span = 3 * 365 * 24 * 60 * 60
+    member_created = cur - span + rng.integers(0, span + 1, size=n)
+
+    # 개통 시각은 가입 시각 ~ now 사이
+    sub_created = member_created + rng.integers(0, cur - member_created + 1)
+    return member_created, sub_created
+
+
+def write_user_block(gen: Any, last_names: Optional[List[Optional[str]]], roles: List[FamilyRole]) -> List[int]:
+    """
+    write_user의 블록 버전. sub_id 목록 반환
+    - last_names: 회원별 성씨 (None이면 가중치 랜덤)
+    - roles: 생년월일 구간 결정용 역할
+    """
+    rng = gen.np_rng
+    n = len(roles)
+
+    first_id = gen.member_seq
+    member_ids = range(first_id, first_id + n)
+    # member_id == sub_id == social_account_id (샤드 구간 내 동일 시퀀스)
+    sub_ids = list(member_ids)
+    gen.member_seq += n
+    gen.subscription_seq += n
+    gen.social_seq += n
+
+    names = _rand_names(rng, last_names, n)
+    births = _rand_births(rng, roles)
+    member_created_arr, sub_created_arr = _rand_created(rng, n)
+    member_created = member_created_arr.tolist()
+    sub_created = sub_created_arr.tolist()
+    providers = _PROVIDERS[rng.integers(0, len(_PROVIDERS), size=n)].tolist()
+    plan_ids = _PLAN_IDS[rng.integers(0, len(_PLAN_IDS), size=n)].tolist()
+    is_locked = (rng.random(n) < 0.05).tolist()
+    social_suffix = rng.integers(0, 2 ** 63, size=n, dtype=np.int64).tolist()
+
+    # MEMBER
+    gen.csv.write_block('member', [
+        member_ids, names, births, ['APPROVED'] * n, [False] * n, member_created, member_created
+    ])
+
+    # SOCIAL_ACCOUNT (pseudo_uuid_hex 형식)
+    gen.csv.write_block('social_account', [
+        member_ids,
+        member_ids,
+        [f"user{member_id}@example.com" for member_id in member_ids],
+        [
+            f"{provider}_{member_id:08x}{suffix:016x}"
+            for provider, member_id, suffix in zip(providers, member_ids, social_suffix)
+        ],
+        providers,
+        [False] * n,
+        member_created,
+        member_created
+    ])
+
+    # SUBSCRIPTION (전화번호는 gen.flush_subscriptions에서 버킷별 일괄 암호화)
+    phones = gen.phone_allocator.phones(np.arange(first_id - 1, first_id - 1 + n, dtype=np.int64))
+    nonces = gen.crypto_rng.randbytes(GCM_NONCE_SIZE * n)
+    kek_key_id = get_kek_key_id()
+    for i, sub_id in enumerate(sub_ids):
+        bucket_id = sub_id % KEY_BUCKET_COUNT
+        bucket_key = gen.bucket_active_key_cache.get(bucket_id)
+        if bucket_key is None:
+            bucket_key = gen.create_bucket_key(bucket_id)
+
+        if sub_id <= KEY_BUCKET_COUNT:
+            gen.queue_row('subscription_key', [
+                sub_id,
+                bucket_id,
+                bucket_key["version"],
+                bucket_key["encrypted_dek"],
+                kek_key_id,
+                'active',
+                member_created[i],
+                member_created[i]
+            ])
+
+        gen.pending_subscriptions.append([
+            sub_id,
+            plan_ids[i],
+            sub_id,
+            phones[i],
+            nonces[i * GCM_NONCE_SIZE:(i + 1) * GCM_NONCE_SIZE],
+            bucket_id,
+            bucket_key["version"],
+            is_locked[i],
+            False,
+            sub_created[i],
+            sub_created[i]
+        ])
+    gen.flush_subscriptions()
+
+    gen.subscriptions.extend(first_id, plan_ids, sub_created, names)
+
+    # NOTIFICATION_ALLOW (회선당 카테고리 수만큼, notification_allow_id 연속)
+    k = len(_CATEGORIES)
+    first_allow_id = gen.notification_allow_seq
+    allow_created = [created for created in sub_created for _ in range(k)]
+    gen.csv.write_block('notification_allow', [
+        range(first_allow_id, first_allow_id + n * k),
+        [sub_id for sub_id in sub_ids for _ in range(k)],
+        _CATEGORIES * n,
+        [True] * (n * k),
+        [False] * (n * k),
+        allow_created,
+        allow_created
+    ])
+    gen.notification_allow_seq += n * k
+
+    for i in np.flatnonzero(is_locked).tolist():
+        gen.create_notification(
+            sub_ids[i],
+            noti_type=NotificationType.IMMEDIATE_BLOCK_APPLIED,
+            message="데이터 사용 차단이 즉시 적용되었습니다.",
+            created_time=sub_created[i],
+        )
+
+    return sub_ids
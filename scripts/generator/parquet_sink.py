@@ -0,0 +1,289 @@
+import io
+import glob
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as e:  # 선택 의존성: --output parquet에서만 필요
+    raise ImportError("parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)") from e
+
+from config.db_config import OUTPUT_DIR
+from generator.csv_writer import (
+    TABLE_NAMES,
+    COMPRESSIONS,
+    FILE_BUFFER_SIZE,
+    HashingFileIO,
+    RowSink,
+    part_filename,
+)
+
+# ======================================================
+# Parquet export (--output parquet)
+# ======================================================
+#
+# 분석용 내보내기: 테이블마다 parquet 데이터셋 하나 (output/parquet/<table>/ 아래 본 파일 + part 파일)
+# - 행 / 컬럼 묶음을 메모리에서 Arrow 배치로 바꿔 바로 기록 (CSV 문자열을 거치지 않음)
+# - row group은 ROW_GROUP_ROWS 행 단위, enum 컬럼은 dictionary 인코딩
+# - 시각은 행의 epoch 초를 그대로 timestamp로 (parquet 파일에는 ms 단위로 저장), 날짜는 date32, CSV의 NULL 표기("\N")는 null
+# - DB 적재 대상이 아니다 (db_loader는 CSV / binary COPY 파일만 적재)
+
+PARQUET_DIR = os.path.join(OUTPUT_DIR, "parquet")
+PARQUET_EXT = ".parquet"
+
+# row group 행 수 (생성 중 버퍼 상한이기도 하다)
+ROW_GROUP_ROWS = 128 * 1024
+
+# --compress → parquet 페이지 압축 코덱 (none이면 pyarrow 기본 snappy)
+PARQUET_CODECS = {"none": "snappy", "gzip": "gzip", "zstd": "zstd"}
+
+# CSV / COPY 행의 NULL 표기
+COPY_NULL = "\\N"
+
+# 테이블별 (컬럼, 타입) (02_create_tables.sql 컬럼 순서), 타입 뒤 "?"는 NULL 가능 컬럼
+PARQUET_TABLES = {
+    'member': [
+        ('member_id', 'int8'), ('name', 'text'), ('birth', 'text'), ('status', 'enum'),
+        ('is_deleted', 'bool'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'social_account': [
+        ('social_account_id', 'int8'), ('member_id', 'int8'), ('email', 'text'), ('social_id', 'text'),
+        ('provider', 'enum'), ('is_deleted', 'bool'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'subscription': [
+        ('sub_id', 'int8'), ('plan_id', 'int8'), ('member_id', 'int8?'), ('phone_enc', 'text'),
+        ('phone_hash', 'text'), ('phone_key_bucket_id', 'int4'), ('phone_key_version', 'int4'),
+        ('is_locked', 'bool'), ('is_deleted', 'bool'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'subscription_key': [
+        ('subscription_key_id', 'int8'), ('bucket_id', 'int4'), ('key_version', 'int4'), ('encrypted_dek', 'text'),
+        ('kek_key_id', 'text'), ('status', 'enum'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'notification_allow': [
+        ('notification_allow_id', 'int8'), ('sub_id', 'int8'), ('notification_category', 'enum'),
+        ('notification_allow', 'bool'), ('is_deleted', 'bool'), ('created_time', 'timestamp'),
+        ('modified_time', 'timestamp'),
+    ],
+    'family': [
+        ('family_id', 'int8'), ('family_num', 'int4'), ('family_data_amount', 'int8'), ('priority_type', 'enum'),
+        ('is_deleted', 'bool'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'family_sub': [
+        ('family_sub_id', 'int8'), ('sub_id', 'int8'), ('family_id', 'int8'), ('family_role', 'enum'),
+        ('priority', 'int4?'), ('data_limit', 'int8?'),
+    ],
+    'family_apply': [
+        ('family_apply_id', 'int8'), ('requester_sub_id', 'int8'), ('family_id', 'int8?'), ('apply_type', 'enum'),
+        ('doc_url', 'text?'), ('status', 'enum'), ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'family_apply_target': [
+        ('family_apply_target_id', 'int8'), ('family_apply_id', 'int8'), ('target_sub_id', 'int8'),
+        ('target_family_role', 'enum'),
+    ],
+    'block_policy': [
+        ('block_policy_id', 'int8'), ('policy_name', 'text'), ('policy_description', 'text'), ('family_id', 'int8?'),
+        ('policy_type', 'enum'), ('policy_snapshot', 'text'), ('is_active', 'bool'), ('is_deleted', 'bool'),
+        ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'policy_sub': [
+        ('policy_sub_id', 'int8'), ('sub_id', 'int8'), ('block_policy_id', 'int8'), ('is_active', 'bool'),
+        ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'blocked_service_sub': [
+        ('blocked_service_sub_id', 'int8'), ('sub_id', 'int8'), ('blocked_service_id', 'int8'), ('is_active', 'bool'),
+        ('created_time', 'timestamp'), ('modified_time', 'timestamp'),
+    ],
+    'present_data': [
+        ('present_data_id', 'int8'), ('target_sub_id', 'int8'), ('provide_sub_id', 'int8'), ('data_amount', 'int8'),
+        ('created_time', 'timestamp'),
+    ],
+    'notification': [
+        ('notification_id', 'int8'), ('sub_id', 'int8'), ('notification_type', 'enum'),
+        ('notification_title', 'text'), ('notification_content', 'text'), ('created_time', 'timestamp'),
+        ('is_read', 'bool'), ('event_id', 'text'),
+    ],
+    'data_usage': [
+        ('data_usage_id', 'int8'), ('sub_id', 'int8'), ('usage_date', 'date'), ('plan_amount', 'int8'),
+        ('family_amount', 'int8'), ('created_time', 'timestamp'),
+    ],
+}
+
+_ARROW_TYPES = {
+    'int8': pa.int64(),
+    'int4': pa.int32(),
+    'bool': pa.bool_(),
+    'text': pa.string(),
+    'enum': pa.dictionary(pa.int32(), pa.string()),
+    'timestamp': pa.timestamp('s'),
+    'date': pa.date32(),
+}
+
+
+def table_dir(name: str) -> str:
+    return os.path.join(PARQUET_DIR, name)
+
+
+def clear_table_dir(name: str):
+    """이전 실행의 본 파일 / part 파일 정리"""
+    for path in glob.glob(os.path.join(table_dir(name), f"*{PARQUET_EXT}")):
+        os.remove(path)
+
+
+def parquet_schema(name: str) -> "pa.Schema":
+    return pa.schema([
+        pa.field(column, _ARROW_TYPES[kind.rstrip("?")], nullable=kind.endswith("?"))
+        for column, kind in PARQUET_TABLES[name]
+    ])
+
+
+def _to_array(values: Sequence[Any], kind: str) -> "pa.Array":
+    nullable = kind.endswith("?")
+    if nullable:
+        kind = kind[:-1]
+        values = [None if value == COPY_NULL else value for value in values]
+    if kind == "timestamp":
+        # 행 값은 epoch 초(int) → timestamp('s') 그대로 (문자열 변환 없음)
+        return pa.array(values, _ARROW_TYPES[kind])
+    if kind == "date":
+        # format_date 문자열 → Arrow 캐스트 (값마다 파싱 없음)
+        return pa.array(values, pa.string()).cast(_ARROW_TYPES[kind])
+    if kind == "enum":
+        return pa.array(values, pa.string()).dictionary_encode()
+    array = pa.array(values, _ARROW_TYPES[kind])
+    if kind == "text" and not nullable and array.null_count:
+        # csv.writer는 None을 빈 문자열로 쓰고 COPY(NULL '\N')는 ''로 적재 → 같은 값으로 맞춘다
+        array = array.fill_null("")
+    return array
+
+
+class ParquetTableWriter:
+    """
+    테이블 하나의 parquet 파일 기록 (행 묶음 writerows + 컬럼 묶음 write_columns)
+    - 행은 ROW_GROUP_ROWS까지 모았다가 컬럼으로 전치해 Arrow 배치로 변환
+    - 배치가 ROW_GROUP_ROWS 이상 쌓이면 그만큼 잘라 row group 하나로 기록
+    """
+
+    def __init__(self, f, name: str, codec: str):
+        self._kinds = [kind for _, kind in PARQUET_TABLES[name]]
+        self._schema = parquet_schema(name)
+        self._writer = pq.ParquetWriter(f, self._schema, compression=codec)
+        self._rows: List[Sequence[Any]] = []
+        self._batches: List["pa.RecordBatch"] = []
+        self._pending = 0
+
+    def writerows(self, rows):
+        self._rows.extend(rows)
+        if len(self._rows) >= ROW_GROUP_ROWS:
+            self._flush_rows()
+
+    def write_columns(self, columns: Sequence[Sequence[Any]]):
+        # 앞서 받은 행이 먼저 기록되도록 행 버퍼부터 배치로 넘긴다
+        self._flush_rows()
+        self._add_batch(columns)
+
+    def _flush_rows(self):
+        if self._rows:
+            columns = list(zip(*self._rows))
+            self._rows = []
+            self._add_batch(columns)
+
+    def _add_batch(self, columns: Sequence[Sequence[Any]]):
+        batch = pa.RecordBatch.from_arrays(
+            [_to_array(values, kind) for values, kind in zip(columns, self._kinds)],
+            schema=self._schema
+        )
+        if not batch.num_rows:
+            return
+        self._batches.append(batch)
+        self._pending += batch.num_rows
+        while self._pending >= ROW_GROUP_ROWS:
+            table = pa.Table.from_batches(self._batches, self._schema)
+            self._writer.write_table(table.slice(0, ROW_GROUP_ROWS), row_group_size=ROW_GROUP_ROWS)
+            rest = table.slice(ROW_GROUP_ROWS)
+            self._batches = rest.to_batches()
+            self._pending = rest.num_rows
+
+    def finish(self):
+        self._flush_rows()
+        if self._pending:
+            self._writer.write_table(pa.Table.from_batches(self._batches, self._schema), row_group_size=ROW_GROUP_ROWS)
+            self._batches = []
+            self._pending = 0
+        self._writer.close()
+
+
+class ParquetWriterManager(RowSink):
+    """
+    parquet sink (--output parquet)
+    - output/parquet/<table>/<table>.parquet (+ 샤드 part 파일 <table>.part-NNNNN.parquet)
+    - manifest의 files 항목은 파일명 기준 (바이트 수 / sha256은 디스크에 기록된 parquet 파일)
+    - write_block은 컬럼 묶음을 행으로 풀지 않고 바로 배치로 변환
+    """
+
+    file_output = True
+
+    def __init__(
+        self,
+        tables: Optional[List[str]] = None,
+        part: Optional[int] = None,
+        copy_format: str = "csv",
+        compression: str = "none",
+        writer_threads: int = 0
+    ):
+        if copy_format != "csv":
+            raise ValueError("parquet 출력은 --copy-format binary를 지원하지 않습니다 (컬럼 타입은 parquet 스키마)")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {COMPRESSIONS}")
+
+        super().__init__(writer_threads)
+        self.files = {}
+        self.filenames = {}
+        self.raw_files = {}
+        self.table_writers: Dict[str, ParquetTableWriter] = {}
+
+        tables = tables or TABLE_NAMES
+        if part is None:
+            # 본 sink는 워커보다 먼저 열린다 → 이번 실행에서 열지 않는 테이블까지 이전 파일 정리
+            for name in TABLE_NAMES:
+                clear_table_dir(name)
+
+        for name in tables:
+            directory = table_dir(name)
+            os.makedirs(directory, exist_ok=True)
+
+            filename = f"{name}{PARQUET_EXT}" if part is None else part_filename(name, part, PARQUET_EXT)
+            raw = HashingFileIO(os.path.join(directory, filename))
+            f = io.BufferedWriter(raw, buffer_size=FILE_BUFFER_SIZE)
+
+            self.table_writers[name] = ParquetTableWriter(f, name, PARQUET_CODECS[compression])
+            self.add_writer(name, self.table_writers[name])
+            self.files[name] = f
+            self.filenames[name] = filename
+            self.raw_files[name] = raw
+
+    def write_block(self, name: str, columns: Sequence[Sequence[Any]]):
+        writer = self.writers[name]
+        writer.rows += len(columns[0]) if columns else 0
+        self.run_in_writer(name, self.table_writers[name].write_columns, columns)
+
+    @property
+    def file_stats(self) -> Dict[str, Dict[str, Any]]:
+        """파일명별 행 수 / 바이트 수 / sha256 (close() 이후 확정)"""
+        return {
+            self.filenames[name]: {
+                "rows": writer.rows,
+                "bytes": self.raw_files[name].bytes,
+                "sha256": self.raw_files[name].sha256.hexdigest(),
+            }
+            for name, writer in self.writers.items()
+        }
+
+    def close(self):
+        try:
+            self.finish_writers()
+        finally:
+            for writer in self.table_writers.values():
+                writer.finish()
+            for f in self.files.values():
+                f.close()
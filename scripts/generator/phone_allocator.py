@@ -0,0 +1,84 @@
+from typing import List, Tuple
+
+from generator.constants import *
+from generator.utils import derive_seed
+
+# ======================================================
+# Phone allocator (seeded Feistel permutation)
+# ======================================================
+#
+# 010-XXXX-XXXX 번호 공간(TEAM_PHONE_RANGE 제외)을 seed로 섞은 순열로 보고
+# index → 번호를 O(1)로 계산한다. 발급 이력(set)이나 재추첨 없이 중복이 없다.
+# - 더미 회선: index = sub_id - 1 (샤드의 sub_id 구간이 겹치지 않으므로 번호도 겹치지 않음)
+# - team_seed.py: TEAM_PHONE_RANGE를 순차 사용
+
+FEISTEL_ROUNDS = 4
+
+
+def format_phone(number: int) -> str:
+    return f"010-{number // 10_000:04d}-{number % 10_000:04d}"
+
+
+class PhoneAllocator:
+
+    def __init__(self, seed: int, space: int = PHONE_SPACE, reserved: Tuple[int, int] = TEAM_PHONE_RANGE):
+        self.reserved_start, reserved_end = reserved
+        self.reserved_size = reserved_end - self.reserved_start
+        self.size = space - self.reserved_size
+
+        # 순열 도메인: size 이상인 가장 작은 짝수 비트 (반쪽씩 Feistel), 넘치면 cycle-walking
+        bits = max(2, (self.size - 1).bit_length())
+        self.half_bits = (bits + 1) // 2
+        self.half_mask = (1 << self.half_bits) - 1
+        self.round_keys = [
+            derive_seed(seed, "phone", r) & 0xFFFFFFFF
+            for r in range(FEISTEL_ROUNDS)
+        ]
+
+    def _round(self, right, key):
+        # int / numpy 정수 배열 모두 같은 연산으로 계산
+        x = ((right ^ key) * 0x45D9F3B) & 0xFFFFFFFF
+        x ^= x >> 15
+        return x & self.half_mask
+
+    def _permute(self, value):
+        left = value >> self.half_bits
+        right = value & self.half_mask
+        for key in self.round_keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self.half_bits) | right
+
+    def _to_number(self, value):
+        # 예약 대역만큼 뒤로 밀어 team 번호와 겹치지 않게 한다
+        if value >= self.reserved_start:
+            return value + self.reserved_size
+        return value
+
+    def number(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise ValueError(f"phone index out of range: {index} (size={self.size})")
+
+        value = self._permute(index)
+        while value >= self.size:
+            value = self._permute(value)
+        return self._to_number(value)
+
+    def phone(self, index: int) -> str:
+        return format_phone(self.number(index))
+
+    def numbers(self, indexes):
+        """number()의 numpy 배열 버전 (numpy 엔진용, int64 배열 입력)"""
+        if len(indexes) and (indexes.min() < 0 or indexes.max() >= self.size):
+            raise ValueError(f"phone index out of range (size={self.size})")
+
+        values = self._permute(indexes)
+        outside = values >= self.size
+        while outside.any():
+            values[outside] = self._permute(values[outside])
+            outside = values >= self.size
+
+        values[values >= self.reserved_start] += self.reserved_size
+        return values
+
+    def phones(self, indexes) -> List[str]:
+        return [format_phone(number) for number in self.numbers(indexes).tolist()]
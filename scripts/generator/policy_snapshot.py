@@ -0,0 +1,88 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from generator.event_simulator import week_mask, week_bitmap
+
+# ======================================================
+# Block policy snapshot (block_policy.snapshot)
+# ======================================================
+#
+# 정책 스냅샷을 한 번 만들면 바꾸지 않는 객체로 다룬다.
+# - CSV용 JSON 문자열 / 비교용 정규화 키(정렬된 항목 튜플) / 해시를 생성 시 한 번만 계산
+# - 관리자 템플릿 스냅샷은 한 번만 만들어 공유 (COPY 정책은 깊은 복사 / 직렬화 없음)
+# - 가족 내 중복 판정은 스냅샷 객체 자체를 키로 쓴다 (sort_keys 직렬화 없음)
+
+# "HH:MM" → 분 (시간대 종류가 적어 파싱 결과를 공유)
+_TIME_MINUTES: Dict[str, int] = {}
+
+_UNSET = object()
+
+
+def time_to_minutes(hhmm: str) -> int:
+    minutes = _TIME_MINUTES.get(hhmm)
+    if minutes is None:
+        hour, minute = hhmm.split(":")
+        minutes = _TIME_MINUTES[hhmm] = int(hour) * 60 + int(minute)
+    return minutes
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class PolicySnapshot:
+    """
+    불변 정책 스냅샷 (data는 읽기 전용으로만 사용)
+    - json: block_policy.snapshot 컬럼 값 (키 순서 유지)
+    - window: 시간대 정책이면 (요일 비트마스크, 시작 분, 종료 분, 주간 비트맵), 아니면 None
+    """
+
+    __slots__ = ("data", "json", "key", "_hash", "_window")
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.json = json.dumps(data, ensure_ascii=False)
+        self.key = _freeze(data)
+        self._hash = hash(self.key)
+        self._window: Any = _UNSET
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PolicySnapshot):
+            return NotImplemented
+        return self._hash == other._hash and self.key == other.key
+
+    def with_schedule(self, days: List[str], start_time: str, end_time: str) -> "PolicySnapshot":
+        """요일 / 시간대만 바꾼 새 스냅샷 (나머지 항목은 그대로 공유)"""
+        data = dict(self.data)
+        data["days"] = days
+        data["startTime"] = start_time
+        data["endTime"] = end_time
+        return PolicySnapshot(data)
+
+    @property
+    def window(self) -> Optional[Tuple[int, int, int, int]]:
+        if self._window is _UNSET:
+            self._window = self._schedule_window()
+        return self._window
+
+    def _schedule_window(self) -> Optional[Tuple[int, int, int, int]]:
+        days = self.data.get("days", [])
+        start_time = self.data.get("startTime")
+        end_time = self.data.get("endTime")
+        if not days or not start_time or not end_time:
+            return None
+
+        start_min = time_to_minutes(start_time)
+        end_min = time_to_minutes(end_time)
+        if end_min <= start_min:
+            return None
+
+        day_mask = week_mask(days)
+        return day_mask, start_min, end_min, week_bitmap(day_mask, start_min, end_min)
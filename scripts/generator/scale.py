@@ -0,0 +1,83 @@
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from generator.constants import *
+
+# ======================================================
+# Scale profiles (--scale / DUMMY_SCALE)
+# ======================================================
+#
+# TOTAL_USERS / TOTAL_FAMILIES(1.0 기준)에 배율을 곱해 규모를 정한다.
+# - 회원/가족 수와 가족 신청(family_apply) 건수를 같은 배율로 조정
+# - 기능별 비율(잠금/우선순위 가족/차단 등)은 배율과 무관하게 그대로라 규모만 달라진다
+# - 샤드 크기는 고정이라 워커 하나의 메모리/단계 시간은 규모와 무관하고 샤드 수만 늘어난다
+
+SCALE_ENV = "DUMMY_SCALE"
+
+SCALE_PROFILES = {
+    "smoke": 0.1,       # 10만 명
+    "default": 1.0,     # 100만 명
+    "large": 5.0,       # 500만 명
+    "stress": 20.0,     # 2,000만 명
+}
+
+# 가족 신청 건수 (1.0 기준, randint 범위)
+FAMILY_APPLY_CREATE_RANGE = (5, 10)
+FAMILY_APPLY_ADD_RANGE = (4, 5)
+FAMILY_APPLY_REMOVE_RANGE = (4, 5)
+
+
+def _scale_count(count: int, factor: float) -> int:
+    return max(1, round(count * factor))
+
+
+def _scale_range(bounds: Tuple[int, int], factor: float) -> Tuple[int, int]:
+    return _scale_count(bounds[0], factor), _scale_count(bounds[1], factor)
+
+
+def parse_scale(value: str) -> Tuple[str, float]:
+    """프로필 이름 또는 배율(예: 0.5) → (이름, 배율)"""
+    if value in SCALE_PROFILES:
+        return value, SCALE_PROFILES[value]
+    try:
+        factor = float(value)
+    except ValueError:
+        raise ValueError(
+            f"scale must be one of {tuple(SCALE_PROFILES)} or a positive number: {value}"
+        ) from None
+    if factor <= 0:
+        raise ValueError(f"scale must be positive: {value}")
+    return "custom", factor
+
+
+def resolve_scale(value: Optional[str] = None) -> Dict[str, Any]:
+    """
+    규모 설정 (CLI 값 → DUMMY_SCALE 환경변수 → default 순)
+    - total_users / total_families: 배율 적용 회원/가족 수
+    - family_apply_*: 가족 신청 건수 범위
+    """
+    name, factor = parse_scale(value or os.getenv(SCALE_ENV) or "default")
+    return _build_scale(name, factor, _scale_count(TOTAL_USERS, factor))
+
+
+def scale_for_users(total_users: int) -> Dict[str, Any]:
+    """회원 수 기준 규모 (append 모드: 추가 회원 수에 맞춰 가족/신청 건수 비율 유지)"""
+    if total_users <= 0:
+        raise ValueError(f"total_users must be positive: {total_users}")
+    return _build_scale("append", total_users / TOTAL_USERS, total_users)
+
+
+def _build_scale(name: str, factor: float, total_users: int) -> Dict[str, Any]:
+    phone_capacity = PHONE_SPACE - (TEAM_PHONE_RANGE[1] - TEAM_PHONE_RANGE[0])
+    if total_users > phone_capacity:
+        raise ValueError(f"scale {name}({factor:g}): 회원 수 {total_users:,}가 전화번호 공간 {phone_capacity:,}을 넘습니다")
+
+    return {
+        "profile": name,
+        "factor": factor,
+        "total_users": total_users,
+        "total_families": _scale_count(TOTAL_FAMILIES, factor),
+        "family_apply_create": _scale_range(FAMILY_APPLY_CREATE_RANGE, factor),
+        "family_apply_add": _scale_range(FAMILY_APPLY_ADD_RANGE, factor),
+        "family_apply_remove": _scale_range(FAMILY_APPLY_REMOVE_RANGE, factor),
+    }
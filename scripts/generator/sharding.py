@@ -0,0 +1,107 @@
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from generator.constants import *
+
+# ======================================================
+# Shard planning
+# ======================================================
+#
+# 샤드 경계는 워커 수와 무관하게 고정 크기로 나눈다.
+# 직렬 실행도 같은 샤드를 순서대로 처리하므로,
+# 같은 seed라면 워커 수와 상관없이 동일한 데이터가 생성된다.
+
+
+def plan_family_sizes(rng: random.Random, total_families: int, total_users: int) -> List[int]:
+    """가족별 인원 수를 미리 뽑아 둔다 (전체 유저 수 초과 방지 포함)"""
+    sizes: List[int] = []
+    total_family_members = 0
+
+    for size in rng.choices(FAMILY_SIZES, weights=FAMILY_SIZE_WEIGHTS, k=total_families):
+        if total_family_members + size > total_users:
+            size = total_users - total_family_members
+
+        if size <= 0:
+            break
+
+        sizes.append(size)
+        total_family_members += size
+
+    return sizes
+
+
+def plan_user_shards(
+    family_sizes: List[int],
+    total_users: int,
+    next_ids: Optional[Dict[str, int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    가족 샤드 → 비가족 샤드 순서로 ID 구간을 나눈다.
+    - member_id / sub_id / social_account_id: sub_start부터 user_count개
+    - family_id: family_start부터 len(family_sizes)개
+    - family_sub_id: family_sub_start부터 (가족 회선이 샤드 앞쪽에 연속 생성)
+    - notification_allow_id: notification_allow_start부터 회선당 카테고리 수만큼
+    - notification_id: notification_start부터 user_count개 (사용자 단계 알림은 회선당 최대 1건)
+    - 전화번호: sub_id 기반 순열(PhoneAllocator)이라 구간을 따로 나누지 않는다
+    - next_ids: 테이블별 시작 ID (append 모드, 기본은 모두 1)
+    """
+    next_ids = next_ids or {}
+    user_start = next_ids.get("subscription", 1)
+    family_start = next_ids.get("family", 1)
+    family_sub_start = next_ids.get("family_sub", 1)
+    notification_allow_start = next_ids.get("notification_allow", 1)
+    notification_start = next_ids.get("notification", 1)
+
+    shards: List[Dict[str, Any]] = []
+    offset_users = 0
+
+    def add_shard(shard: Dict[str, Any]):
+        nonlocal offset_users
+        shard.update({
+            "sub_start": user_start + offset_users,
+            "family_sub_start": family_sub_start + offset_users,
+            "notification_allow_start": notification_allow_start + offset_users * len(NotificationCategory),
+            "notification_start": notification_start + offset_users,
+        })
+        shards.append(shard)
+        offset_users += shard["user_count"]
+
+    for offset in range(0, len(family_sizes), FAMILY_SHARD_SIZE):
+        sizes = family_sizes[offset:offset + FAMILY_SHARD_SIZE]
+        add_shard({
+            "kind": "family",
+            "family_start": family_start + offset,
+            "family_sizes": sizes,
+            "user_count": sum(sizes),
+        })
+
+    remaining = total_users - offset_users
+    for offset in range(0, remaining, USER_SHARD_SIZE):
+        add_shard({
+            "kind": "single",
+            "user_count": min(USER_SHARD_SIZE, remaining - offset),
+        })
+
+    for index, shard in enumerate(shards):
+        shard["index"] = index
+
+    return shards
+
+
+def plan_stage_notification_ranges(notification_start: int, family_member_count: int, family_count: int) -> Dict[str, Tuple[int, int]]:
+    """
+    사용자 단계 이후 알림을 만드는 단계별 notification_id 구간 [시작, 끝)
+    - 단계마다 알림 상한만큼 구간을 미리 나눠, 단계를 어떤 순서/병렬로 실행해도 같은 ID가 나온다
+    - 상한보다 적게 만든 구간은 비워 둔다 (사용자 샤드와 같은 방식)
+    """
+    limits = [
+        ("policy_sub", MAX_FAMILY_POLICIES * family_member_count),
+        ("blocked_service_sub", MAX_BLOCKED_SERVICES * family_member_count),
+        ("present_data", family_count),
+    ]
+
+    ranges: Dict[str, Tuple[int, int]] = {}
+    for stage, limit in limits:
+        ranges[stage] = (notification_start, notification_start + limit)
+        notification_start += limit
+    return ranges
@@ -0,0 +1,263 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from generator.constants import *
+
+# ======================================================
+# Subscription / family bookkeeping (columnar)
+# ======================================================
+#
+# 후속 단계(family_apply / policy_sub / blocked_service_sub / present_data)가 참조하는
+# 회선 정보를 sub_id 인덱스 array 컬럼으로 보관한다 (회선별 dict/datetime 객체 없음).
+# - plan_id('b'), 개통 시각 epoch 초('q'), 가족 역할 코드('b', 0 = 비가족), 이름 테이블 인덱스('I')
+# - 가족 구성원: FamilyIndex (CSR, generate_family에서 한 번 구성해 모든 후속 단계가 공유)
+# - 샤드가 sub_id 구간을 순서대로 나누므로 회선은 항상 sub_id 순서로 추가된다
+
+_ROLES = list(FamilyRole)
+_ROLE_CODES = {role: code for code, role in enumerate(_ROLES, start=1)}
+
+
+class FamilyIndex:
+    """
+    가족 → 구성원 인덱스 (CSR)
+    - i번째 가족: family_ids[i], 구성원 members[offsets[i]:offsets[i + 1]] (역할 코드 member_roles)
+    - owners[i]: OWNER sub_id (없으면 0)
+    - adults / children: OWNER·PARENT / CHILD 구성원 (구성원 순서 유지, 별도 CSR)
+    - data_amounts[i]: 가족 공유 데이터, member_priorities / member_limits: family_sub.priority / data_limit
+      (FIFO 가족은 priority -1)
+    """
+
+    def __init__(self):
+        self.family_ids = array('q')
+        self.owners = array('q')
+        self.offsets = array('q', [0])
+        self.members = array('q')
+        self.member_roles = array('b')
+        self.data_amounts = array('q')
+        self.member_priorities = array('b')
+        self.member_limits = array('q')
+        self.adult_offsets = array('q', [0])
+        self.adults = array('q')
+        self.child_offsets = array('q', [0])
+        self.children = array('q')
+
+    def __len__(self) -> int:
+        return len(self.family_ids)
+
+    def add(
+        self,
+        family_id: int,
+        sub_ids: Sequence[int],
+        roles: Sequence[FamilyRole],
+        priorities: Sequence[int],
+        data_amount: int,
+        data_limits: Sequence[int]
+    ):
+        owner = 0
+        for sub_id, role in zip(sub_ids, roles):
+            if role == FamilyRole.OWNER and not owner:
+                owner = sub_id
+            if role == FamilyRole.CHILD:
+                self.children.append(sub_id)
+            elif role in (FamilyRole.OWNER, FamilyRole.PARENT):
+                self.adults.append(sub_id)
+
+        self.family_ids.append(family_id)
+        self.owners.append(owner)
+        self.members.extend(sub_ids)
+        self.member_roles.extend(_ROLE_CODES[role] for role in roles)
+        self.data_amounts.append(data_amount)
+        self.member_priorities.extend(priorities)
+        self.member_limits.extend(data_limits)
+        self.offsets.append(len(self.members))
+        self.adult_offsets.append(len(self.adults))
+        self.child_offsets.append(len(self.children))
+
+    def size(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def member_list(self, i: int) -> List[Tuple[int, FamilyRole]]:
+        """[(sub_id, role), ...] (구성원 순서)"""
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return [
+            (sub_id, _ROLES[code - 1])
+            for sub_id, code in zip(self.members[start:end], self.member_roles[start:end])
+        ]
+
+    def is_priority(self, i: int) -> bool:
+        return self.member_priorities[self.offsets[i]] != -1
+
+    def adult_sub_ids(self, i: int) -> Sequence[int]:
+        return self.adults[self.adult_offsets[i]:self.adult_offsets[i + 1]]
+
+    def child_sub_ids(self, i: int) -> Sequence[int]:
+        return self.children[self.child_offsets[i]:self.child_offsets[i + 1]]
+
+    def subscriptions(self) -> Iterator[Tuple[int, FamilyRole]]:
+        """가족 소속 회선 (sub_id, role) 을 가족 생성 순서대로"""
+        for sub_id, code in zip(self.members, self.member_roles):
+            yield sub_id, _ROLES[code - 1]
+
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            "family_ids": self.family_ids,
+            "owners": self.owners,
+            "offsets": self.offsets,
+            "members": self.members,
+            "member_roles": self.member_roles,
+            "data_amounts": self.data_amounts,
+            "member_priorities": self.member_priorities,
+            "member_limits": self.member_limits,
+            "adult_offsets": self.adult_offsets,
+            "adults": self.adults,
+            "child_offsets": self.child_offsets,
+            "children": self.children,
+        }
+
+    def merge_state(self, state: Dict[str, Any]):
+        """다음 가족 구간의 샤드 인덱스를 이어 붙인다"""
+        for column, offsets_column in (
+            ("members", "offsets"),
+            ("adults", "adult_offsets"),
+            ("children", "child_offsets"),
+        ):
+            base = len(getattr(self, column))
+            getattr(self, offsets_column).extend(base + offset for offset in state[offsets_column][1:])
+            getattr(self, column).extend(state[column])
+
+        self.family_ids.extend(state["family_ids"])
+        self.owners.extend(state["owners"])
+        self.member_roles.extend(state["member_roles"])
+        self.data_amounts.extend(state["data_amounts"])
+        self.member_priorities.extend(state["member_priorities"])
+        self.member_limits.extend(state["member_limits"])
+
+
+class SubscriptionStore:
+
+    def __init__(self, first_sub_id: int = 1):
+        self.first_sub_id = first_sub_id
+
+        # sub_id - first_sub_id 위치의 회선 컬럼
+        self.plan_ids = array('b')
+        self.created = array('q')
+        self.roles = array('b')
+        self.name_ids = array('I')
+
+        # 이름 테이블 (같은 이름은 한 번만 보관)
+        self.names: List[str] = []
+        self.name_index: Dict[str, int] = {}
+
+        self.families = FamilyIndex()
+        self.non_family = array('q')
+
+    def __len__(self) -> int:
+        return len(self.plan_ids)
+
+    @property
+    def next_sub_id(self) -> int:
+        return self.first_sub_id + len(self.plan_ids)
+
+    # ------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------
+
+    def _check_next(self, sub_id: int):
+        if sub_id != self.next_sub_id:
+            raise ValueError(f"sub_id must be appended in order: {sub_id} (expected {self.next_sub_id})")
+
+    def _name_id(self, name: str) -> int:
+        name_id = self.name_index.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.names.append(name)
+            self.name_index[name] = name_id
+        return name_id
+
+    def append(self, sub_id: int, plan_id: int, created: int, name: str):
+        """created는 epoch 초"""
+        self._check_next(sub_id)
+        self.plan_ids.append(plan_id)
+        self.created.append(created)
+        self.roles.append(0)
+        self.name_ids.append(self._name_id(name))
+
+    def extend(self, first_sub_id: int, plan_ids: Sequence[int], created_epochs: Sequence[int], names: Sequence[str]):
+        """블록 단위 추가 (numpy 엔진, created는 epoch 초)"""
+        self._check_next(first_sub_id)
+        self.plan_ids.extend(plan_ids)
+        self.created.extend(created_epochs)
+        self.roles.extend(bytes(len(names)))
+        self.name_ids.extend(self._name_id(name) for name in names)
+
+    def add_family(
+        self,
+        family_id: int,
+        sub_ids: Sequence[int],
+        roles: Sequence[FamilyRole],
+        priorities: Sequence[int],
+        data_amount: int,
+        data_limits: Sequence[int]
+    ):
+        for sub_id, role in zip(sub_ids, roles):
+            self.roles[sub_id - self.first_sub_id] = _ROLE_CODES[role]
+        self.families.add(family_id, sub_ids, roles, priorities, data_amount, data_limits)
+
+    def add_non_family(self, sub_ids: Iterable[int]):
+        self.non_family.extend(sub_ids)
+
+    # ------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------
+
+    def _position(self, sub_id: int) -> Optional[int]:
+        position = sub_id - self.first_sub_id
+        if 0 <= position < len(self.plan_ids):
+            return position
+        return None
+
+    def plan(self, sub_id: int) -> Optional[Dict[str, Any]]:
+        position = self._position(sub_id)
+        return PLANS[self.plan_ids[position]] if position is not None else None
+
+    def created_at(self, sub_id: int) -> int:
+        """개통 시각 (epoch 초)"""
+        return self.created[sub_id - self.first_sub_id]
+
+    def name(self, sub_id: int) -> Optional[str]:
+        position = self._position(sub_id)
+        return self.names[self.name_ids[position]] if position is not None else None
+
+    def role(self, sub_id: int) -> Optional[FamilyRole]:
+        code = self.roles[sub_id - self.first_sub_id]
+        return _ROLES[code - 1] if code else None
+
+    def non_family_sub_ids(self) -> List[int]:
+        return self.non_family.tolist()
+
+    # ------------------------------------------------------
+    # 샤드 워커 상태 병합
+    # ------------------------------------------------------
+
+    def export_state(self) -> Dict[str, Any]:
+        return {
+            "first_sub_id": self.first_sub_id,
+            "plan_ids": self.plan_ids,
+            "created": self.created,
+            "roles": self.roles,
+            "names": self.names,
+            "name_ids": self.name_ids,
+            "families": self.families.export_state(),
+            "non_family": self.non_family,
+        }
+
+    def merge_state(self, state: Dict[str, Any]):
+        """다음 sub_id 구간의 샤드 상태를 이어 붙인다"""
+        self._check_next(state["first_sub_id"])
+        self.plan_ids.extend(state["plan_ids"])
+        self.created.extend(state["created"])
+        self.roles.extend(state["roles"])
+        name_ids = [self._name_id(name) for name in state["names"]]
+        self.name_ids.extend(name_ids[name_id] for name_id in state["name_ids"])
+        self.families.merge_state(state["families"])
+        self.non_family.extend(state["non_family"])
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta
+from typing import Dict
+
+# ======================================================
+# Timestamps (epoch seconds + cached formatter)
+# ======================================================
+#
+# 행 생성 단계는 시각을 epoch 초(int)로만 다루고 sink에도 epoch 그대로 넘긴다.
+# - 텍스트 출력(CSV / COPY csv)만 기록할 때 format_ts로 문자열을 만든다 (csv_writer.TIMESTAMP_COLUMNS)
+# - 형식: "YYYY-MM-DD HH:MM:SS" (str(datetime)과 동일, CSV / COPY 입력)
+# - 시(hour) 단위 접두어 캐시 + 분초 테이블로 조합 (값마다 datetime 객체 / strftime 없음)
+# - binary COPY / parquet은 epoch를 그대로 기록 (문자열을 거치지 않음)
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+HOUR_SECONDS = 60 * 60
+DAY_SECONDS = 24 * HOUR_SECONDS
+
+# 분초 "MM:SS" (3,600개) / "YYYY-MM-DD HH:" (등장한 시각만, 생성 기간 몇 년이면 수만 개)
+_MINUTE_SECONDS = [f"{minute:02d}:{second:02d}" for minute in range(60) for second in range(60)]
+_HOUR_PREFIX: Dict[int, str] = {}
+
+
+def to_epoch(dt: datetime) -> int:
+    return (dt - _EPOCH) // _SECOND
+
+
+def from_epoch(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def format_ts(seconds: int) -> str:
+    """epoch 초 → "YYYY-MM-DD HH:MM:SS" """
+    hour, rest = divmod(seconds, HOUR_SECONDS)
+    prefix = _HOUR_PREFIX.get(hour)
+    if prefix is None:
+        prefix = _HOUR_PREFIX[hour] = f"{from_epoch(hour * HOUR_SECONDS):%Y-%m-%d %H}:"
+    return prefix + _MINUTE_SECONDS[rest]
+
+
+def format_date(seconds: int) -> str:
+    """epoch 초 → "YYYY-MM-DD" """
+    return format_ts(seconds)[:10]
+
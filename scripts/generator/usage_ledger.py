@@ -0,0 +1,214 @@
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:  # 선택 의존성: --usage-ledger에서만 필요
+    raise ImportError("--usage-ledger 실행에는 numpy가 필요합니다 (pip install numpy)") from e
+
+from generator.constants import *
+from generator.event_simulator import (
+    USAGE_THRESHOLDS,
+    USAGE_INTENSITY_RANGE,
+    USAGE_DAILY_RANGE,
+    USAGE_ACTIVE_START,
+    USAGE_ACTIVE_SECONDS,
+)
+from generator.numpy_engine import make_np_rng
+from generator.timestamps import DAY_SECONDS, format_date
+
+# ======================================================
+# Data-usage ledger (--usage-ledger)
+# ======================================================
+#
+# 이벤트 시뮬레이션 기간 동안 회선별 일 사용량(data_usage)을 만든다.
+# - 요금제 제공량(plan_amount)을 먼저 쓰고, 부족분은 가족 공유 데이터(family_amount)에서 차감
+# - 가족 공유 데이터는 월 단위로 family_data_amount만큼 채워지고, 구성원별 family_sub.data_limit까지만 사용
+# - 같은 날 공유 데이터 요청은 FIFO 가족은 요청 시각 순, PRIORITY 가족은 priority 순으로 배분
+# - 요금제 잔여량 임계(50/30/10%/소진) 알림도 원장 사용량 기준으로 만든다
+# - 청크 회선 전체를 날짜별 배열 연산으로 처리 (가족 배분은 가족 단위 정렬 + 누적합)
+
+# 무제한 요금제의 월 사용량 기준 (임계 알림 없음)
+UNLIMITED_REFERENCE_AMOUNT = 100 * GB
+
+# 원장 행 기록 단위 (회선 묶음, write_rows 한 번에 넘기는 행 수 제한)
+LEDGER_WRITE_SUBSCRIPTIONS = 1_000
+
+_PLAN_AMOUNTS = np.zeros(max(PLANS) + 1, dtype=np.int64)
+_PLAN_DAILY = np.zeros(max(PLANS) + 1, dtype=bool)
+for _plan_id, _plan in PLANS.items():
+    _PLAN_AMOUNTS[_plan_id] = _plan["amount"]
+    _PLAN_DAILY[_plan_id] = _plan["period"] == "DAY"
+
+
+def _allocate_family_pool(
+    want: "np.ndarray",
+    key: "np.ndarray",
+    family: "np.ndarray",
+    pool: "np.ndarray"
+) -> "np.ndarray":
+    """
+    가족별 공유 데이터 배분 (요청 want를 가족 안에서 key 순으로 pool이 남는 만큼 채움)
+    - family 기준 정렬 후 가족 내 누적 요청량으로 한 번에 계산, pool은 사용량만큼 차감
+    """
+    served = np.zeros_like(want)
+    candidates = np.flatnonzero(want > 0)
+    if not candidates.size:
+        return served
+
+    candidates = candidates[np.lexsort((key[candidates], family[candidates]))]
+    families = family[candidates]
+    wanted = want[candidates]
+    before = np.cumsum(wanted) - wanted
+    group_start = np.empty(len(candidates), dtype=bool)
+    group_start[0] = True
+    group_start[1:] = families[1:] != families[:-1]
+    before -= np.maximum.accumulate(np.where(group_start, before, 0))
+
+    granted = np.clip(pool[families] - before, 0, wanted)
+    served[candidates] = granted
+    pool -= np.bincount(families, weights=granted, minlength=len(pool)).astype(np.int64)
+    return served
+
+
+def simulate_usage(chunk: Dict[str, Any], event_range: Dict[str, Any], rng: "np.random.Generator") -> Dict[str, Any]:
+    """
+    청크 회선의 일 사용량 / 임계 알림
+    - plan_amounts / family_amounts / active: (일, 회선) 배열
+    - events: 회선 위치 → [(epoch, 알림 타입, 메시지), ...]
+    """
+    plan_ids = np.asarray(chunk["plan_ids"], dtype=np.int64)
+    created = np.asarray(chunk["created"], dtype=np.int64)
+    family = np.asarray(chunk["family_local"], dtype=np.int64)
+    priorities = np.asarray(chunk["member_priorities"], dtype=np.float64)
+    member_limits = np.asarray(chunk["member_limits"], dtype=np.int64)
+    family_amounts = np.asarray(chunk["family_amounts"], dtype=np.int64)
+    family_priority = np.asarray(chunk["family_priority"], dtype=bool)
+    count = len(plan_ids)
+    days = event_range["days"]
+    end = event_range["end"]
+
+    amount = _PLAN_AMOUNTS[plan_ids]
+    daily = _PLAN_DAILY[plan_ids]
+    limited = amount > 0
+    reference = np.where(limited, amount, UNLIMITED_REFERENCE_AMOUNT).astype(np.float64)
+    # 사용량은 KB 정수로 누적 (요금제 / 공유 데이터 / data_limit 합계가 정확히 맞도록)
+    unlimited_remaining = np.iinfo(np.int64).max
+    intensity = rng.uniform(*USAGE_INTENSITY_RANGE, count)
+    is_member = family >= 0
+    family_index = np.where(is_member, family, 0)
+    priority_member = is_member & family_priority[family_index] if len(family_amounts) else is_member
+
+    plan_out = np.zeros((len(days), count), dtype=np.int64)
+    family_out = np.zeros((len(days), count), dtype=np.int64)
+    active_out = np.zeros((len(days), count), dtype=bool)
+    event_positions: List["np.ndarray"] = []
+    event_times: List["np.ndarray"] = []
+    event_kinds: List["np.ndarray"] = []
+
+    used = np.zeros(count, dtype=np.int64)
+    pool = family_amounts.copy()
+    limit_left = member_limits.copy()
+    period = None
+
+    for d, (day_start, _, month, day_of_month, month_days) in enumerate(days):
+        active = day_start + DAY_SECONDS > created
+        daily_mean = reference * intensity / np.where(daily, 1, month_days)
+
+        if month != period:
+            # 월 요금제 / 가족 공유 데이터는 월 초기화 (기간 첫날은 그 달 지난 일수만큼 요금제 사용분을 채워 둔다)
+            if period is None:
+                elapsed = np.minimum(day_of_month - 1, np.maximum(0, (day_start - created) // DAY_SECONDS))
+                used = np.rint(daily_mean * elapsed).astype(np.int64)
+            else:
+                used[:] = 0
+            pool = family_amounts.copy()
+            limit_left = member_limits.copy()
+            period = month
+        used[daily] = 0
+
+        variation = rng.uniform(*USAGE_DAILY_RANGE, count)
+        arrival = rng.random(count)
+        demand = np.where(active, np.rint(daily_mean * variation), 0).astype(np.int64)
+        remaining = np.where(limited, np.maximum(amount - used, 0), unlimited_remaining)
+        plan_used = np.minimum(demand, remaining)
+        overflow = demand - plan_used
+
+        for kind, (ratio, _, _) in enumerate(USAGE_THRESHOLDS):
+            crossing = ratio * amount
+            hit = limited & active & (used < crossing) & (used + demand >= crossing)
+            positions = np.flatnonzero(hit)
+            if not positions.size:
+                continue
+            at = day_start + USAGE_ACTIVE_START + (
+                USAGE_ACTIVE_SECONDS * (crossing[positions] - used[positions]) / demand[positions]
+            ).astype(np.int64)
+            keep = (at < end) & (at >= created[positions])
+            event_positions.append(positions[keep])
+            event_times.append(at[keep])
+            event_kinds.append(np.full(int(keep.sum()), kind))
+
+        # 공유 데이터 요청 순서: FIFO는 요금제 소진 시각(이미 소진이면 당일 첫 사용 시각), PRIORITY는 priority
+        if len(family_amounts):
+            want = np.where(is_member, np.minimum(overflow, limit_left), 0)
+            start_fraction = np.where(remaining > 0, remaining / np.where(demand > 0, demand, 1), arrival)
+            key = np.where(priority_member, priorities, start_fraction)
+            served = _allocate_family_pool(want, key, family_index, pool)
+            limit_left -= served
+        else:
+            served = np.zeros(count, dtype=np.int64)
+
+        used += plan_used
+        plan_out[d] = plan_used
+        family_out[d] = served
+        active_out[d] = active
+
+    events: Dict[int, List[Tuple[int, NotificationType, str]]] = {}
+    if event_positions:
+        positions = np.concatenate(event_positions)
+        times = np.concatenate(event_times)
+        kinds = np.concatenate(event_kinds)
+        for position, at, kind in zip(positions.tolist(), times.tolist(), kinds.tolist()):
+            _, noti_type, message = USAGE_THRESHOLDS[kind]
+            events.setdefault(position, []).append((at, noti_type, message))
+
+    return {
+        "plan_amounts": plan_out,
+        "family_amounts": family_out,
+        "active": active_out,
+        "events": events,
+    }
+
+
+def ledger_rows(
+    chunk: Dict[str, Any],
+    usage: Dict[str, Any],
+    event_range: Dict[str, Any],
+    first_id: int
+) -> Iterator[List[List[Any]]]:
+    """data_usage 행 (회선별 날짜 순), LEDGER_WRITE_SUBSCRIPTIONS 회선 단위 묶음"""
+    end = event_range["end"]
+    dates = [format_date(day_start) for day_start, _, _, _, _ in event_range["days"]]
+    closed = [min(day_start + DAY_SECONDS, end) for day_start, _, _, _, _ in event_range["days"]]
+
+    active = usage["active"].T
+    plan_amounts = usage["plan_amounts"].T
+    family_amounts = usage["family_amounts"].T
+    next_id = first_id
+
+    for block in range(0, active.shape[0], LEDGER_WRITE_SUBSCRIPTIONS):
+        positions, day_indexes = np.nonzero(active[block:block + LEDGER_WRITE_SUBSCRIPTIONS])
+        if not positions.size:
+            continue
+        positions += block
+        rows = [
+            [row_id, chunk["first_sub_id"] + position, dates[d], plan_amount, family_amount, closed[d]]
+            for row_id, position, d, plan_amount, family_amount in zip(
+                range(next_id, next_id + len(positions)),
+                positions.tolist(),
+                day_indexes.tolist(),
+                plan_amounts[positions, day_indexes].tolist(),
+                family_amounts[positions, day_indexes].tolist(),
+            )
+        ]
+        next_id += len(rows)
+        yield rows
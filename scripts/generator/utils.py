@@ -3,10 +3,13 @@ import random
 import time
 import hmac
 import hashlib
-from typing import Optional, Tuple
+import uuid
+from typing import Dict, Optional, Tuple
 from datetime import datetime, date, timedelta
 from typing import List
 from Crypto.Cipher import AES
+from Crypto.Hash import SHA256
+from Crypto.Protocol.KDF import HKDF
 from Crypto.Util.Padding import pad, unpad
 from Crypto.Random import get_random_bytes
 
@@ -19,14 +22,32 @@ from config.db_config import (
     validate_encryption_config,
 )
 from generator.constants import *
+from generator.timestamps import to_epoch
 
 # ======================================================
 # Time
 # ======================================================
 
+_NOW_ANCHOR: Optional[datetime] = None
+_NOW_EPOCH: Optional[int] = None
+
+def set_now_anchor(anchor: Optional[datetime]):
+    """실행 기준 시각 고정 (샤드 워커 간 now() 일치용)"""
+    global _NOW_ANCHOR, _NOW_EPOCH
+    _NOW_ANCHOR = anchor
+    _NOW_EPOCH = to_epoch(anchor) if anchor is not None else None
+
 def now() -> datetime:
+    if _NOW_ANCHOR is not None:
+        return _NOW_ANCHOR
     return datetime.now().replace(microsecond=0)
 
+def now_epoch() -> int:
+    """now()의 epoch 초 (기준 시각이 고정되면 캐시된 값)"""
+    if _NOW_EPOCH is not None:
+        return _NOW_EPOCH
+    return to_epoch(now())
+
 def elapsed_hms(start_time: float) -> str:
     total_seconds = int(time.time() - start_time)
 
@@ -45,6 +66,8 @@ _kms_client = None
 GCM_PREFIX = "gcm:"
 GCM_NONCE_SIZE = 12
 GCM_TAG_SIZE = 16
+# derive_data_key HKDF salt (KEK를 다른 용도 키와 분리)
+DEK_DERIVATION_SALT = b"subscription_key:dek"
 
 def _get_kms_client():
     global _kms_client
@@ -67,8 +90,9 @@ def _decrypt_with_key_cbc(cipher_text: str, key: bytes) -> bytes:
     cipher = AES.new(key, AES.MODE_CBC, iv)
     return unpad(cipher.decrypt(encrypted), AES.block_size)
 
-def _encrypt_with_key(raw_bytes: bytes, key: bytes) -> str:
-    nonce = get_random_bytes(GCM_NONCE_SIZE)
+def _encrypt_with_key(raw_bytes: bytes, key: bytes, nonce: Optional[bytes] = None) -> str:
+    if nonce is None:
+        nonce = get_random_bytes(GCM_NONCE_SIZE)
     cipher = AES.new(key, AES.MODE_GCM, nonce=nonce, mac_len=GCM_TAG_SIZE)
     encrypted, tag = cipher.encrypt_and_digest(raw_bytes)
     payload = nonce + encrypted + tag
@@ -114,9 +138,28 @@ def generate_data_key() -> Tuple[bytes, str]:
         ciphertext = resp["CiphertextBlob"]
         return plaintext, base64.b64encode(ciphertext).decode("utf-8")
 
-    secret_key = load_key("SECRET_KEY", 32)
     dek = generate_dek()
-    return dek, _encrypt_with_key(dek, secret_key)
+    return dek, _encrypt_with_key(dek, load_key("SECRET_KEY", 32))
+
+def derive_data_key(*labels) -> Tuple[bytes, str]:
+    """
+    재현 가능한 DEK (생성기 --reproducible-keys, local provider 전용)
+    - DEK와 래핑 nonce를 SECRET_KEY(KEK)에서 HKDF-SHA256으로 파생 (labels: 용도 / seed / 버킷)
+    - labels(manifest의 seed 등)만으로는 DEK를 만들 수 없다 (KEK 필요)
+    """
+    validate_encryption_config()
+    if ENCRYPTION_PROVIDER == "kms":
+        raise ValueError("재현 가능한 DEK는 ENCRYPTION_PROVIDER=local에서만 사용할 수 있습니다 (KMS는 매번 새 DEK 발급)")
+    secret_key = load_key("SECRET_KEY", 32)
+    material = HKDF(
+        secret_key,
+        32 + GCM_NONCE_SIZE,
+        salt=DEK_DERIVATION_SALT,
+        hashmod=SHA256,
+        context=":".join(str(v) for v in labels).encode('utf-8')
+    )
+    dek, nonce = material[:32], material[32:]
+    return dek, _encrypt_with_key(dek, secret_key, nonce)
 
 def wrap_dek(dek: bytes) -> str:
     validate_encryption_config()
@@ -138,8 +181,8 @@ def unwrap_dek(encrypted_dek: str, kek_key_id: Optional[str] = None) -> bytes:
         return resp["Plaintext"]
     return _decrypt_with_key(encrypted_dek, load_key("SECRET_KEY", 32))
 
-def encrypt_with_dek(plain_text: str, dek: bytes) -> str:
-    return _encrypt_with_key(plain_text.encode('utf-8'), dek)
+def encrypt_with_dek(plain_text: str, dek: bytes, nonce: Optional[bytes] = None) -> str:
+    return _encrypt_with_key(plain_text.encode('utf-8'), dek, nonce)
 
 def decrypt_with_dek(cipher_text: str, dek: bytes) -> str:
     return _decrypt_with_key(cipher_text, dek).decode('utf-8')
@@ -165,76 +208,93 @@ def generate_blind_index(plain_text: str) -> str:
 # Random data generators
 # ======================================================
 
+def derive_seed(seed: int, *labels) -> int:
+    """seed와 라벨(샤드/단계)로 독립된 하위 seed 생성"""
+    key = ":".join(str(v) for v in (seed,) + labels)
+    return int.from_bytes(hashlib.sha256(key.encode('utf-8')).digest()[:8], 'big')
+
+def make_rng(seed: int, *labels) -> random.Random:
+    """
+    단계/샤드별 독립 난수 스트림.
+    한 단계의 난수 소비량이 바뀌어도 다른 단계의 결과는 밀리지 않는다.
+    """
+    return random.Random(derive_seed(seed, *labels))
+
+def random_uuid_hex(rng=random) -> str:
+    """rng 기반 UUID4 hex (uuid.uuid4() 대체, seed 재현 가능)"""
+    return uuid.UUID(int=rng.getrandbits(128), version=4).hex
+
 def generate_seq_phone(seq: int) -> str:
     mid = seq // 10000
     last = seq % 10000
     return f"010-{mid:04d}-{last:04d}"
 
-def rand_last_name() -> str:
-    return random.choices(LAST_NAMES, weights=LAST_NAME_WEIGHTS, k=1)[0]
+def rand_last_name(rng=random) -> str:
+    return rng.choices(LAST_NAMES, weights=LAST_NAME_WEIGHTS, k=1)[0]
 
-def rand_name_with_last(last: str) -> str:
-    first = random.choice(FIRST_SYLLABLES)
-    second = random.choice(SECOND_SYLLABLES)
+def rand_name_with_last(last: str, rng=random) -> str:
+    first = rng.choice(FIRST_SYLLABLES)
+    second = rng.choice(SECOND_SYLLABLES)
 
     while second == first:
-        second = random.choice(SECOND_SYLLABLES)
+        second = rng.choice(SECOND_SYLLABLES)
 
     return last + first + second
 
-def rand_datetime_between_years(years_back: int) -> datetime:
-    cur = now()
-    start = cur - timedelta(days=years_back * 365)
-    delta = cur - start
-    return (start + timedelta(seconds=random.randint(0, int(delta.total_seconds())))).replace(microsecond=0)
+def rand_epoch_between_years(years_back: int, rng=random) -> int:
+    """최근 years_back년(365일 단위) 안의 임의 시각 (epoch 초)"""
+    span = years_back * 365 * 24 * 60 * 60
+    return now_epoch() - span + rng.randint(0, span)
+
+def rand_epoch_between(start: int, end: int, rng=random) -> int:
+    """[start, end] 임의 시각 (epoch 초)"""
+    return start + rng.randint(0, end - start)
 
-def rand_datetime_between(start_dt, end_dt):
-    delta = end_dt - start_dt
-    seconds = random.randint(0, int(delta.total_seconds()))
-    return (start_dt + timedelta(seconds=seconds)).replace(microsecond=0)
+# 날짜 서수(date.toordinal) → "YYMMDD" (생년월일 구간은 수만 일이라 전부 캐시)
+_YYMMDD: Dict[int, str] = {}
 
-def birth_by_age_range(min_age: int, max_age: int) -> str:
+def birth_by_age_range(min_age: int, max_age: int, rng=random) -> str:
     """YYMMDD"""
-    today = date.today()
-    start = today - timedelta(days=max_age * 365)
-    end = today - timedelta(days=min_age * 365)
-    days = (end - start).days
-    d = start + timedelta(days=random.randint(0, days))
-    return d.strftime("%y%m%d")
-
-def birth_by_role(role: FamilyRole) -> str:
+    start = now().toordinal() - max_age * 365
+    ordinal = start + rng.randint(0, (max_age - min_age) * 365)
+    birth = _YYMMDD.get(ordinal)
+    if birth is None:
+        birth = _YYMMDD[ordinal] = date.fromordinal(ordinal).strftime("%y%m%d")
+    return birth
+
+def birth_by_role(role: FamilyRole, rng=random) -> str:
     if role in (FamilyRole.OWNER, FamilyRole.PARENT):
-        return birth_by_age_range(30, 55)
-    return birth_by_age_range(5, 25)
+        return birth_by_age_range(30, 55, rng)
+    return birth_by_age_range(5, 25, rng)
 
-def pseudo_uuid_hex(member_id: int) -> str:
-    r = random.getrandbits(64)
+def pseudo_uuid_hex(member_id: int, rng=random) -> str:
+    r = rng.getrandbits(64)
     return f"{member_id:08x}{r:016x}"
 
 # ======================================================
 # Family role builders
 # ======================================================
 
-def decide_parent_count(family_size: int) -> int:
+def decide_parent_count(family_size: int, rng=random) -> int:
     if family_size == 2:
-        return 1 if random.random() < 0.75 else 2
-    return 1 if random.random() < 0.35 else 2 
+        return 1 if rng.random() < 0.75 else 2
+    return 1 if rng.random() < 0.35 else 2 
 
-def build_roles(family_size: int) -> List[FamilyRole]:
-    parent_cnt = min(decide_parent_count(family_size), family_size)
+def build_roles(family_size: int, rng=random) -> List[FamilyRole]:
+    parent_cnt = min(decide_parent_count(family_size, rng), family_size)
 
     roles = [FamilyRole.PARENT] * parent_cnt + \
             [FamilyRole.CHILD] * (family_size - parent_cnt)
 
-    random.shuffle(roles)
+    rng.shuffle(roles)
 
     parent_idxs = [i for i, r in enumerate(roles) if r == FamilyRole.PARENT]
-    owner_idx = random.choice(parent_idxs)
+    owner_idx = rng.choice(parent_idxs)
     roles[owner_idx] = FamilyRole.OWNER
 
     return roles
 
-def choose_last_name_for_role(role: FamilyRole, family_last: str, is_other_parent: bool) -> str:
+def choose_last_name_for_role(role: FamilyRole, family_last: str, is_other_parent: bool, rng=random) -> str:
     """
     - OWNER/CHILD: 무조건 family_last
     - PARENT(다른 부모로 선택된 1명): 확률적으로 성씨 다르게
@@ -243,9 +303,9 @@ def choose_last_name_for_role(role: FamilyRole, family_last: str, is_other_paren
         return family_last
 
     if is_other_parent:
-        if random.random() < MOTHER_SAME_LASTNAME_RATE:
+        if rng.random() < MOTHER_SAME_LASTNAME_RATE:
             return family_last
-        return random.choice(LAST_NAMES)
+        return rng.choice(LAST_NAMES)
 
     return family_last
 
@@ -8,7 +8,11 @@ load_dotenv(Path(__file__).resolve().parents[1] / ".env")
 통합 실행 스크립트
 1. 더미 데이터 생성 (CSV)
 2. PostgreSQL DB에 업로드
+
+--output copy: CSV를 거치지 않고 생성과 동시에 테이블별 COPY 스트림으로 적재
+--output parquet: output/parquet/ 분석용 내보내기만 생성 (DB 적재 생략)
 """
+import argparse
 import sys
 import os
 import time
@@ -16,26 +20,72 @@ import time
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(BASE_DIR)
 
-from generator.generator_master import BulkDataGenerator
-from db_loader import main as load_db
+from generator.generator_master import add_generator_arguments, generator_from_args
+from db_loader import (
+    main as load_db,
+    add_loader_arguments,
+    get_connection,
+    init_tables,
+    drop_foreign_keys,
+    create_indexes,
+    restore_foreign_keys,
+    reset_sequences,
+    verify_data,
+    count_tables,
+)
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def run_generator():
+def run_generator(args):
     print("\n=== STEP 1: 더미 데이터 생성 ===\n")
-    BulkDataGenerator().generate()
+    generator_from_args(args).generate()
 
 
-def run_loader():
+def run_loader(args):
     print("\n=== STEP 2: DB 로딩 ===\n")
-    load_db()
+    load_db(jobs=args.load_jobs, chunk_size_mb=args.chunk_size_mb, deep_verify=args.deep_verify)
+
+
+def run_stream(args):
+    print("\n=== STEP 1+2: 더미 데이터 생성 → DB COPY 스트리밍 ===\n")
+
+    conn = get_connection()
+    try:
+        # --append: 기존 데이터를 유지하고 추가분만 스트리밍
+        if not args.append:
+            init_tables(conn)
+        base_counts = count_tables(conn) if args.append and args.deep_verify else None
+        foreign_keys = drop_foreign_keys(conn)
+
+        generator = generator_from_args(args)
+        generator.generate()
+
+        if not args.append:
+            create_indexes(conn)
+        restore_foreign_keys(conn, foreign_keys)
+        reset_sequences(conn)
+        # 스트림별 COPY 건수는 close()에서 생성 건수와 대조됨 → 생성 건수로 검증 출력
+        verify_data(conn, generator.table_row_counts(), args.deep_verify, base_counts)
+    finally:
+        conn.close()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="더미 데이터 생성 + DB 적재")
+    add_generator_arguments(parser)
+    add_loader_arguments(parser)
+    args = parser.parse_args()
+
     start = time.time()
 
-    run_generator()
-    run_loader()
+    if args.output == "copy":
+        run_stream(args)
+    elif args.output == "parquet":
+        run_generator(args)
+        print("\n[INFO] parquet 출력은 분석용 내보내기입니다: DB 적재를 생략합니다.")
+    else:
+        run_generator(args)
+        run_loader(args)
 
     print(f"\n✅ 전체 완료 (소요시간: {int(time.time()-start)}초)")
\ No newline at end of file
@@ -18,7 +18,7 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from config.db_config import DB_CONFIG
-from generator.constants import NotificationCategory
+from generator.constants import NotificationCategory, TEAM_PHONE_RANGE
 from generator.utils import (
     encrypt_with_dek,
     generate_blind_index,
@@ -108,8 +108,11 @@ def generate_team_phone(
     avoid_phone_hash: Optional[str] = None,
 ) -> str:
     # 테스트용 임시 대역(9xxx) 대신 일반 번호 대역(1xxx~)을 순차 사용한다.
-    seq = 10_000_000 + max(0, int(offset))
+    # TEAM_PHONE_RANGE는 더미 생성기가 건너뛰는 전용 대역이라 더미 회선과 겹치지 않는다.
+    seq = TEAM_PHONE_RANGE[0] + max(0, int(offset))
     while True:
+        if seq >= TEAM_PHONE_RANGE[1]:
+            raise RuntimeError(f"team 전화번호 대역을 모두 사용했습니다: {TEAM_PHONE_RANGE}")
         middle = (seq // 10000) % 10000
         tail = seq % 10000
         phone = f"010-{middle:04d}-{tail:04d}"
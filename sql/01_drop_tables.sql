@@ -3,6 +3,7 @@ DROP TABLE IF EXISTS family_remove_schedule CASCADE;
 DROP TABLE IF EXISTS policy_sub CASCADE;
 DROP TABLE IF EXISTS blocked_service_sub CASCADE;
 DROP TABLE IF EXISTS present_data CASCADE;
+DROP TABLE IF EXISTS data_usage CASCADE;
 DROP TABLE IF EXISTS notification_allow CASCADE;
 DROP TABLE IF EXISTS notification CASCADE;
 DROP TABLE IF EXISTS family_apply CASCADE;
@@ -205,3 +205,13 @@ CREATE TABLE present_data (
     created_time TIMESTAMP NOT NULL DEFAULT now(),
     PRIMARY KEY ("present_data_id")
 );
+
+CREATE TABLE data_usage (
+    data_usage_id BIGSERIAL NOT NULL,
+    sub_id BIGINT NOT NULL REFERENCES subscription(sub_id),
+    usage_date DATE NOT NULL,
+    plan_amount BIGINT NOT NULL,
+    family_amount BIGINT NOT NULL,
+    created_time TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY ("data_usage_id")
+);